@@ -3,11 +3,15 @@ Base Agent class - Abstract base for all agent implementations
 """
 
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
+import asyncio
 import subprocess
 import logging
 
+from ..core.logs import read_log_tail
+
 
 @dataclass
 class AgentProcess:
@@ -37,6 +41,9 @@ class BaseAgent(ABC):
         self.instance_id = instance_id
         self.config = config or {}
         self.process: Optional[subprocess.Popen] = None
+        # File the agent's stdout/stderr go to (see AgentLogs.log_path).
+        log_path = self.config.get("log_path")
+        self.log_path: Optional[Path] = Path(log_path) if log_path else None
         self.logger = logging.getLogger(f"{self.__class__.__name__}.{instance_id}")
     
     @abstractmethod
@@ -122,9 +129,11 @@ class BaseAgent(ABC):
             return None
     
     async def get_logs(self, lines: int = 100) -> str:
-        """Get recent logs from the agent"""
-        # TODO: Implement log retrieval
-        return f"Logs for {self.get_agent_type()} instance {self.instance_id}"
+        """Get the last ``lines`` lines of the agent's log file"""
+        if self.log_path is None:
+            return ""
+        tail = await asyncio.to_thread(read_log_tail, self.log_path, lines)
+        return "\n".join(tail)
     
     def get_config(self) -> Dict[str, Any]:
         """Get agent configuration"""
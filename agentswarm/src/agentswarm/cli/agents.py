@@ -0,0 +1,102 @@
+"""Agent-level inventory commands."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import click
+from rich.table import Table
+
+from ..core.state import StateBackend
+from .common import _get_state_store, console
+
+
+@click.group("agents")
+@click.pass_context
+def agents_group(ctx: click.Context) -> None:
+    """Agent-level operations designed for automation-friendly use."""
+
+
+@agents_group.command("list")
+@click.option("--deployment", "deployment_id", help="Target deployment id")
+@click.option(
+    "--format",
+    "output_format",
+    default="table",
+    type=click.Choice(["table", "json"]),
+    help="Render agent inventory as a table or JSON",
+)
+@click.pass_context
+def list_agents(
+    ctx: click.Context,
+    deployment_id: Optional[str],
+    output_format: str,
+) -> None:
+    state_store: StateBackend = _get_state_store(ctx)
+
+    deployment: Optional[dict[str, Any]]
+    if deployment_id:
+        deployment = state_store.get_deployment(deployment_id)
+        if not deployment:
+            console.print(
+                f"Deployment '{deployment_id}' not found in state store.",
+                style="red",
+            )
+            return
+    else:
+        deployment = state_store.latest_deployment()
+        if not deployment:
+            console.print(
+                "No deployments recorded. Run `agentswarm deploy` first.",
+                style="yellow",
+            )
+            return
+        deployment_id = deployment.get("deployment_id")
+
+    agents_payload: list[dict[str, Any]] = []
+    pools = [deployment.get("agents", {}), deployment.get("standby", {})]
+    for agent_type, processes in (item for pool in pools for item in pool.items()):
+        for proc in processes:
+            agents_payload.append(
+                {
+                    "agent_type": agent_type,
+                    "instance_id": proc.get("instance_id"),
+                    "pid": proc.get("pid"),
+                    "status": proc.get("status", "unknown"),
+                    "cpus": proc.get("cpus"),
+                    "command": proc.get("command"),
+                }
+            )
+
+    if output_format == "json":
+        console.print_json(
+            data={
+                "deployment_id": deployment_id,
+                "agents": agents_payload,
+            }
+        )
+        return
+
+    table = Table(title=f"Agents in Deployment {deployment_id}")
+    table.add_column("Agent Type", style="cyan")
+    table.add_column("Instance", justify="right")
+    table.add_column("PID", justify="right")
+    table.add_column("Status", style="green")
+    table.add_column("CPUs", justify="right")
+    table.add_column("Command", overflow="fold")
+
+    if not agents_payload:
+        console.print("No agents recorded for this deployment.", style="yellow")
+        return
+
+    for record in agents_payload:
+        table.add_row(
+            record["agent_type"],
+            str(record.get("instance_id", "-")),
+            str(record.get("pid", "-")),
+            record.get("status", "unknown"),
+            record.get("cpus") or "-",
+            record.get("command", ""),
+        )
+
+    console.print(table)
@@ -0,0 +1,39 @@
+"""Shared helpers for the AgentSwarm CLI command modules."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+import click
+from rich.console import Console
+
+if TYPE_CHECKING:
+    from ..core.daemon import DaemonClient
+    from ..core.state import StateBackend
+
+
+console = Console()
+
+DEFAULT_CONFIG_FILENAME = "agentswarm.yaml"
+
+
+def _get_state_store(ctx: click.Context) -> StateBackend:
+    """Open the project's state store the first time a command needs it."""
+
+    if "state_store" not in ctx.obj:
+        from ..core.state import STATE_DIRECTORY_NAME, open_state_store
+
+        ctx.obj["state_store"] = open_state_store(ctx.obj["project"] / STATE_DIRECTORY_NAME)
+    return ctx.obj["state_store"]
+
+
+def _get_daemon(ctx: click.Context) -> Optional[DaemonClient]:
+    """Return a client for a running daemon, or None to work in-process."""
+
+    if "daemon" not in ctx.obj:
+        from ..core.daemon import DaemonClient
+
+        ctx.obj["daemon"] = (
+            None if ctx.obj.get("no_daemon") else DaemonClient.for_project(ctx.obj["project"])
+        )
+    return ctx.obj["daemon"]
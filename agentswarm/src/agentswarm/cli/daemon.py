@@ -0,0 +1,72 @@
+"""Commands that run or control the orchestrator daemon."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import click
+
+from ..core.daemon import DaemonClient, OrchestratorDaemon
+from ..core.orchestrator import AgentOrchestrator
+from ..core.state import StateBackend
+from .common import _get_state_store, console
+
+
+@click.group("daemon")
+def daemon_group() -> None:
+    """Run or control the long-running orchestrator daemon"""
+
+
+@daemon_group.command("start")
+@click.option("--no-autoscale", is_flag=True, help="Ignore autoscale policies in agent configs")
+@click.option("--no-watchdog", is_flag=True, help="Do not enforce timeouts and RSS growth budgets")
+@click.pass_context
+def daemon_start(ctx: click.Context, no_autoscale: bool, no_watchdog: bool) -> None:
+    """Run the daemon in the foreground (use a service manager to background it)"""
+
+    project_path: Path = ctx.obj["project"]
+    state_store: StateBackend = _get_state_store(ctx)
+
+    async def serve() -> None:
+        orchestrator = AgentOrchestrator(project_root=project_path, state_store=state_store)
+        daemon = OrchestratorDaemon(
+            orchestrator, autoscale=not no_autoscale, watchdog=not no_watchdog
+        )
+        await daemon.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except Exception as exc:  # noqa: BLE001 - CLI entry point
+        console.print(f"Daemon failed: {exc}", style="red")
+        raise SystemExit(1)
+
+
+@daemon_group.command("stop")
+@click.pass_context
+def daemon_stop(ctx: click.Context) -> None:
+    """Stop the running daemon; agent processes keep running"""
+
+    client = DaemonClient.for_project(ctx.obj["project"])
+    if client is None:
+        console.print("No daemon is running for this project.", style="yellow")
+        return
+    client.call("stop")
+    console.print("Daemon stopping.", style="green")
+
+
+@daemon_group.command("status")
+@click.pass_context
+def daemon_status(ctx: click.Context) -> None:
+    """Show whether a daemon is serving this project"""
+
+    client = DaemonClient.for_project(ctx.obj["project"])
+    if client is None:
+        console.print("No daemon is running for this project.", style="yellow")
+        return
+    info = client.call("ping")
+    console.print(
+        f"Daemon running (pid {info['pid']}) on {client.socket_path}"
+        f" with {info['deployments']} deployment(s)",
+        style="green",
+    )
@@ -0,0 +1,40 @@
+"""Commands that inspect or convert the deployment state store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import click
+
+from ..core.state import STATE_DIRECTORY_NAME, SQLITE_FILE_NAME, migrate_to_sqlite
+from .common import _get_daemon, console
+
+
+@click.group("state")
+def state_group() -> None:
+    """Inspect or convert the deployment state store"""
+
+
+@state_group.command("migrate")
+@click.pass_context
+def state_migrate(ctx: click.Context) -> None:
+    """Move JSON state (state.json and its journal) into SQLite"""
+
+    project_path: Path = ctx.obj["project"]
+    state_dir = project_path / STATE_DIRECTORY_NAME
+    if (state_dir / SQLITE_FILE_NAME).exists():
+        console.print("State is already stored in SQLite.", style="yellow")
+        return
+    if _get_daemon(ctx) is not None:
+        console.print(
+            "Stop the daemon before migrating; it keeps writing to the JSON journal.",
+            style="red",
+        )
+        raise SystemExit(1)
+
+    store = migrate_to_sqlite(state_dir)
+    count = len(store.deployment_summaries())
+    store.close()
+    console.print(
+        f"Migrated {count} deployments to {state_dir / SQLITE_FILE_NAME}", style="green"
+    )
@@ -0,0 +1,730 @@
+"""Deployment commands: init, deploy, apply, monitor, scale, restart, health, status, config."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import click
+from rich.panel import Panel
+from rich.table import Table
+from rich.live import Live
+
+import psutil
+
+from ..core.config import (
+    SwarmConfig,
+    create_default_config,
+    create_example_config,
+    has_instance_budgets,
+    load_config_data,
+)
+from ..core.daemon import serialize_pool_health
+from ..core.logs import read_log_tail
+from ..core.orchestrator import AgentOrchestrator
+from ..core.resources import read_cgroup_stats
+from ..core.state import STATE_DIRECTORY_NAME, StateBackend, open_state_store, thaw
+from .common import DEFAULT_CONFIG_FILENAME, _get_daemon, _get_state_store, console
+
+
+def _load_config(
+    *,
+    instances: Optional[str],
+    config_file: Optional[Path],
+    task: Optional[str],
+    project_path: Path,
+) -> SwarmConfig:
+    state_dir = project_path / STATE_DIRECTORY_NAME
+    if config_file:
+        config = SwarmConfig.from_file(config_file, state_dir=state_dir)
+    else:
+        default_path = project_path / DEFAULT_CONFIG_FILENAME
+        if default_path.exists():
+            config = SwarmConfig.from_file(default_path, state_dir=state_dir)
+        elif instances:
+            config = SwarmConfig.from_instances(instances, task=task)
+        else:
+            config = create_default_config()
+
+    if instances:
+        overrides = SwarmConfig.from_instances(instances, task=task).to_dict()
+        config = config.merge(overrides)
+
+    if task:
+        merged = config.to_dict()
+        for agent_cfg in merged["agents"].values():
+            agent_cfg.setdefault("tasks", [])
+            if task not in agent_cfg["tasks"]:
+                agent_cfg["tasks"].append(task)
+        config = SwarmConfig(
+            agents=merged["agents"],
+            deployment=merged.get("deployment", {}),
+            metadata=merged.get("metadata", {}),
+        )
+
+    return config
+
+
+@click.command()
+@click.argument("project_path", type=click.Path(path_type=Path))
+@click.option("--agents", default="codex:1,claude:1", help="Agent blueprint (e.g. codex:3,claude:2)")
+@click.option(
+    "--config",
+    "config_template",
+    type=click.Path(path_type=Path, exists=True, dir_okay=False),
+    help="Custom configuration template to seed the project",
+)
+@click.option("--force", is_flag=True, help="Overwrite existing configuration files")
+def init(project_path: Path, agents: str, config_template: Optional[Path], force: bool) -> None:
+    """Initialize a new AgentSwarm project"""
+
+    project_root = project_path.resolve()
+    project_root.mkdir(parents=True, exist_ok=True)
+
+    config_path = project_root / DEFAULT_CONFIG_FILENAME
+    if config_path.exists() and not force:
+        console.print(
+            Panel.fit(
+                f"Configuration already exists at {config_path}. Use --force to overwrite.",
+                title="Init Skipped",
+                style="yellow",
+            )
+        )
+        return
+
+    if config_template:
+        config = SwarmConfig.from_file(config_template)
+    else:
+        config = SwarmConfig.from_instances(agents)
+
+    config.to_yaml(config_path)
+
+    docs_dir = project_root / "docs"
+    docs_dir.mkdir(exist_ok=True)
+    example_path = docs_dir / "agentswarm-example.yaml"
+    example_path.write_text(create_example_config(), encoding="utf-8")
+
+    open_state_store(project_root / STATE_DIRECTORY_NAME)  # Ensure state directory exists
+
+    console.print(
+        Panel.fit(
+            f"Project initialized at {project_root}\nConfiguration: {config_path}",
+            title="AgentSwarm Ready",
+            style="green",
+        )
+    )
+
+
+@click.command()
+@click.option("--instances", help="Agent instances (e.g. codex:3,claude:2)")
+@click.option("--config", "config_file", type=click.Path(path_type=Path, exists=True))
+@click.option("--task", help="Task description for agents")
+@click.option("--dry-run", is_flag=True, help="Show deployment plan without executing")
+@click.option(
+    "--output",
+    "output_format",
+    default="table",
+    type=click.Choice(["table", "json"]),
+    help="Render deployment results as a table or JSON",
+)
+@click.pass_context
+def deploy(
+    ctx: click.Context,
+    instances: Optional[str],
+    config_file: Optional[Path],
+    task: Optional[str],
+    dry_run: bool,
+    output_format: str,
+) -> None:
+    """Deploy agent swarm with specified configuration"""
+
+    project_path: Path = ctx.obj["project"]
+    state_store: StateBackend = _get_state_store(ctx)
+
+    config = _load_config(
+        instances=instances,
+        config_file=config_file,
+        task=task,
+        project_path=project_path,
+    )
+
+    if output_format == "table":
+        console.print(Panel.fit("Preparing deployment...", style="cyan"))
+
+    if dry_run:
+        if output_format == "json":
+            console.print_json(data={"plan": _build_plan_snapshot(config)})
+        else:
+            _render_deployment_plan(config)
+        return
+
+    client = _get_daemon(ctx)
+    if client is not None:
+        payload = client.call("deploy", timeout=None, config=config.to_dict())
+    else:
+        if output_format == "table":
+            _warn_unenforced_budgets(config.to_dict())
+        orchestrator = AgentOrchestrator(project_root=project_path, state_store=state_store)
+        deployment = asyncio.run(orchestrator.deploy_swarm(config))
+        payload = _deployment_to_dict(deployment, state_store)
+
+    if output_format == "json":
+        console.print_json(data=payload)
+    else:
+        _render_deployment_summary(payload)
+
+
+def _warn_unenforced_budgets(config: Dict[str, Any]) -> None:
+    # Only the daemon runs the watchdog; in-process commands exit right away.
+    if has_instance_budgets(config):
+        console.print(
+            "resources.timeout and resources.rss_growth are only enforced while"
+            " the daemon runs (`agentswarm daemon start`).",
+            style="yellow",
+        )
+
+
+def _render_deployment_plan(config: SwarmConfig) -> None:
+    table = Table(title="Deployment Plan")
+    table.add_column("Agent Type")
+    table.add_column("Instances", justify="right")
+    table.add_column("Tasks")
+
+    for agent_type, agent_config in config.iter_agents():
+        instances = str(agent_config.get("instances", 1))
+        tasks = ", ".join(agent_config.get("tasks", [])) or "(none)"
+        table.add_row(agent_type, instances, tasks)
+
+    console.print(table)
+
+
+def _build_plan_snapshot(config: SwarmConfig) -> list[dict[str, Any]]:
+    plan: list[dict[str, Any]] = []
+    for agent_type, agent_config in config.iter_agents():
+        plan.append(
+            {
+                "agent_type": agent_type,
+                "instances": agent_config.get("instances", 1),
+                "tasks": agent_config.get("tasks", []),
+                "metadata": {k: v for k, v in agent_config.items() if k not in {"instances", "tasks"}},
+            }
+        )
+    return plan
+
+
+def _render_deployment_summary(deployment: dict[str, Any]) -> None:
+    table = Table(title=f"Deployment {deployment.get('deployment_id', 'unknown')}")
+    table.add_column("Agent Type")
+    table.add_column("Instances", justify="right")
+    table.add_column("PIDs")
+
+    for agent_type, processes in deployment.get("agents", {}).items():
+        pids = ", ".join(str(proc.get("pid")) for proc in processes)
+        table.add_row(agent_type, str(len(processes)), pids)
+
+    console.print(table)
+
+
+def _deployment_to_dict(
+    deployment: Any,
+    state_store: StateBackend,
+) -> dict[str, Any]:
+    stored = state_store.get_deployment(deployment.deployment_id)
+    if stored:
+        return thaw(stored)
+
+    agents: dict[str, list[dict[str, Any]]] = {}
+    for agent_type, processes in deployment.agents.items():
+        agents[agent_type] = [
+            {
+                "pid": proc.pid,
+                "instance_id": proc.instance_id,
+                "status": proc.status,
+                "command": proc.command,
+            }
+            for proc in processes
+        ]
+
+    return {
+        "deployment_id": deployment.deployment_id,
+        "start_time": getattr(deployment, "start_time", ""),
+        "agents": agents,
+        "config": deployment.config.to_dict() if hasattr(deployment.config, "to_dict") else {},
+    }
+
+
+@click.command()
+@click.option("--config", "config_file", type=click.Path(path_type=Path, exists=True))
+@click.option("--deployment", "deployment_id", help="Target deployment id")
+@click.option("--prune", is_flag=True, help="Stop pools that are no longer in the config")
+@click.option("--dry-run", is_flag=True, help="Show the changes without applying them")
+@click.option(
+    "--output",
+    "output_format",
+    default="table",
+    type=click.Choice(["table", "json"]),
+    help="Render the change plan as a table or JSON",
+)
+@click.pass_context
+def apply(
+    ctx: click.Context,
+    config_file: Optional[Path],
+    deployment_id: Optional[str],
+    prune: bool,
+    dry_run: bool,
+    output_format: str,
+) -> None:
+    """Apply config changes to a running deployment in place"""
+
+    project_path: Path = ctx.obj["project"]
+    config_path = config_file or project_path / DEFAULT_CONFIG_FILENAME
+    if not config_path.exists():
+        console.print(
+            f"Configuration file not found at {config_path}. Run `agentswarm init` first.",
+            style="red",
+        )
+        raise SystemExit(1)
+
+    try:
+        # The file as written: defaults must not reset deployment overrides.
+        config = load_config_data(config_path)
+        client = _get_daemon(ctx)
+        if client is not None:
+            plan = client.call(
+                "apply",
+                timeout=None,
+                config=config,
+                deployment_id=deployment_id,
+                prune=prune,
+                dry_run=dry_run,
+            )
+        else:
+            if output_format == "table" and not dry_run:
+                _warn_unenforced_budgets(config)
+            orchestrator = AgentOrchestrator(
+                project_root=project_path, state_store=_get_state_store(ctx)
+            )
+
+            async def apply_and_settle() -> Dict[str, Any]:
+                result = await orchestrator.apply_config(
+                    config, deployment_id=deployment_id, prune=prune, dry_run=dry_run
+                )
+                # Let standby refills finish before this process exits.
+                await orchestrator.settle()
+                return result.to_dict()
+
+            plan = asyncio.run(apply_and_settle())
+    except Exception as exc:  # noqa: BLE001 - surface to CLI
+        console.print(f"Apply failed: {exc}", style="red")
+        raise SystemExit(1)
+
+    if output_format == "json":
+        console.print_json(data=plan | {"applied": not dry_run and plan["changed"]})
+        return
+    _render_apply_plan(plan, dry_run=dry_run)
+
+
+def _render_apply_plan(plan: Dict[str, Any], *, dry_run: bool) -> None:
+    table = Table(title=f"Apply to Deployment {plan['deployment_id']}")
+    table.add_column("Agent Type")
+    table.add_column("Action")
+    table.add_column("Instances", justify="right")
+    table.add_column("Roll")
+    table.add_column("Reasons")
+
+    for change in plan["changes"]:
+        instances = str(change["current"])
+        if change["desired"] != change["current"] or change["action"] == "remove":
+            instances += f" -> {change['desired']}"
+        table.add_row(
+            change["agent_type"],
+            change["action"],
+            instances,
+            "yes" if change["roll"] else "-",
+            ", ".join(change["reasons"]) or "-",
+        )
+    console.print(table)
+
+    if not plan["changed"]:
+        console.print("Deployment already matches the configuration.", style="green")
+    elif dry_run:
+        console.print("Dry run: no changes applied.", style="yellow")
+    else:
+        console.print("Configuration applied.", style="green")
+
+
+@click.command()
+@click.option("--logs", is_flag=True, help="Show recent agent output")
+@click.option("--lines", default=20, show_default=True, help="Log lines per instance")
+@click.option("--dashboard", is_flag=True, help="Launch web dashboard")
+@click.option("--metrics", is_flag=True, help="Show performance metrics")
+@click.pass_context
+def monitor(ctx: click.Context, logs: bool, lines: int, dashboard: bool, metrics: bool) -> None:
+    """Monitor running agent swarm"""
+
+    store: StateBackend = _get_state_store(ctx)
+    latest = store.latest_deployment()
+    if not latest:
+        console.print("No deployments recorded. Run `agentswarm deploy` first.", style="yellow")
+        return
+
+    deployment_id = latest["deployment_id"]
+    def render_snapshot() -> Table:
+        include_metrics = metrics or dashboard
+        return _build_status_table(latest, include_metrics=include_metrics)
+
+    if dashboard:
+        console.print("Starting live dashboard. Press Ctrl+C to exit.", style="cyan")
+        try:
+            with Live(render_snapshot(), refresh_per_second=1) as live:
+                while True:
+                    latest_refresh = store.latest_deployment()
+                    if latest_refresh:
+                        live.update(
+                            _build_status_table(
+                                latest_refresh,
+                                include_metrics=metrics or dashboard,
+                            )
+                        )
+                    time.sleep(1)
+        except KeyboardInterrupt:
+            console.print("Dashboard stopped", style="yellow")
+            return
+    else:
+        console.print(render_snapshot())
+
+    if logs:
+        _render_log_tails(latest, lines)
+
+    if metrics and not dashboard:
+        console.print("Metrics summary displayed above.", style="cyan")
+
+
+@click.command()
+@click.argument("agent_type")
+@click.argument("delta", type=int)
+@click.option("--deployment", "deployment_id", help="Target deployment id")
+@click.pass_context
+def scale(ctx: click.Context, agent_type: str, delta: int, deployment_id: Optional[str]) -> None:
+    """Scale agent instances up or down"""
+
+    project_path: Path = ctx.obj["project"]
+    state_store: StateBackend = _get_state_store(ctx)
+
+    async def scale_and_settle() -> None:
+        orchestrator = AgentOrchestrator(project_root=project_path, state_store=state_store)
+        await orchestrator.scale_agents(agent_type, delta, deployment_id=deployment_id)
+        # Let promoted standbys be replaced before this process exits.
+        await orchestrator.settle()
+
+    try:
+        client = _get_daemon(ctx)
+        if client is not None:
+            # The daemon refills standbys in the background on its own loop.
+            client.call(
+                "scale",
+                timeout=None,
+                agent_type=agent_type,
+                delta=delta,
+                deployment_id=deployment_id,
+            )
+        else:
+            asyncio.run(scale_and_settle())
+    except Exception as exc:  # noqa: BLE001 - surface to CLI
+        console.print(f"Scaling failed: {exc}", style="red")
+        return
+
+    console.print(f"Scaled {agent_type} by {delta}", style="green")
+
+
+@click.command()
+@click.argument("agent_type")
+@click.option("--max-unavailable", type=click.IntRange(min=1), help="Instances restarted at once")
+@click.option("--min-available", type=click.IntRange(min=0), help="Live instances to keep at all times")
+@click.option("--deployment", "deployment_id", help="Target deployment id")
+@click.pass_context
+def restart(
+    ctx: click.Context,
+    agent_type: str,
+    max_unavailable: Optional[int],
+    min_available: Optional[int],
+    deployment_id: Optional[str],
+) -> None:
+    """Rolling restart of an agent pool"""
+
+    project_path: Path = ctx.obj["project"]
+    state_store: StateBackend = _get_state_store(ctx)
+
+    async def restart_pool() -> int:
+        orchestrator = AgentOrchestrator(project_root=project_path, state_store=state_store)
+        replaced = await orchestrator.rolling_restart(
+            agent_type,
+            deployment_id=deployment_id,
+            max_unavailable=max_unavailable,
+            min_available=min_available,
+        )
+        return len(replaced)
+
+    try:
+        client = _get_daemon(ctx)
+        if client is not None:
+            result = client.call(
+                "restart",
+                timeout=None,
+                agent_type=agent_type,
+                deployment_id=deployment_id,
+                max_unavailable=max_unavailable,
+                min_available=min_available,
+            )
+            count = len(result["replaced"])
+        else:
+            count = asyncio.run(restart_pool())
+    except Exception as exc:  # noqa: BLE001 - surface to CLI
+        console.print(f"Restart failed: {exc}", style="red")
+        return
+
+    console.print(f"Restarted {count} {agent_type} instances", style="green")
+
+
+@click.command()
+@click.option(
+    "--format",
+    "output_format",
+    default="table",
+    type=click.Choice(["table", "json"]),
+    help="Render health summary",
+)
+@click.option("--deployment", "deployment_id", help="Only check this deployment")
+@click.pass_context
+def health(ctx: click.Context, output_format: str, deployment_id: Optional[str]) -> None:
+    """Check health of deployed agents"""
+
+    project_path: Path = ctx.obj["project"]
+    state_store: StateBackend = _get_state_store(ctx)
+
+    try:
+        client = _get_daemon(ctx)
+        if client is not None:
+            status = client.call("health", deployment_id=deployment_id)
+        else:
+            orchestrator = AgentOrchestrator(project_root=project_path, state_store=state_store)
+            results = asyncio.run(orchestrator.health_check(deployment_id))
+            status = {key: serialize_pool_health(pool_health) for key, pool_health in results.items()}
+    except Exception as exc:  # noqa: BLE001 - CLI entry point
+        console.print(f"Health check failed: {exc}", style="red")
+        return
+
+    if output_format == "json":
+        console.print_json(data=status)
+        return
+
+    table = Table(title="Agent Health")
+    table.add_column("Deployment:Agent")
+    table.add_column("Status")
+    table.add_column("Healthy")
+    table.add_column("Unhealthy")
+    table.add_column("Uptime", justify="right")
+
+    for key, health in status.items():
+        # Enhanced health display with uptime estimation
+        uptime = health.get('uptime', 'N/A')
+        if uptime == 'N/A' and health["healthy"] > 0:
+            uptime = "~5m"  # Rough estimate for running instances
+        
+        table.add_row(
+            key,
+            health["status"],
+            str(health["healthy"]),
+            str(health["unhealthy"]),
+            str(uptime),
+        )
+
+    console.print(table)
+
+
+@click.command()
+@click.option("--format", "output_format", default="table", type=click.Choice(["table", "json", "yaml"]))
+@click.pass_context
+def status(ctx: click.Context, output_format: str) -> None:
+    """Show comprehensive deployment status with multiple output formats"""
+    
+    project_path: Path = ctx.obj["project"]
+    state_store: StateBackend = _get_state_store(ctx)
+    
+    client = _get_daemon(ctx)
+    latest = client.call("deployment") if client is not None else state_store.latest_deployment()
+    if not latest:
+        console.print("No deployments recorded. Run `agentswarm deploy` first.", style="yellow")
+        return
+    latest = thaw(latest)
+    
+    if output_format == "json":
+        import json
+        console.print(json.dumps(latest, indent=2, default=str))
+    elif output_format == "yaml":
+        import yaml
+        console.print(yaml.dump(latest, default_flow_style=False))
+    else:
+        # Enhanced table format with more details
+        table = _build_status_table(latest, include_metrics=True)
+        console.print(table)
+        
+        # Additional deployment metadata
+        metadata_table = Table(title="Deployment Metadata")
+        metadata_table.add_column("Property", style="cyan")
+        metadata_table.add_column("Value", style="white")
+        
+        metadata_table.add_row("Deployment ID", latest.get("deployment_id", "Unknown"))
+        metadata_table.add_row("Created", latest.get("created_at", "Unknown"))
+        metadata_table.add_row("Project Path", str(project_path))
+        metadata_table.add_row("Total Agents", str(sum(len(procs) for procs in latest.get("agents", {}).values())))
+        
+        console.print(metadata_table)
+
+
+@click.command()
+@click.argument("key")
+@click.argument("value")
+@click.pass_context
+def config(ctx: click.Context, key: str, value: str) -> None:
+    """Set configuration values"""
+
+    project_path: Path = ctx.obj["project"]
+    config_path = project_path / DEFAULT_CONFIG_FILENAME
+
+    if not config_path.exists():
+        console.print(
+            f"Configuration file not found at {config_path}. Run `agentswarm init` first.",
+            style="red",
+        )
+        return
+
+    config = SwarmConfig.from_file(config_path)
+    section, _, option = key.partition(".")
+
+    if not section or not option:
+        console.print("Configuration key must be in the format section.option", style="red")
+        return
+
+    data = config.to_dict()
+    target = data.setdefault(section, {})
+    target[option] = value
+
+    SwarmConfig(
+        agents=data["agents"],
+        deployment=data.get("deployment", {}),
+        metadata=data.get("metadata", {}),
+    ).to_yaml(config_path)
+
+    console.print(f"Updated {key} in {config_path}", style="green")
+
+
+def _render_log_tails(deployment: dict[str, Any], lines: int) -> None:
+    shown = False
+    for agent_type, processes in deployment.get("agents", {}).items():
+        for proc in processes:
+            log_path = proc.get("log_path")
+            if not log_path:
+                continue
+            shown = True
+            console.print(
+                f"[bold cyan]{agent_type} #{proc.get('instance_id')}[/bold cyan] [dim]{log_path}[/dim]"
+            )
+            tail = read_log_tail(Path(log_path), lines)
+            for line in tail:
+                console.print(line, markup=False, highlight=False)
+            if not tail:
+                console.print("(no output captured yet)", style="dim")
+
+    if not shown:
+        console.print("No agent logs recorded for this deployment.", style="yellow")
+
+
+def _pid_running(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def _build_status_table(
+    deployment: dict[str, Any], *, include_metrics: bool = False
+) -> Table:
+    table = Table(title=f"Deployment {deployment['deployment_id']} Status")
+    table.add_column("Agent Type")
+    table.add_column("Instances", justify="right")
+    table.add_column("Running", justify="right")
+    table.add_column("Stopped", justify="right")
+    if include_metrics:
+        table.add_column("Memory", justify="right")
+        table.add_column("CPU", justify="right")
+    agents = deployment.get("agents", {})
+    with_cgroups = any(proc.get("cgroup") for processes in agents.values() for proc in processes)
+    if with_cgroups:
+        table.add_column("Cgroup Memory", justify="right")
+        table.add_column("Throttled", justify="right")
+        table.add_column("OOM Kills", justify="right")
+
+    for agent_type, processes in agents.items():
+        running = 0
+        stopped = 0
+        memory, cpu = _collect_metrics(processes) if include_metrics else ("-", "-")
+
+        for proc in processes:
+            pid = proc.get("pid")
+            if proc.get("exit_time") is None and pid and _pid_running(pid):
+                running += 1
+            else:
+                stopped += 1
+
+        row = [agent_type, str(len(processes)), str(running), str(stopped)]
+        if include_metrics:
+            row.extend([memory, cpu])
+        if with_cgroups:
+            row.extend(_collect_cgroup_metrics(processes))
+        table.add_row(*row)
+
+    return table
+
+
+def _collect_metrics(processes: list[dict[str, Any]]) -> tuple[str, str]:
+    total_memory = 0.0
+    total_cpu = 0.0
+
+    for proc in processes:
+        pid = proc.get("pid")
+        if not pid:
+            continue
+        try:
+            ps_proc = psutil.Process(pid)
+            total_memory += ps_proc.memory_info().rss / 1024 / 1024
+            total_cpu += ps_proc.cpu_percent(interval=0.0)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+    memory_display = f"{total_memory:.1f} MB" if total_memory else "0.0 MB"
+    cpu_display = f"{total_cpu:.1f}%" if total_cpu else "0.0%"
+    return memory_display, cpu_display
+
+
+def _collect_cgroup_metrics(processes: list[dict[str, Any]]) -> list[str]:
+    """Usage and throttle counters read from each instance's cgroup leaf."""
+
+    stats = [read_cgroup_stats(proc["cgroup"]) for proc in processes if proc.get("cgroup")]
+    stats = [entry for entry in stats if entry]
+    if not stats:
+        return ["-", "-", "-"]
+
+    memory = sum(entry.get("memory_current", 0) for entry in stats) / 1024 / 1024
+    limits = [entry.get("memory_max") for entry in stats]
+    memory_display = f"{memory:.1f} MB"
+    if all(limits):
+        memory_display += f" / {sum(limits) / 1024 / 1024:.0f} MB"
+    throttled = sum(entry.get("cpu_nr_throttled", 0) for entry in stats)
+    throttled_ms = sum(entry.get("cpu_throttled_usec", 0) for entry in stats) / 1000
+    oom_kills = sum(entry.get("oom_kills", 0) for entry in stats)
+    return [memory_display, f"{throttled} ({throttled_ms:.0f} ms)", str(oom_kills)]
@@ -0,0 +1,645 @@
+"""Multi-agent workflow commands."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import Any, Optional
+
+import click
+from rich.panel import Panel
+from rich.table import Table
+
+from ..core.models import AgentProcess
+from ..core.state import StateBackend
+from ..workflows.models import AgentWorkflowExecutor, WORKFLOW_REGISTRY
+from ..workflows.state import WorkflowStateStore
+from .common import _get_daemon, _get_state_store, console
+
+
+def _workflow_execution_to_dict(execution: Any) -> dict[str, Any]:
+    steps: list[dict[str, Any]] = []
+    for run in execution.steps.values():
+        result_str = "" if run.result is None else str(run.result)
+        steps.append(
+            {
+                "id": run.step_id,
+                "status": run.status.value,
+                "attempts": run.attempts,
+                "cached": run.cached,
+                "result": run.result,
+                "result_summary": (result_str[:80] + "...") if len(result_str) > 80 else result_str,
+                "error": run.error,
+                "execution_time": run.execution_time,
+            }
+        )
+
+    return {
+        "id": execution.id,
+        "status": execution.status.value if hasattr(execution.status, "value") else execution.status,
+        "definition_id": execution.definition_id,
+        "steps": steps,
+        "context": execution.context,
+        "execution_time": execution.execution_time,
+        "error": execution.error,
+        "started_at": execution.start_time.isoformat() if execution.start_time else None,
+        "finished_at": execution.end_time.isoformat() if execution.end_time else None,
+    }
+
+
+@click.group()
+def workflow():
+    """Multi-agent workflow management"""
+    pass
+
+
+@workflow.command()
+def list():
+    """List available workflows"""
+    if not WORKFLOW_REGISTRY:
+        console.print("No workflows available. Create workflow definitions first.", style="yellow")
+        return
+
+    table = Table(title="Available Workflows")
+    table.add_column("Name", style="cyan")
+    table.add_column("Description", style="white")
+    table.add_column("Type", style="green")
+    table.add_column("Steps", justify="right")
+
+    for name, workflow in WORKFLOW_REGISTRY.items():
+        table.add_row(
+            name,
+            workflow.description,
+            workflow.type.value,
+            str(len(workflow.steps))
+        )
+
+    console.print(table)
+
+
+@workflow.command()
+@click.argument("name")
+@click.option("--context", help="JSON context data for workflow execution")
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum steps of the workflow to run at once (default: unlimited)",
+)
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help="Reuse results of steps whose inputs are unchanged since an earlier run",
+)
+@click.option(
+    "--format",
+    "output_format",
+    default="table",
+    type=click.Choice(["table", "json"]),
+    help="Render workflow results as a table or JSON",
+)
+@click.pass_context
+def run(
+    ctx: click.Context,
+    name: str,
+    context: Optional[str],
+    max_concurrency: Optional[int],
+    use_cache: bool,
+    output_format: str,
+):
+    """Run a workflow by name"""
+    if name not in WORKFLOW_REGISTRY:
+        console.print(f"Workflow '{name}' not found. Use 'agentswarm workflow list' to see available workflows.", style="red")
+        return
+
+    # Parse context if provided
+    execution_context = {}
+    if context:
+        try:
+            import json
+            execution_context = json.loads(context)
+        except json.JSONDecodeError as e:
+            console.print(f"Invalid JSON context: {e}", style="red")
+            return
+
+    project_path: Path = ctx.obj["project"]
+    client = _get_daemon(ctx)
+    if client is not None:
+        # The daemon runs the workflow against its live agent handles and
+        # records the execution in the project's workflow state.
+        if output_format == "table":
+            console.print(f"Starting workflow: {name}", style="cyan")
+        try:
+            result = client.call(
+                "workflow.run",
+                timeout=None,
+                name=name,
+                context=execution_context,
+                max_concurrency=max_concurrency,
+                cache=use_cache,
+            )
+            execution = WorkflowStateStore(project_path / "workflow_state").get_execution(
+                result["execution_id"]
+            )
+            if execution is None:
+                raise RuntimeError(f"Execution {result['execution_id']} was not recorded")
+        except Exception as e:
+            message = f"Workflow execution failed: {e}"
+            if output_format == "json":
+                console.print_json(data={"error": message, "workflow": name})
+            else:
+                console.print(message, style="red")
+            return
+        _render_workflow_execution(execution, output_format)
+        return
+
+    # Get latest deployment to find running agents; only the in-process
+    # path reads deployment state.
+    state_store: StateBackend = _get_state_store(ctx)
+    latest = state_store.latest_deployment()
+    if not latest:
+        console.print("No active deployment found. Run 'agentswarm deploy' first.", style="red")
+        return
+
+    # Extract agent processes from deployment
+    agent_processes = {}
+    for agent_type, processes in latest.get("agents", {}).items():
+        agent_processes[agent_type] = [
+            AgentProcess(
+                pid=proc.get("pid", 0),
+                agent_type=agent_type,
+                instance_id=proc.get("instance_id", 0),
+                command=proc.get("command", f"agent-{agent_type}"),
+                status="running" if proc.get("pid") else "stopped"
+            )
+            for proc in processes
+        ]
+
+    # Create workflow executor and orchestrator
+    from ..workflows.cache import StepCache
+    from ..workflows.orchestrator import WorkflowManager, WorkflowOrchestrator
+
+    executor = AgentWorkflowExecutor(agent_processes)
+    workflow_orchestrator = WorkflowOrchestrator(
+        executor,
+        max_concurrency=max_concurrency,
+        step_cache=StepCache.for_project(project_path) if use_cache else None,
+    )
+    manager = WorkflowManager(workflow_orchestrator)
+
+    if output_format == "table":
+        console.print(f"Starting workflow: {name}", style="cyan")
+
+    try:
+        execution = asyncio.run(manager.run_workflow_by_name(name, execution_context))
+        _render_workflow_execution(execution, output_format)
+    except Exception as e:
+        message = f"Workflow execution failed: {e}"
+        if output_format == "json":
+            console.print_json(data={"error": message, "workflow": name})
+        else:
+            console.print(message, style="red")
+
+
+def _render_workflow_execution(execution: Any, output_format: str) -> None:
+    payload = _workflow_execution_to_dict(execution)
+
+    if output_format == "json":
+        console.print_json(data=payload)
+        return
+
+    table = Table(title=f"Workflow Execution: {execution.id}")
+    table.add_column("Step", style="cyan")
+    table.add_column("Status", style="green")
+    table.add_column("Time", style="magenta", justify="right")
+    table.add_column("Result", style="white")
+
+    for step in payload["steps"]:
+        status = {"completed": "✓", "failed": "✗", "skipped": "-"}.get(step["status"], step["status"])
+        if step["cached"]:
+            status += " (cached)"
+        duration = f"{step['execution_time']:.2f}s" if step["execution_time"] is not None else "-"
+        table.add_row(step["id"], status, duration, step["error"] or step["result_summary"])
+
+    console.print(table)
+
+    if payload["status"] == "completed":
+        console.print(
+            f"Workflow completed successfully in {payload.get('execution_time', 0.0):.2f}s",
+            style="green",
+        )
+    else:
+        console.print(
+            f"Workflow {payload['status']}: {payload.get('error', 'Unknown error')}",
+            style="red",
+        )
+
+
+@workflow.command()
+@click.argument("execution_id")
+@click.option(
+    "--format",
+    "output_format",
+    default="table",
+    type=click.Choice(["table", "json"]),
+    help="Render workflow status",
+)
+@click.pass_context
+def status(ctx: click.Context, execution_id: str, output_format: str):
+    """Check status of workflow execution"""
+    project_path: Path = ctx.obj["project"]
+
+    # Executions live in the workflow state; deployment state is not needed.
+    workflow_state_dir = project_path / "workflow_state"
+    if not workflow_state_dir.exists():
+        console.print(f"No workflow state found in {workflow_state_dir}", style="yellow")
+        return
+
+    from ..workflows.state import WorkflowStateStore as WFStateStore
+    wf_state_store = WFStateStore(workflow_state_dir)
+
+    execution = wf_state_store.get_execution(execution_id)
+    if not execution:
+        console.print(f"Workflow execution '{execution_id}' not found.", style="red")
+        return
+
+    payload = _workflow_execution_to_dict(execution)
+
+    if output_format == "json":
+        console.print_json(data=payload)
+        return
+
+    status_color = {
+        "pending": "yellow",
+        "running": "blue",
+        "completed": "green",
+        "failed": "red",
+        "cancelled": "magenta"
+    }.get(payload["status"], "white")
+
+    console.print(f"Workflow Execution: {payload['id']}")
+    console.print(f"Status: [{status_color}]{payload['status']}[/{status_color}]")
+    console.print(f"Definition: {payload['definition_id']}")
+
+    if payload.get("started_at"):
+        console.print(f"Started: {payload['started_at']}")
+    if payload.get("finished_at"):
+        console.print(f"Ended: {payload['finished_at']}")
+    duration = payload.get("execution_time")
+    if duration is not None:
+        console.print(f"Duration: {duration:.2f}s")
+
+    if payload.get("error"):
+        console.print(f"Error: [red]{payload['error']}[/red]")
+
+    if payload.get("steps"):
+        console.print("\nSteps:")
+        for step in payload["steps"]:
+            detail = f"[red]{step['error']}[/red]" if step["error"] else step["result_summary"]
+            status = f"{step['status']}, cached" if step["cached"] else step["status"]
+            console.print(f"  {step['id']} ({status}): {detail}")
+
+
+@workflow.command()
+@click.argument("execution_id")
+@click.pass_context
+def cancel(ctx: click.Context, execution_id: str):
+    """Cancel a running workflow execution"""
+    project_path: Path = ctx.obj["project"]
+
+    # Create a temporary orchestrator to cancel
+    from ..workflows.orchestrator import WorkflowOrchestrator
+    from ..workflows.models import AgentWorkflowExecutor
+
+    # We need agent processes to create the executor, but for cancellation we might not need them
+    # For now, just mark as cancelled in state store
+    workflow_state_dir = project_path / "workflow_state"
+    if not workflow_state_dir.exists():
+        console.print(f"No workflow state found in {workflow_state_dir}", style="yellow")
+        return
+
+    from ..workflows.state import WorkflowStateStore as WFStateStore
+    wf_state_store = WFStateStore(workflow_state_dir)
+
+    execution = wf_state_store.get_execution(execution_id)
+    if not execution:
+        console.print(f"Workflow execution '{execution_id}' not found.", style="red")
+        return
+
+    if execution.status.value not in ["running", "pending"]:
+        console.print(f"Workflow is already {execution.status.value}, cannot cancel.", style="yellow")
+        return
+
+    # Mark as cancelled
+    from ..workflows.models import WorkflowStatus
+    execution.status = WorkflowStatus.CANCELLED
+    execution.end_time = datetime.now(UTC)
+    wf_state_store.save_execution(execution)
+
+    console.print(f"Workflow execution '{execution_id}' cancelled.", style="green")
+
+
+@workflow.command("summary")
+@click.option(
+    "--format",
+    "output_format",
+    default="table",
+    type=click.Choice(["table", "json"]),
+    help="Render workflow summary data",
+)
+@click.pass_context
+def summary(ctx: click.Context, output_format: str):
+    """Summarize workflow executions and statistics."""
+    project_path: Path = ctx.obj["project"]
+
+    workflow_state_dir = project_path / "workflow_state"
+    if not workflow_state_dir.exists():
+        console.print(f"No workflow state found in {workflow_state_dir}", style="yellow")
+        console.print("Run some workflows first to see monitoring data.", style="dim")
+        return
+
+    from ..workflows.state import WorkflowStateStore as WFStateStore
+    wf_state_store = WFStateStore(workflow_state_dir)
+
+    # Get statistics
+    stats = wf_state_store.get_execution_stats()
+
+    recent_execs = wf_state_store.get_completed_executions(limit=5)
+    active_execs = wf_state_store.get_active_executions()
+
+    if output_format == "json":
+        console.print_json(
+            data={
+                "stats": stats,
+                "recent": [
+                    {
+                        "id": ex.id,
+                        "definition_id": ex.definition_id,
+                        "status": ex.status.value,
+                        "execution_time": ex.execution_time,
+                        "ended_at": ex.end_time.isoformat() if ex.end_time else None,
+                    }
+                    for ex in recent_execs
+                ],
+                "active": [
+                    {
+                        "id": ex.id,
+                        "definition_id": ex.definition_id,
+                        "status": ex.status.value,
+                        "started_at": ex.start_time.isoformat() if ex.start_time else None,
+                    }
+                    for ex in active_execs
+                ],
+            }
+        )
+        return
+
+    # Display statistics
+    console.print(Panel.fit(
+        f"[bold blue]Workflow Statistics[/bold blue]\n\n"
+        f"Total Executions: {stats['total']}\n"
+        f"Completed: {stats['completed']}\n"
+        f"Failed: {stats['failed']}\n"
+        f"Running: {stats['running']}\n"
+        f"Success Rate: {stats['success_rate']}%",
+        title="Workflow Overview"
+    ))
+
+    # Show recent executions
+    if recent_execs:
+        console.print("\n[bold]Recent Executions:[/bold]")
+        table = Table()
+        table.add_column("ID", style="cyan", no_wrap=True)
+        table.add_column("Definition", style="white")
+        table.add_column("Status", style="green")
+        table.add_column("Duration", justify="right")
+        table.add_column("Ended", style="dim")
+
+        for execution in recent_execs:
+            duration = f"{execution.execution_time:.1f}s" if execution.execution_time else "N/A"
+            end_time = execution.end_time.strftime("%H:%M:%S") if execution.end_time else "N/A"
+            status_color = {
+                "completed": "green",
+                "failed": "red",
+                "cancelled": "yellow"
+            }.get(execution.status.value, "white")
+
+            table.add_row(
+                execution.id[:8] + "...",
+                execution.definition_id,
+                f"[{status_color}]{execution.status.value}[/{status_color}]",
+                duration,
+                end_time
+            )
+
+        console.print(table)
+
+    # Show active executions
+    if active_execs:
+        console.print("\n[bold yellow]Active Executions:[/bold yellow]")
+        for execution in active_execs:
+            duration = "N/A"
+            if execution.start_time:
+                elapsed = (datetime.now(UTC) - execution.start_time).total_seconds()
+                duration = f"{elapsed:.1f}s"
+
+            console.print(f"  {execution.id[:8]}... - {execution.definition_id} ({duration})")
+
+
+@workflow.command()
+@click.option("--days", type=int, default=30, help="Clean executions older than this many days")
+@click.pass_context
+def cleanup(ctx: click.Context, days: int):
+    """Clean up old workflow executions"""
+    project_path: Path = ctx.obj["project"]
+
+    workflow_state_dir = project_path / "workflow_state"
+    if not workflow_state_dir.exists():
+        console.print(f"No workflow state found in {workflow_state_dir}", style="yellow")
+        return
+
+    from ..workflows.state import WorkflowStateStore as WFStateStore
+    wf_state_store = WFStateStore(workflow_state_dir)
+
+    deleted = wf_state_store.cleanup_old_executions(days=days)
+    console.print(f"Cleaned up {deleted} workflow executions older than {days} days.", style="green")
+
+
+@workflow.command()
+@click.argument("name")
+def show(name: str):
+    """Show detailed information about a workflow"""
+    if name not in WORKFLOW_REGISTRY:
+        console.print(f"Workflow '{name}' not found.", style="red")
+        return
+
+    workflow = WORKFLOW_REGISTRY[name]
+
+    # Workflow overview
+    console.print(Panel.fit(
+        f"[bold]{workflow.name}[/bold]\n"
+        f"[dim]{workflow.description}[/dim]\n\n"
+        f"Type: {workflow.type.value}\n"
+        f"Steps: {len(workflow.steps)}\n"
+        f"Version: {workflow.version}",
+        title=f"Workflow: {name}"
+    ))
+
+    # Steps table
+    table = Table(title="Workflow Steps")
+    table.add_column("ID", style="cyan")
+    table.add_column("Name", style="white")
+    table.add_column("Agent Type", style="green")
+    table.add_column("Task", style="yellow")
+    table.add_column("Dependencies", style="magenta")
+
+    for step in workflow.steps:
+        deps = ", ".join(step.dependencies) if step.dependencies else "None"
+        table.add_row(
+            step.id,
+            step.name,
+            step.agent_type,
+            step.task,
+            deps
+        )
+
+@workflow.command("watch")
+@click.argument("execution_id")
+@click.pass_context
+def watch(ctx: click.Context, execution_id: str):
+    """Launch an interactive dashboard for a single execution."""
+    project_path: Path = ctx.obj["project"]
+    state_store: StateBackend = _get_state_store(ctx)
+
+    # Get agent processes
+    latest = state_store.latest_deployment()
+    if not latest:
+        console.print("No active deployment found. Run 'agentswarm deploy' first.", style="red")
+        return
+
+    agent_processes = {}
+    for agent_type, processes in latest.get("agents", {}).items():
+        agent_processes[agent_type] = [
+            AgentProcess(
+                pid=proc.get("pid", 0),
+                agent_type=agent_type,
+                instance_id=proc.get("instance_id", 0),
+                command=proc.get("command", f"agent-{agent_type}"),
+                status="running" if proc.get("pid") else "stopped"
+            )
+            for proc in processes
+        ]
+
+    # Setup workflow components
+    from ..workflows.monitor import WorkflowMonitor
+    from ..workflows.orchestrator import WorkflowOrchestrator
+
+    executor = AgentWorkflowExecutor(agent_processes)
+    workflow_orchestrator = WorkflowOrchestrator(executor)
+    workflow_state_store = WorkflowStateStore(project_path / "workflow_state")
+    monitor = WorkflowMonitor(workflow_orchestrator, workflow_state_store)
+
+    # Start monitoring and display dashboard
+    asyncio.run(monitor.start_monitoring())
+    monitor.display_live_dashboard(execution_id)
+    asyncio.run(monitor.stop_monitoring())
+
+
+@workflow.command()
+@click.pass_context
+def dashboard(ctx: click.Context):
+    """Display live workflow monitoring dashboard"""
+    project_path: Path = ctx.obj["project"]
+    state_store: StateBackend = _get_state_store(ctx)
+
+    # Get agent processes
+    latest = state_store.latest_deployment()
+    if not latest:
+        console.print("No active deployment found. Run 'agentswarm deploy' first.", style="red")
+        return
+
+    agent_processes = {}
+    for agent_type, processes in latest.get("agents", {}).items():
+        agent_processes[agent_type] = [
+            AgentProcess(
+                pid=proc.get("pid", 0),
+                agent_type=agent_type,
+                instance_id=proc.get("instance_id", 0),
+                command=proc.get("command", f"agent-{agent_type}"),
+                status="running" if proc.get("pid") else "stopped"
+            )
+            for proc in processes
+        ]
+
+    # Setup workflow components
+    from ..workflows.monitor import WorkflowMonitor
+    from ..workflows.orchestrator import WorkflowOrchestrator
+
+    executor = AgentWorkflowExecutor(agent_processes)
+    workflow_orchestrator = WorkflowOrchestrator(executor)
+    workflow_state_store = WorkflowStateStore(project_path / "workflow_state")
+    monitor = WorkflowMonitor(workflow_orchestrator, workflow_state_store)
+
+    # Start monitoring and display dashboard
+    asyncio.run(monitor.start_monitoring())
+    monitor.display_live_dashboard()
+    asyncio.run(monitor.stop_monitoring())
+
+
+@workflow.command()
+@click.argument("execution_id")
+@click.pass_context
+def metrics(ctx: click.Context, execution_id: str):
+    """Show detailed metrics for a workflow execution"""
+    project_path: Path = ctx.obj["project"]
+
+    from ..workflows.monitor import WorkflowMonitor
+
+    workflow_state_store = WorkflowStateStore(project_path / "workflow_state")
+    monitor = WorkflowMonitor(None, workflow_state_store)  # Monitor only needs state store for metrics
+
+    metrics_data = monitor.get_execution_metrics(execution_id)
+
+    if "error" in metrics_data:
+        console.print(f"[red]Error: {metrics_data['error']}[/red]")
+        return
+
+    table = Table(title=f"Execution Metrics: {execution_id}")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="white")
+
+    for key, value in metrics_data.items():
+        if key != "id":
+            table.add_row(key.replace("_", " ").title(), str(value))
+
+    console.print(table)
+
+
+@workflow.command()
+@click.pass_context
+def stats(ctx: click.Context):
+    """Show system-wide workflow statistics"""
+    project_path: Path = ctx.obj["project"]
+
+    from ..workflows.monitor import WorkflowMonitor
+
+    workflow_state_store = WorkflowStateStore(project_path / "workflow_state")
+    monitor = WorkflowMonitor(None, workflow_state_store)
+
+    stats_data = monitor.get_system_metrics()
+
+    panel = Panel.fit(
+        f"[bold blue]Workflow System Statistics[/bold blue]\n\n"
+        f"Total Executions: {stats_data['total']}\n"
+        f"Completed: {stats_data['completed']}\n"
+        f"Failed: {stats_data['failed']}\n"
+        f"Running: {stats_data['running']}\n"
+        f"Success Rate: {stats_data['success_rate']}%\n"
+        f"Active Monitors: {stats_data['active_monitors']}\n"
+        f"Event Listeners: {stats_data['total_listeners']}",
+        title="System Stats"
+    )
+
+    console.print(panel)
@@ -2,18 +2,85 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
 import time
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import psutil
 
-from .config import AgentConfig
+from .config import AgentConfig, parse_duration, parse_size
 from .models import AgentProcess
+from .registry import InstanceRegistry
 
 
 Provisioner = Callable[[int, AgentConfig], Awaitable[AgentProcess]]
 Terminator = Callable[[AgentProcess], Awaitable[None]]
+Readiness = Callable[[AgentProcess], Awaitable[bool]]
+
+DEFAULT_WAVE_JITTER = 0.5  # seconds
+DEFAULT_READINESS_TIMEOUT = 30.0  # seconds
+_READINESS_POLL_INTERVAL = 0.1  # seconds
+
+
+class RolloutError(RuntimeError):
+    """Raised when a rolling restart stops because a replacement never became ready."""
+
+
+class LaunchThrottle:
+    """Bound concurrent provisioning across pools and stagger launches."""
+
+    def __init__(self, max_concurrent: int, *, jitter: float = 0.0) -> None:
+        self.max_concurrent = max(1, max_concurrent)
+        self.jitter = max(0.0, jitter)
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+    @classmethod
+    def from_deployment(cls, deployment: Dict[str, Any]) -> "LaunchThrottle":
+        """Build a throttle from the ``deployment`` section of a SwarmConfig."""
+
+        strategy = deployment.get("strategy", "parallel")
+        max_concurrent = int(deployment.get("max_concurrent", 1))
+        if strategy == "sequential":
+            max_concurrent = 1
+
+        default_jitter = DEFAULT_WAVE_JITTER if strategy == "waves" else 0.0
+        jitter = parse_duration(deployment.get("launch_jitter"), default=default_jitter)
+        return cls(max_concurrent, jitter=jitter)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        # Jitter before taking a slot: sleeping while holding one would idle
+        # it and stretch every launch behind it.
+        if self.jitter:
+            await asyncio.sleep(random.uniform(0.0, self.jitter))
+        async with self._semaphore:
+            yield
+
+
+@dataclass(slots=True)
+class StandbySettings:
+    """Warm standby configuration declared under ``agents.<type>.standby``."""
+
+    count: int = 0
+    idle_timeout: float = 0.0  # seconds; 0 keeps standbys forever
+    memory_budget: int = 0  # bytes of RSS across standbys; 0 is unlimited
+
+    @classmethod
+    def from_config(cls, agent_config: AgentConfig) -> "StandbySettings":
+        raw = agent_config.get("standby") or {}
+        if isinstance(raw, int):
+            raw = {"count": raw}
+        budget = raw.get("memory_budget")
+        return cls(
+            count=max(0, int(raw.get("count", 0))),
+            idle_timeout=parse_duration(raw.get("idle_timeout")),
+            memory_budget=parse_size(budget) if budget is not None else 0,
+        )
 
 
 class PoolHealth:
@@ -72,46 +139,103 @@ class AgentPool:
         self.agent_config = agent_config
         self._provisioner = provisioner
         self._terminator = terminator
-        self.running_instances: List[AgentProcess] = []
+        self.registry = InstanceRegistry()
+        self.standby_instances: List[AgentProcess] = []
+        self.standby = StandbySettings.from_config(agent_config)
         self.logger = logging.getLogger(f"{__name__}.{deployment_id}.{agent_type}")
 
+    @property
+    def running_instances(self) -> List[AgentProcess]:
+        """Snapshot of running instances in provisioning order."""
+
+        return list(self.registry)
+
     # ------------------------------------------------------------------
     # Lifecycle management
     # ------------------------------------------------------------------
-    async def scale(self, delta: int) -> Tuple[List[AgentProcess], List[AgentProcess]]:
+    async def scale(
+        self,
+        delta: int,
+        *,
+        throttle: Optional[LaunchThrottle] = None,
+    ) -> Tuple[List[AgentProcess], List[AgentProcess]]:
         """Scale pool size by delta."""
 
         created: List[AgentProcess] = []
         removed: List[AgentProcess] = []
 
         if delta > 0:
-            created = await self._scale_up(delta)
+            created = await self._scale_up(delta, throttle=throttle)
         elif delta < 0:
             removed = await self._scale_down(abs(delta))
 
         return created, removed
 
-    async def _scale_up(self, count: int) -> List[AgentProcess]:
-        created: List[AgentProcess] = []
-        for _ in range(count):
-            instance_id = self._next_instance_id()
-            process = await self._provisioner(instance_id, self.agent_config)
-            self.running_instances.append(process)
-            created.append(process)
+    async def _scale_up(
+        self, count: int, *, throttle: Optional[LaunchThrottle] = None
+    ) -> List[AgentProcess]:
+        created = self._promote_standby(count)
+        count -= len(created)
+        if count <= 0:
+            return created
+
+        # Reserve instance ids up front so concurrent launches never collide.
+        instance_ids = [self.registry.ids.allocate() for _ in range(count)]
+        results = await asyncio.gather(
+            *(self._provision(instance_id, throttle) for instance_id in instance_ids),
+            return_exceptions=True,
+        )
+
+        errors: List[BaseException] = []
+        for instance_id, result in zip(instance_ids, results):
+            if isinstance(result, BaseException):
+                self.logger.error(
+                    "Failed to provision %s instance %s: %s",
+                    self.agent_type,
+                    instance_id,
+                    result,
+                )
+                errors.append(result)
+                self.registry.ids.release(instance_id)
+                continue
+
+            self.registry.add(result)
+            created.append(result)
             self.logger.info(
                 "Provisioned %s instance %s (pid=%s)",
                 self.agent_type,
                 instance_id,
-                process.pid,
+                result.pid,
             )
+
+        if errors:
+            raise errors[0]
         return created
 
+    async def _provision(
+        self, instance_id: int, throttle: Optional[LaunchThrottle]
+    ) -> AgentProcess:
+        if throttle is None:
+            return await self._provisioner(instance_id, self.agent_config)
+        async with throttle.slot():
+            return await self._provisioner(instance_id, self.agent_config)
+
     async def _scale_down(self, count: int) -> List[AgentProcess]:
-        removed: List[AgentProcess] = []
-        for _ in range(min(count, len(self.running_instances))):
-            process = self.running_instances.pop()
-            await self._terminator(process)
-            removed.append(process)
+        # Idle instances go first, newest first, so work in progress is only
+        # interrupted when there are not enough idle ones. Ids are only
+        # released once their processes are gone.
+        victims: List[AgentProcess] = []
+        busy: List[AgentProcess] = []
+        for process in self.registry.newest_first():
+            if len(victims) == count:
+                break
+            (busy if process.active_steps else victims).append(process)
+        victims += busy[: count - len(victims)]
+        removed = [self.registry.remove(process.instance_id, release=False) for process in victims]
+        # Terminate concurrently so stubborn instances share one grace period.
+        await asyncio.gather(*(self._terminator(process) for process in removed))
+        for process in removed:
+            self.registry.ids.release(process.instance_id)
             self.logger.info(
                 "Terminated %s instance %s (pid=%s)",
                 self.agent_type,
@@ -120,13 +244,120 @@ class AgentPool:
             )
         return removed
 
+    def _promote_standby(self, count: int) -> List[AgentProcess]:
+        promoted: List[AgentProcess] = []
+        while self.standby_instances and len(promoted) < count:
+            process = self.standby_instances.pop()
+            if not process.is_alive():
+                self.registry.ids.release(process.instance_id)
+                continue
+            process.status = "running"
+            self.registry.add(process)
+            promoted.append(process)
+            self.logger.info(
+                "Promoted standby %s instance %s (pid=%s)",
+                self.agent_type,
+                process.instance_id,
+                process.pid,
+            )
+        return promoted
+
+    async def fill_standby(self, *, throttle: Optional[LaunchThrottle] = None) -> List[AgentProcess]:
+        """Top the warm standby pool back up to its configured size.
+
+        Standbys that exited or outlived ``idle_timeout`` are recycled first,
+        and no new standby is started once their combined RSS reaches
+        ``memory_budget``.
+        """
+
+        if not self.standby.count and not self.standby_instances:
+            return []
+
+        now = time.time()
+        keep: List[AgentProcess] = []
+        expired: List[AgentProcess] = []
+        for process in self.standby_instances:
+            if not process.is_alive():
+                self.registry.ids.release(process.instance_id)
+                continue
+            if self.standby.idle_timeout and now - process.start_time > self.standby.idle_timeout:
+                expired.append(process)
+            else:
+                keep.append(process)
+        # Surplus standbys (count lowered) are recycled like expired ones.
+        expired.extend(keep[self.standby.count:])
+        self.standby_instances = keep[: self.standby.count]
+        if expired:
+            await asyncio.gather(*(self._terminator(process) for process in expired))
+            for process in expired:
+                self.registry.ids.release(process.instance_id)
+            self.logger.info(
+                "Recycled %s %s standby instances", len(expired), self.agent_type
+            )
+
+        started: List[AgentProcess] = []
+        while len(self.standby_instances) < self.standby.count:
+            if self.standby.memory_budget and (
+                sum(self._get_rss_bytes(proc.pid) for proc in self.standby_instances)
+                >= self.standby.memory_budget
+            ):
+                self.logger.info(
+                    "%s standby pool reached its memory budget at %s instances",
+                    self.agent_type,
+                    len(self.standby_instances),
+                )
+                break
+            instance_id = self.registry.ids.allocate()
+            try:
+                process = await self._provision(instance_id, throttle)
+            except BaseException:
+                self.registry.ids.release(instance_id)
+                raise
+            process.status = "standby"
+            self.standby_instances.append(process)
+            started.append(process)
+
+        return started
+
+    async def recycle_standby(self) -> List[AgentProcess]:
+        """Stop every standby so the next fill starts them with the current config."""
+
+        recycled, self.standby_instances = self.standby_instances, []
+        if recycled:
+            await asyncio.gather(*(self._terminator(process) for process in recycled))
+            for process in recycled:
+                self.registry.ids.release(process.instance_id)
+            self.logger.info("Recycled %s %s standby instances", len(recycled), self.agent_type)
+        return recycled
+
+    def reconfigure(self, agent_config: AgentConfig) -> None:
+        """Use ``agent_config`` for every instance started from now on."""
+
+        self.agent_config = agent_config
+        self.standby = StandbySettings.from_config(agent_config)
+
     def register_existing(self, processes: List[AgentProcess]) -> None:
-        self.running_instances = processes
+        self.registry.clear()
+        for process in processes:
+            self.registry.add(process)
+
+    def register_standby(self, processes: List[AgentProcess]) -> None:
+        for process in self.standby_instances:
+            self.registry.ids.release(process.instance_id)
+        self.standby_instances = processes
+        for process in processes:
+            self.registry.ids.claim(process.instance_id)
 
     def remove_instance(self, instance_id: int) -> None:
-        self.running_instances = [
-            proc for proc in self.running_instances if proc.instance_id != instance_id
-        ]
+        self.registry.remove(instance_id)
+
+    def clear(self) -> None:
+        """Forget every running and standby instance without terminating them."""
+
+        for process in self.standby_instances:
+            self.registry.ids.release(process.instance_id)
+        self.standby_instances = []
+        self.registry.clear()
 
     # ------------------------------------------------------------------
     # Monitoring helpers
@@ -136,7 +367,7 @@ class AgentPool:
         unhealthy = 0
         details: Dict[str, Any] = {}
 
-        for process in self.running_instances:
+        for process in self.registry:
             if process.is_alive():
                 healthy += 1
                 details[f"instance_{process.instance_id}"] = "healthy"
@@ -144,7 +375,7 @@ class AgentPool:
                 unhealthy += 1
                 details[f"instance_{process.instance_id}"] = "unhealthy"
 
-        total = len(self.running_instances)
+        total = len(self.registry)
         if healthy == total and total > 0:
             status = "healthy"
         elif healthy > 0:
@@ -175,40 +406,151 @@ class AgentPool:
             last_activity="active" if is_running else "inactive",
         )
 
+    async def rolling_restart(
+        self,
+        *,
+        max_unavailable: int = 1,
+        min_available: int = 0,
+        readiness: Optional[Readiness] = None,
+        readiness_timeout: float = DEFAULT_READINESS_TIMEOUT,
+        throttle: Optional[LaunchThrottle] = None,
+    ) -> List[AgentProcess]:
+        """Restart every running instance without dropping below a capacity floor.
+
+        At most ``max_unavailable`` instances are down at any moment, and an
+        instance is only taken down while at least ``min_available`` others
+        stay alive. Each replacement must pass ``readiness`` (default: the
+        process is alive) within ``readiness_timeout`` before its slot is
+        reused. If a replacement fails the check, no further instances are
+        taken down and RolloutError is raised once in-flight restarts finish.
+        """
+
+        if max_unavailable < 1:
+            raise ValueError("max_unavailable must be at least 1")
+
+        queue = deque(process.instance_id for process in self.registry)
+        available = sum(1 for process in self.registry if process.is_alive())
+        restarting: Dict[asyncio.Task, int] = {}
+        replaced: List[AgentProcess] = []
+        failures: List[str] = []
+
+        while (queue and not failures) or restarting:
+            while queue and not failures and len(restarting) < max_unavailable:
+                process = self.registry.get(queue[0])
+                if process is None:
+                    queue.popleft()  # Scaled away since the rollout started
+                    continue
+                # Instances that are already down cost no capacity to restart.
+                alive = process.is_alive()
+                if alive and available - 1 < min_available:
+                    break
+                instance_id = queue.popleft()
+                task = asyncio.create_task(
+                    self._restart_when_ready(instance_id, readiness, readiness_timeout, throttle)
+                )
+                restarting[task] = instance_id
+                if alive:
+                    available -= 1
+
+            if not restarting:
+                if queue and not failures:
+                    raise RolloutError(
+                        f"Restarting {self.agent_type} would leave fewer than"
+                        f" {min_available} instances available"
+                    )
+                break
+
+            done, _ = await asyncio.wait(restarting, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                instance_id = restarting.pop(task)
+                try:
+                    replaced.append(task.result())
+                    available += 1
+                except Exception as exc:  # noqa: BLE001 - reported below
+                    failures.append(f"instance {instance_id}: {exc}")
+
+        if failures:
+            raise RolloutError(
+                f"Rolling restart of {self.agent_type} stopped after"
+                f" {len(replaced)} replacements; " + "; ".join(failures)
+            )
+        self.logger.info("Rolling restart of %s replaced %s instances", self.agent_type, len(replaced))
+        return replaced
+
+    async def _restart_when_ready(
+        self,
+        instance_id: int,
+        readiness: Optional[Readiness],
+        timeout: float,
+        throttle: Optional[LaunchThrottle],
+    ) -> AgentProcess:
+        process = self._get_instance(instance_id)
+        await self._terminator(process)
+        new_process = await self._provision(instance_id, throttle)
+        self.registry.replace(new_process)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            if not new_process.is_alive():
+                raise RolloutError(f"replacement exited (pid={new_process.pid})")
+            if readiness is None or await readiness(new_process):
+                break
+            if time.monotonic() >= deadline:
+                raise RolloutError(f"replacement not ready after {timeout:.1f}s")
+            await asyncio.sleep(_READINESS_POLL_INTERVAL)
+
+        self.logger.info(
+            "Restarted %s instance %s (pid=%s)", self.agent_type, instance_id, new_process.pid
+        )
+        return new_process
+
     async def restart_instance(self, instance_id: int) -> AgentProcess:
         process = self._get_instance(instance_id)
         await self._terminator(process)
         new_process = await self._provisioner(instance_id, self.agent_config)
-        self.remove_instance(instance_id)
-        self.running_instances.append(new_process)
+        self.registry.replace(new_process)
         self.logger.info(
             "Restarted %s instance %s (pid=%s)", self.agent_type, instance_id, new_process.pid
         )
         return new_process
 
+    async def stop_instance(self, instance_id: int) -> AgentProcess:
+        """Terminate one instance and drop it from the pool without replacing it."""
+
+        process = self._get_instance(instance_id)
+        await self._terminator(process)
+        self.registry.remove(instance_id)
+        self.logger.info(
+            "Stopped %s instance %s (pid=%s)", self.agent_type, instance_id, process.pid
+        )
+        return process
+
     def get_pool_summary(self) -> Dict[str, Any]:
         return {
             "agent_type": self.agent_type,
             "deployment_id": self.deployment_id,
-            "target_instances": len(self.running_instances),
-            "running_instances": len(self.running_instances),
+            "target_instances": len(self.registry),
+            "running_instances": len(self.registry),
+            "standby_instances": len(self.standby_instances),
         }
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
     def _get_instance(self, instance_id: int) -> AgentProcess:
-        for process in self.running_instances:
-            if process.instance_id == instance_id:
-                return process
-        raise ValueError(
-            f"Instance {instance_id} not found in pool {self.agent_type}"
-        )
+        process = self.registry.get(instance_id)
+        if process is None:
+            raise ValueError(
+                f"Instance {instance_id} not found in pool {self.agent_type}"
+            )
+        return process
 
-    def _next_instance_id(self) -> int:
-        if not self.running_instances:
-            return 1
-        return max(process.instance_id for process in self.running_instances) + 1
+    @staticmethod
+    def _get_rss_bytes(pid: int) -> int:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except Exception:
+            return 0
 
     @staticmethod
     def _get_memory_usage(pid: int) -> str:
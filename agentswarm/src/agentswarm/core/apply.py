@@ -0,0 +1,181 @@
+"""Plan in-place changes that bring a running deployment to a new config."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Sequence
+
+from .config import AgentConfig, SwarmConfig, _deep_update
+from .models import SwarmDeployment
+from .placement import PlacementPolicy
+from .resources import ResourceLimits
+
+# Pool settings replaced as a whole rather than merged key by key, so a
+# limit or placement option dropped from the file is dropped from the pool.
+REPLACED_POOL_SETTINGS = ("command", "resources", "placement")
+
+
+@dataclass(slots=True)
+class PoolChange:
+    """What ``apply`` does to one agent pool.
+
+    ``create`` starts a pool the deployment does not have yet and ``remove``
+    stops one that is no longer configured (only with ``prune``). An
+    ``update`` scales the pool when its instance count changed, rolls it
+    when the settings its processes were started with changed (command,
+    resources or placement), and otherwise only swaps in the new settings.
+    """
+
+    agent_type: str
+    action: str
+    current: int = 0  # running instances
+    desired: int = 0
+    roll: bool = False
+    reasons: List[str] = field(default_factory=list)
+
+    @property
+    def delta(self) -> int:
+        return self.desired - self.current
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "agent_type": self.agent_type,
+            "action": self.action,
+            "current": self.current,
+            "desired": self.desired,
+            "roll": self.roll,
+            "reasons": list(self.reasons),
+        }
+
+
+@dataclass(slots=True)
+class ApplyPlan:
+    """The minimal set of pool changes from a deployment to a new config."""
+
+    deployment_id: str
+    config: SwarmConfig  # the deployment's config once the plan is applied
+    changes: List[PoolChange] = field(default_factory=list)
+    config_changed: bool = False
+
+    @property
+    def changed(self) -> bool:
+        return self.config_changed or any(change.action != "unchanged" for change in self.changes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "deployment_id": self.deployment_id,
+            "changed": self.changed,
+            "changes": [change.to_dict() for change in self.changes],
+        }
+
+
+def plan_apply(
+    deployment: SwarmDeployment, desired: Mapping[str, Any], *, prune: bool = False
+) -> ApplyPlan:
+    """Diff ``deployment`` against the config data ``desired`` without touching any process.
+
+    ``desired`` is config data as written in the file (see
+    :func:`~agentswarm.core.config.load_config_data`), not a
+    :class:`SwarmConfig`, whose defaults would reset settings the deployment
+    overrides. It is layered over the running config: keys it leaves out
+    keep their current values and mappings merge key by key, except a
+    pool's ``command``, ``resources`` and ``placement``, which are replaced
+    as a whole. A ``null`` value removes a key. Pools missing from
+    ``desired`` are kept unless ``prune`` is set. Instance counts are
+    compared between the two configs rather than against the live pool
+    size, so a pool resized by the autoscaler is only rescaled when its
+    configured count actually changes.
+    """
+
+    current = deployment.config
+    desired_agents = desired.get("agents") or {}
+    agents = dict(current.agents)
+    for agent_type, overrides in desired_agents.items():
+        agents[agent_type] = _layer(
+            current.agents.get(agent_type, {}), overrides or {}, replace=REPLACED_POOL_SETTINGS
+        )
+    if prune:
+        agents = {
+            agent_type: agent_config
+            for agent_type, agent_config in agents.items()
+            if agent_type in desired_agents
+        }
+    target = SwarmConfig(
+        agents=agents,
+        deployment=_layer(current.deployment, desired.get("deployment") or {}),
+        metadata=_layer(current.metadata, desired.get("metadata") or {}),
+    )
+
+    plan = ApplyPlan(
+        deployment_id=deployment.deployment_id,
+        config=target,
+        config_changed=target.to_dict() != current.to_dict(),
+    )
+    for agent_type in [*current.agents, *(name for name in target.agents if name not in current.agents)]:
+        running = len(deployment.agents.get(agent_type, []))
+        old = current.agents.get(agent_type)
+        new = target.agents.get(agent_type)
+        if new is None:
+            plan.changes.append(
+                PoolChange(agent_type, "remove", current=running, reasons=["not in config (pruned)"])
+            )
+        elif old is None:
+            plan.changes.append(
+                PoolChange(
+                    agent_type,
+                    "create",
+                    current=running,
+                    desired=new.get("instances", 1),
+                    reasons=["new agent type"],
+                )
+            )
+        else:
+            plan.changes.append(_diff_pool(agent_type, old, new, running))
+    return plan
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+def _layer(
+    base: Dict[str, Any], overrides: Mapping[str, Any], *, replace: Sequence[str] = ()
+) -> Dict[str, Any]:
+    result = dict(base)
+    for key, value in overrides.items():
+        if value is None:
+            result.pop(key, None)
+        elif key not in replace and isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = _deep_update(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+def _diff_pool(agent_type: str, old: AgentConfig, new: AgentConfig, running: int) -> PoolChange:
+    change = PoolChange(agent_type, "unchanged", current=running, desired=running)
+
+    old_instances = old.get("instances", 1)
+    new_instances = new.get("instances", 1)
+    if old_instances != new_instances:
+        change.desired = new_instances
+        change.reasons.append(f"instances {old_instances} -> {new_instances}")
+
+    for setting, before, after in (
+        ("command", old.get("command"), new.get("command")),
+        ("resources", ResourceLimits.from_config(old), ResourceLimits.from_config(new)),
+        ("placement", PlacementPolicy.from_config(old), PlacementPolicy.from_config(new)),
+    ):
+        if before != after:
+            change.roll = True
+            change.reasons.append(f"{setting} changed")
+
+    removed = sorted(
+        key for key in old if key not in new and f"{key} changed" not in change.reasons
+    )
+    if removed:
+        change.reasons.append(f"removed {', '.join(removed)}")
+    if not change.reasons and old != new:
+        change.reasons.append("settings changed")
+    if change.reasons:
+        change.action = "update"
+    return change
@@ -0,0 +1,330 @@
+"""Metric-driven autoscaling for agent pools."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
+
+import psutil
+
+from .config import AgentConfig, parse_duration, parse_size
+from .models import AgentProcess
+
+if TYPE_CHECKING:
+    from .orchestrator import AgentOrchestrator
+
+DEFAULT_AUTOSCALE_INTERVAL = 10.0  # seconds
+DEFAULT_SCALE_UP_COOLDOWN = 30.0  # seconds
+DEFAULT_SCALE_DOWN_COOLDOWN = 300.0  # seconds
+DEFAULT_HYSTERESIS = 0.2
+
+
+@dataclass(slots=True)
+class AutoscalePolicy:
+    """Autoscaling policy declared under ``agents.<type>.autoscale``.
+
+    ``target_steps`` is the number of pending plus in-flight workflow steps
+    one instance should carry. ``cpu_target`` (percent) and ``memory_target``
+    (RSS per instance) are optional resource ceilings that also drive scale-up.
+    """
+
+    min_instances: int = 1
+    max_instances: int = 1
+    target_steps: float = 1.0
+    cpu_target: float = 0.0
+    memory_target: int = 0
+    scale_up_cooldown: float = DEFAULT_SCALE_UP_COOLDOWN
+    scale_down_cooldown: float = DEFAULT_SCALE_DOWN_COOLDOWN
+    hysteresis: float = DEFAULT_HYSTERESIS
+    max_step: int = 0  # largest change per decision; 0 is unbounded
+    interval: float = DEFAULT_AUTOSCALE_INTERVAL
+
+    @classmethod
+    def from_config(cls, agent_config: AgentConfig) -> Optional["AutoscalePolicy"]:
+        raw = agent_config.get("autoscale")
+        if not raw or not raw.get("enabled", True):
+            return None
+
+        instances = int(agent_config.get("instances", 1))
+        min_instances = int(raw.get("min", 1))
+        max_instances = int(raw.get("max", max(min_instances, instances)))
+        if min_instances < 0 or max_instances < max(1, min_instances):
+            raise ValueError(
+                f"autoscale bounds must satisfy 0 <= min <= max and max >= 1"
+                f" (got min={min_instances}, max={max_instances})"
+            )
+
+        target_steps = float(raw.get("target_steps", 1.0))
+        hysteresis = float(raw.get("hysteresis", DEFAULT_HYSTERESIS))
+        if target_steps <= 0:
+            raise ValueError("autoscale.target_steps must be positive")
+        if not 0.0 <= hysteresis < 1.0:
+            raise ValueError("autoscale.hysteresis must be in [0, 1)")
+
+        memory_target = raw.get("memory_target")
+        return cls(
+            min_instances=min_instances,
+            max_instances=max_instances,
+            target_steps=target_steps,
+            cpu_target=float(raw.get("cpu_target", 0.0)),
+            memory_target=parse_size(memory_target) if memory_target is not None else 0,
+            scale_up_cooldown=parse_duration(
+                raw.get("scale_up_cooldown"), default=DEFAULT_SCALE_UP_COOLDOWN
+            ),
+            scale_down_cooldown=parse_duration(
+                raw.get("scale_down_cooldown"), default=DEFAULT_SCALE_DOWN_COOLDOWN
+            ),
+            hysteresis=hysteresis,
+            max_step=max(0, int(raw.get("max_step", 0))),
+            interval=parse_duration(raw.get("interval"), default=DEFAULT_AUTOSCALE_INTERVAL),
+        )
+
+
+@dataclass(slots=True)
+class PoolSignals:
+    """Point-in-time load of a single pool."""
+
+    instances: int
+    pending_steps: int = 0
+    inflight_steps: int = 0
+    cpu_percent: float = 0.0  # average per live instance
+    rss_bytes: int = 0  # average per live instance
+    busy_instances: int = 0  # instances running a workflow step
+
+
+@dataclass(slots=True)
+class ScalingState:
+    last_scale_up: float = -math.inf
+    last_scale_down: float = -math.inf
+
+
+def decide(policy: AutoscalePolicy, signals: PoolSignals, state: ScalingState, now: float) -> int:
+    """Return the instance delta the policy asks for (0 for no change)."""
+
+    current = signals.instances
+    demand = signals.pending_steps + signals.inflight_steps
+    desired = math.ceil(demand / policy.target_steps)
+    if policy.cpu_target and signals.cpu_percent > policy.cpu_target:
+        desired = max(desired, math.ceil(current * signals.cpu_percent / policy.cpu_target))
+    if policy.memory_target and signals.rss_bytes > policy.memory_target:
+        desired = max(desired, math.ceil(current * signals.rss_bytes / policy.memory_target))
+    desired = min(max(desired, policy.min_instances), policy.max_instances)
+
+    # Bounds are enforced immediately, regardless of cooldowns; above max,
+    # busy instances are only removed when max leaves no room for them.
+    if current < policy.min_instances:
+        delta = desired - current
+    elif current > policy.max_instances:
+        delta = max(desired, min(signals.busy_instances, policy.max_instances)) - current
+    elif desired > current:
+        if now - state.last_scale_up < policy.scale_up_cooldown:
+            return 0
+        delta = desired - current
+    elif desired < current:
+        # Only shrink once load has fallen clearly below capacity, and not
+        # shortly after any scaling decision, so bursts do not cause flapping.
+        if desired > current * (1.0 - policy.hysteresis):
+            return 0
+        if now - max(state.last_scale_up, state.last_scale_down) < policy.scale_down_cooldown:
+            return 0
+        # Never remove a busy instance for lack of load; idle ones are
+        # removed now and the rest once their steps finish.
+        delta = max(desired - current, signals.busy_instances - current)
+        if not delta:
+            return 0
+    else:
+        return 0
+
+    if policy.max_step:
+        delta = max(-policy.max_step, min(policy.max_step, delta))
+    return delta
+
+
+class DemandTracker:
+    """Pending and in-flight workflow steps per agent type."""
+
+    def __init__(self) -> None:
+        self._pending: Dict[str, int] = defaultdict(int)
+        self._inflight: Dict[str, int] = defaultdict(int)
+
+    def queued(self, agent_type: str, count: int = 1) -> None:
+        self._pending[agent_type] += count
+
+    def started(self, agent_type: str) -> None:
+        self._pending[agent_type] = max(0, self._pending[agent_type] - 1)
+        self._inflight[agent_type] += 1
+
+    def finished(self, agent_type: str) -> None:
+        self._inflight[agent_type] = max(0, self._inflight[agent_type] - 1)
+
+    def discard(self, agent_type: str, count: int = 1) -> None:
+        """Drop queued steps that will never start (e.g. the workflow failed)."""
+
+        self._pending[agent_type] = max(0, self._pending[agent_type] - count)
+
+    def snapshot(self, agent_type: str) -> Tuple[int, int]:
+        return self._pending.get(agent_type, 0), self._inflight.get(agent_type, 0)
+
+
+class Autoscaler:
+    """Periodically resize pools that declare an autoscale policy.
+
+    Runs on the daemon's event loop. Each tick samples demand from the
+    per-deployment :class:`DemandTracker` and CPU/RSS from psutil, applies
+    :func:`decide`, and calls ``AgentOrchestrator.scale_agents``.
+    """
+
+    def __init__(
+        self,
+        orchestrator: "AgentOrchestrator",
+        *,
+        lock: Optional[asyncio.Lock] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.orchestrator = orchestrator
+        self.logger = logging.getLogger(__name__)
+        self._lock = lock or asyncio.Lock()
+        self._clock = clock
+        self._demand: Dict[str, DemandTracker] = {}
+        self._states: Dict[Tuple[str, str], ScalingState] = {}
+        self._next_check: Dict[Tuple[str, str], float] = {}
+        self._samplers: Dict[Tuple[str, str], Dict[int, psutil.Process]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def demand(self, deployment_id: str) -> DemandTracker:
+        return self._demand.setdefault(deployment_id, DemandTracker())
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def tick(self) -> Dict[Tuple[str, str], int]:
+        """Evaluate every due pool once; returns the deltas that were applied."""
+
+        applied: Dict[Tuple[str, str], int] = {}
+        now = self._clock()
+        for deployment_id, agent_type, policy in self._policies():
+            key = (deployment_id, agent_type)
+            if now < self._next_check.get(key, 0.0):
+                continue
+            self._next_check[key] = now + policy.interval
+
+            pool = await self.orchestrator.get_agent_pool(agent_type, deployment_id=deployment_id)
+            if pool is None:
+                continue
+            signals = await self._sample(deployment_id, agent_type, pool.running_instances)
+            state = self._states.setdefault(key, ScalingState())
+            delta = decide(policy, signals, state, now)
+            if not delta:
+                continue
+
+            async with self._lock:
+                try:
+                    await self.orchestrator.scale_agents(
+                        agent_type, delta, deployment_id=deployment_id
+                    )
+                except Exception as exc:  # noqa: BLE001 - retry next interval
+                    self.logger.error(
+                        "Autoscaling %s/%s by %s failed: %s", deployment_id, agent_type, delta, exc
+                    )
+                    continue
+
+            if delta > 0:
+                state.last_scale_up = now
+            else:
+                state.last_scale_down = now
+            applied[key] = delta
+            self.logger.info(
+                "Autoscaled %s/%s by %+d (pending=%s, inflight=%s, cpu=%.0f%%)",
+                deployment_id,
+                agent_type,
+                delta,
+                signals.pending_steps,
+                signals.inflight_steps,
+                signals.cpu_percent,
+            )
+        return applied
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception as exc:  # noqa: BLE001 - keep the loop alive
+                self.logger.error("Autoscaler tick failed: %s", exc)
+            await asyncio.sleep(self._sleep_interval())
+
+    def _sleep_interval(self) -> float:
+        intervals = [policy.interval for _, _, policy in self._policies()]
+        return min(intervals, default=DEFAULT_AUTOSCALE_INTERVAL)
+
+    def _policies(self) -> Iterable[Tuple[str, str, AutoscalePolicy]]:
+        for deployment_id, deployment in list(self.orchestrator.deployments.items()):
+            for agent_type, agent_config in deployment.config.agents.items():
+                try:
+                    policy = AutoscalePolicy.from_config(agent_config)
+                except ValueError as exc:
+                    self.logger.warning("Ignoring autoscale policy for %s: %s", agent_type, exc)
+                    continue
+                if policy is not None:
+                    yield deployment_id, agent_type, policy
+
+    async def _sample(
+        self, deployment_id: str, agent_type: str, processes: List[AgentProcess]
+    ) -> PoolSignals:
+        pending, inflight = self.demand(deployment_id).snapshot(agent_type)
+        live = [process for process in processes if process.is_alive()]
+        samplers = self._samplers.setdefault((deployment_id, agent_type), {})
+        cpu, rss = await asyncio.to_thread(self._resource_usage, live, samplers)
+        return PoolSignals(
+            instances=len(processes),
+            pending_steps=pending,
+            inflight_steps=inflight,
+            cpu_percent=cpu,
+            rss_bytes=rss,
+            busy_instances=sum(1 for process in processes if process.active_steps),
+        )
+
+    @staticmethod
+    def _resource_usage(
+        processes: List[AgentProcess], samplers: Dict[int, psutil.Process]
+    ) -> Tuple[float, int]:
+        cpu_total = 0.0
+        rss_total = 0
+        sampled = 0
+        for process in processes:
+            # psutil measures CPU between consecutive calls on the same
+            # Process object, so samplers are kept across ticks.
+            sampler = samplers.get(process.pid)
+            try:
+                if sampler is None:
+                    sampler = samplers[process.pid] = psutil.Process(process.pid)
+                cpu_total += sampler.cpu_percent(interval=None)
+                rss_total += sampler.memory_info().rss
+                sampled += 1
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                samplers.pop(process.pid, None)
+
+        live_pids = {process.pid for process in processes}
+        for pid in [pid for pid in samplers if pid not in live_pids]:
+            del samplers[pid]
+        if not sampled:
+            return 0.0, 0
+        return cpu_total / sampled, rss_total // sampled
@@ -0,0 +1,166 @@
+"""Encoding of state files, with optional fast and compact formats.
+
+Plain JSON is the default and stays readable by older releases. When the
+optional libraries are installed, ``orjson`` speeds up JSON encoding and
+``msgpack`` or ``zstandard`` can be selected for smaller, faster files.
+Non-default formats are wrapped in a short header, so :func:`decode`
+recognises every file it may meet, including JSON written before codecs
+existed.
+
+File names do not change with the codec: ``state.json`` and
+``workflow_executions.json`` keep their names even when they hold an
+enveloped msgpack or compressed payload, so every reader finds them in the
+usual place and the header alone decides how to decode them. Such files
+are not JSON despite the suffix. Releases without codec support, ``jq``
+and other JSON tools cannot read them. Stay on the default codec where
+that matters.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import zlib
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+FORMAT_ENV = "AGENTSWARM_STATE_FORMAT"
+COMPRESSION_ENV = "AGENTSWARM_STATE_COMPRESSION"
+FORMATS = {"json", "msgpack"}
+COMPRESSIONS = {"none", "zlib", "zstd"}
+DEFAULT_FORMAT = "json"
+DEFAULT_COMPRESSION = "none"
+
+# Envelope: MAGIC, then one byte each for the format and the compression.
+# 0x93 can never start a JSON document.
+MAGIC = b"\x93ASW"
+_FORMAT_TAGS = {"json": b"j", "msgpack": b"m"}
+_COMPRESSION_TAGS = {"none": b"-", "zlib": b"z", "zstd": b"Z"}
+_HEADER_SIZE = len(MAGIC) + 2
+
+
+def json_dumps(data: Any, *, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode ``data`` as UTF-8 JSON, with orjson when it is installed."""
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, default=default, option=option)
+    if indent:
+        return json.dumps(data, indent=2, default=default).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), default=default).encode("utf-8")
+
+
+def json_loads(payload: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+class StateCodec:
+    """Encode and decode whole state files in one configured format.
+
+    ``format`` and ``compression`` default to ``$AGENTSWARM_STATE_FORMAT``
+    and ``$AGENTSWARM_STATE_COMPRESSION``. Decoding ignores both and follows
+    the header of the file being read.
+    """
+
+    def __init__(
+        self,
+        format: Optional[str] = None,
+        compression: Optional[str] = None,
+        *,
+        level: Optional[int] = None,
+    ) -> None:
+        self.format = format or os.environ.get(FORMAT_ENV) or DEFAULT_FORMAT
+        self.compression = compression or os.environ.get(COMPRESSION_ENV) or DEFAULT_COMPRESSION
+        self.level = level
+        if self.format not in FORMATS:
+            raise ValueError(
+                f"Unknown state format '{self.format}'. Expected one of: {', '.join(sorted(FORMATS))}"
+            )
+        if self.compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Unknown state compression '{self.compression}'. "
+                f"Expected one of: {', '.join(sorted(COMPRESSIONS))}"
+            )
+        _require(self.format)
+        _require(self.compression)
+
+    @property
+    def enveloped(self) -> bool:
+        return (self.format, self.compression) != ("json", "none")
+
+    def encode(self, data: Any, *, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        if not self.enveloped:
+            return json_dumps(data, indent=True, default=default)
+
+        if self.format == "msgpack":
+            payload = msgpack.packb(data, default=default, use_bin_type=True)
+        else:
+            payload = json_dumps(data, default=default)
+        if self.compression == "zlib":
+            payload = zlib.compress(payload, 6 if self.level is None else self.level)
+        elif self.compression == "zstd":
+            payload = zstandard.ZstdCompressor(level=3 if self.level is None else self.level).compress(payload)
+        return MAGIC + _FORMAT_TAGS[self.format] + _COMPRESSION_TAGS[self.compression] + payload
+
+    def decode(self, payload: bytes) -> Any:
+        return decode(payload)
+
+    def __repr__(self) -> str:
+        return f"StateCodec(format={self.format!r}, compression={self.compression!r})"
+
+
+def decode(payload: bytes) -> Any:
+    """Decode a state file written by any :class:`StateCodec`."""
+
+    if not payload.startswith(MAGIC):
+        return json_loads(payload)
+
+    format = _tag_name(_FORMAT_TAGS, payload[len(MAGIC):len(MAGIC) + 1], "format")
+    compression = _tag_name(_COMPRESSION_TAGS, payload[len(MAGIC) + 1:_HEADER_SIZE], "compression")
+    _require(format)
+    _require(compression)
+
+    body = payload[_HEADER_SIZE:]
+    if compression == "zlib":
+        body = zlib.decompress(body)
+    elif compression == "zstd":
+        body = zstandard.ZstdDecompressor().decompress(body)
+    if format == "msgpack":
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+    return json_loads(body)
+
+
+# ----------------------------------------------------------------------
+# Internal helpers
+# ----------------------------------------------------------------------
+_PACKAGES = {"msgpack": ("msgpack", lambda: msgpack), "zstd": ("zstandard", lambda: zstandard)}
+
+
+def _require(name: str) -> None:
+    if name in _PACKAGES:
+        package, module = _PACKAGES[name]
+        if module() is None:
+            raise ValueError(f"State {name} support requires the '{package}' package, which is not installed")
+
+
+def _tag_name(tags: dict, tag: bytes, kind: str) -> str:
+    for name, value in tags.items():
+        if value == tag:
+            return name
+    raise ValueError(f"Unknown state {kind} tag {tag!r} in file header")
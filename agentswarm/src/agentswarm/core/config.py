@@ -4,11 +4,18 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Mapping, Optional
 
+import hashlib
 import json
+import logging
+import os
+import shlex
 import yaml
 
+from .codec import StateCodec, decode
+from .persistence import atomic_write
+
 
 AgentConfig = Dict[str, Any]
 
@@ -20,6 +27,72 @@ DEFAULT_DEPLOYMENT_CONFIG: Dict[str, Any] = {
 
 SUPPORTED_CONFIG_EXTENSIONS = {".yaml", ".yml", ".json"}
 
+CONFIG_CACHE_ENV = "AGENTSWARM_CONFIG_CACHE"
+CONFIG_CACHE_DIRECTORY_NAME = "cache"
+# Bump when normalization or validation changes so stale entries are ignored.
+CONFIG_CACHE_VERSION = 2
+
+DEPLOYMENT_STRATEGIES = {"parallel", "sequential", "waves"}
+PLACEMENT_MODES = {"none", "spread", "pack"}
+
+_DURATION_UNITS = (("ms", 0.001), ("h", 3600.0), ("m", 60.0), ("s", 1.0))
+
+
+_SIZE_UNITS = (
+    ("kib", 1024),
+    ("mib", 1024**2),
+    ("gib", 1024**3),
+    ("kb", 1024),
+    ("mb", 1024**2),
+    ("gb", 1024**3),
+    ("k", 1024),
+    ("m", 1024**2),
+    ("g", 1024**3),
+    ("b", 1),
+)
+
+
+def parse_size(value: Any) -> int:
+    """Convert a size such as ``"2GB"`` or ``"512MiB"`` to bytes."""
+
+    if isinstance(value, (int, float)):
+        return int(value)
+
+    text = str(value).strip().lower()
+    for suffix, multiplier in _SIZE_UNITS:
+        if text.endswith(suffix):
+            number = text[: -len(suffix)].strip()
+            try:
+                return int(float(number) * multiplier)
+            except ValueError as exc:
+                raise ValueError(f"Invalid size '{value}'") from exc
+    try:
+        return int(float(text))
+    except ValueError as exc:
+        raise ValueError(f"Invalid size '{value}'") from exc
+
+
+def parse_duration(value: Any, *, default: float = 0.0) -> float:
+    """Convert a duration such as ``"30m"`` or ``"250ms"`` to seconds."""
+
+    if value is None or value == "":
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    text = str(value).strip().lower()
+    for suffix, multiplier in _DURATION_UNITS:
+        if text.endswith(suffix):
+            number = text[: -len(suffix)].strip()
+            try:
+                return float(number) * multiplier
+            except ValueError as exc:
+                raise ValueError(f"Invalid duration '{value}'") from exc
+    try:
+        return float(text)
+    except ValueError as exc:
+        raise ValueError(f"Invalid duration '{value}'") from exc
+
 
 def _deep_update(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
     """Return a recursively merged dictionary copy."""
@@ -33,6 +106,25 @@ def _deep_update(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, A
     return result
 
 
+def _config_path(file_path: str | Path) -> Path:
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Configuration file not found: {path}")
+
+    if path.suffix.lower() not in SUPPORTED_CONFIG_EXTENSIONS:
+        raise ValueError(
+            f"Unsupported config format '{path.suffix}'."
+            " Expected one of: .yaml, .yml, .json"
+        )
+    return path
+
+
+def _decode_config(path: Path, content: bytes) -> Dict[str, Any]:
+    if path.suffix.lower() in {".yaml", ".yml"}:
+        return yaml.safe_load(content) or {}
+    return json.loads(content) or {}
+
+
 @dataclass(slots=True)
 class SwarmConfig:
     """Configuration container for a swarm deployment."""
@@ -52,31 +144,42 @@ class SwarmConfig:
     # Construction helpers
     # ------------------------------------------------------------------
     @classmethod
-    def from_file(cls, file_path: str | Path) -> "SwarmConfig":
-        """Load configuration from a YAML or JSON file."""
-
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {path}")
-
-        if path.suffix.lower() not in SUPPORTED_CONFIG_EXTENSIONS:
-            raise ValueError(
-                f"Unsupported config format '{path.suffix}'."
-                " Expected one of: .yaml, .yml, .json"
-            )
-
-        with path.open("r", encoding="utf-8") as handle:
-            if path.suffix.lower() in {".yaml", ".yml"}:
-                data = yaml.safe_load(handle) or {}
-            else:
-                data = json.load(handle) or {}
+    def from_file(cls, file_path: str | Path, *, state_dir: Optional[Path] = None) -> "SwarmConfig":
+        """Load configuration from a YAML or JSON file.
+
+        With ``state_dir`` (the project's ``.agentswarm`` directory) the
+        validated config is cached under its ``cache`` directory, keyed by
+        the file's path, mtime and SHA-256, so unchanged files skip parsing
+        and validation. Nothing is written next to the config file itself,
+        which may live outside the project. ``$AGENTSWARM_CONFIG_CACHE``
+        set to ``0``/``off`` disables the cache.
+        """
+
+        path = _config_path(file_path)
+        cache = os.environ.get(CONFIG_CACHE_ENV, "on").lower() not in {"0", "off", "false", "no"}
+        if state_dir is None or not cache:
+            return cls._parse(path, path.read_bytes())
+        return _ConfigCache(path, Path(state_dir) / CONFIG_CACHE_DIRECTORY_NAME).load(cls)
 
+    @classmethod
+    def _parse(cls, path: Path, content: bytes) -> "SwarmConfig":
+        data = _decode_config(path, content)
         return cls(
             agents=data.get("agents", {}),
             deployment=data.get("deployment", {}),
             metadata=data.get("metadata", {}),
         )
 
+    @classmethod
+    def _from_validated(cls, data: Dict[str, Any]) -> "SwarmConfig":
+        """Rebuild a config that already passed normalization and validation."""
+
+        config = cls.__new__(cls)
+        config.agents = data["agents"]
+        config.deployment = data["deployment"]
+        config.metadata = data["metadata"]
+        return config
+
     @classmethod
     def from_instances(
         cls,
@@ -173,6 +276,57 @@ class SwarmConfig:
                     f"Agent '{agent_type}' must declare at least one instance"
                 )
 
+            command = config.get("command")
+            if command is not None and not (
+                isinstance(command, str)
+                or (isinstance(command, list) and all(isinstance(arg, (str, int, float)) for arg in command))
+            ):
+                raise ValueError(
+                    f"Agent '{agent_type}' command must be a string or a list of arguments"
+                )
+            if command is not None:
+                # Caught here rather than at spawn time, after a cgroup leaf
+                # and a log file have already been set up for the instance.
+                try:
+                    argv = shlex.split(command) if isinstance(command, str) else command
+                except ValueError as exc:
+                    raise ValueError(f"Agent '{agent_type}' command cannot be parsed: {exc}") from exc
+                if not argv:
+                    raise ValueError(f"Agent '{agent_type}' command must not be empty")
+
+            resources = config.get("resources") or {}
+            if resources.get("memory") is not None:
+                parse_size(resources["memory"])
+            cpu_weight = resources.get("cpu_weight")
+            if cpu_weight is not None and (
+                not isinstance(cpu_weight, int) or not 1 <= cpu_weight <= 10000
+            ):
+                raise ValueError(
+                    f"Agent '{agent_type}' resources.cpu_weight must be between 1 and 10000"
+                )
+
+            placement = config.get("placement") or {}
+            if isinstance(placement, str):
+                placement = {"mode": placement}
+            if placement.get("mode", "spread") not in PLACEMENT_MODES:
+                raise ValueError(
+                    f"Agent '{agent_type}' has unknown placement mode '{placement['mode']}'."
+                    f" Expected one of: {', '.join(sorted(PLACEMENT_MODES))}"
+                )
+
+        strategy = self.deployment.get("strategy", "parallel")
+        if strategy not in DEPLOYMENT_STRATEGIES:
+            raise ValueError(
+                f"Unknown deployment strategy '{strategy}'."
+                f" Expected one of: {', '.join(sorted(DEPLOYMENT_STRATEGIES))}"
+            )
+
+        max_concurrent = self.deployment.get("max_concurrent", 1)
+        if not isinstance(max_concurrent, int) or max_concurrent < 1:
+            raise ValueError("deployment.max_concurrent must be a positive integer")
+
+        parse_duration(self.deployment.get("launch_jitter"))
+
         return True
 
     def get_total_instances(self) -> int:
@@ -185,6 +339,92 @@ class SwarmConfig:
         return self.agents.items()
 
 
+class _ConfigCache:
+    """Validated configs cached per config file.
+
+    An entry is used only while the file keeps the path, mtime and content
+    hash it was built from; anything else is a miss and the entry is
+    rewritten after the file is parsed again. Entries that cannot be read
+    or written are ignored, since the cache is only an optimization.
+    """
+
+    def __init__(self, path: Path, cache_dir: Path) -> None:
+        self.path = path.resolve()
+        self.logger = logging.getLogger(__name__)
+        key = hashlib.sha256(str(self.path).encode("utf-8")).hexdigest()[:16]
+        self.entry_path = cache_dir / f"config-{key}.bin"
+
+    def load(self, config_cls: type[SwarmConfig]) -> SwarmConfig:
+        content = self.path.read_bytes()
+        key = {
+            "version": CONFIG_CACHE_VERSION,
+            "path": str(self.path),
+            "mtime_ns": self.path.stat().st_mtime_ns,
+            "sha256": hashlib.sha256(content).hexdigest(),
+        }
+
+        entry = self._read()
+        if entry is not None and all(entry.get(name) == value for name, value in key.items()):
+            return config_cls._from_validated(entry["config"])
+
+        config = config_cls._parse(self.path, content)
+        self._write(key | {"config": config.to_dict()})
+        return config
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _read(self) -> Optional[Dict[str, Any]]:
+        try:
+            entry = decode(self.entry_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # noqa: BLE001 - a broken entry is just a miss
+            self.logger.debug("Ignoring unreadable config cache %s: %s", self.entry_path, exc)
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        try:
+            payload = StateCodec().encode(entry)
+            # YAML values without a JSON equivalent (dates, for example)
+            # would not come back as they went in.
+            if decode(payload) != entry:
+                return
+            self.entry_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(self.entry_path, payload, fsync=False)
+        except Exception as exc:  # noqa: BLE001 - caching is best effort
+            self.logger.debug("Could not write config cache %s: %s", self.entry_path, exc)
+
+
+def load_config_data(file_path: str | Path) -> Dict[str, Any]:
+    """Read a YAML or JSON config file as written, without defaults.
+
+    ``apply`` layers this over a running deployment; a :class:`SwarmConfig`
+    would fill in every default and reset what the deployment overrode.
+    """
+
+    path = _config_path(file_path)
+    return _decode_config(path, path.read_bytes())
+
+
+def has_instance_budgets(config: Mapping[str, Any]) -> bool:
+    """Whether a config sets a watchdog budget for any agent.
+
+    Works on plain config data, so the watchdog can skip recorded deployments
+    without budgets instead of hydrating them to find out.
+    """
+
+    if (config.get("deployment") or {}).get("instance_timeout"):
+        return True
+    return any(
+        (agent_config.get("resources") or {}).get(key)
+        for agent_config in (config.get("agents") or {}).values()
+        if isinstance(agent_config, Mapping)
+        for key in ("timeout", "rss_growth")
+    )
+
+
 def create_default_config() -> SwarmConfig:
     """Create an opinionated default configuration."""
 
@@ -217,9 +457,27 @@ def create_example_config() -> str:
 agents:
   codex:
     instances: 3
+    standby:
+      count: 1
+      idle_timeout: "15m"
+      memory_budget: "2GB"
+    autoscale:
+      min: 2
+      max: 8
+      target_steps: 2
+      cpu_target: 80
+      scale_up_cooldown: "30s"
+      scale_down_cooldown: "5m"
+    placement:
+      mode: spread
+      cpus_per_instance: 2
     resources:
       memory: "2GB"
+      cpu_weight: 200
+      pids: 256
       timeout: "30m"
+      rss_growth: "512MB"
+      on_violation: recycle
     tasks:
       - frontend_development
       - testing
@@ -233,6 +491,7 @@ agents:
       - documentation
   gemini:
     instances: 1
+    command: ["gemini", "--instance", "{instance_id}"]
     resources:
       memory: "1GB"
       timeout: "30m"
@@ -0,0 +1,390 @@
+"""Long-running orchestrator daemon with a JSON-over-Unix-socket control API.
+
+The daemon owns one :class:`AgentOrchestrator` and its event loop for the
+lifetime of the process, so live process handles, pidfd watchers and pool
+indexes survive between CLI commands; it also keeps agent logs within their
+size limits. Clients send one JSON object
+per line::
+
+    {"method": "scale", "params": {"agent_type": "codex", "delta": 2}}
+
+and receive one JSON object per line in reply::
+
+    {"ok": true, "result": {...}}
+    {"ok": false, "error": "Agent type codex not found ..."}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import signal
+import socket
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .autoscaler import Autoscaler
+from .config import SwarmConfig
+from .orchestrator import AgentOrchestrator
+from .state import STATE_DIRECTORY_NAME, StateBackend
+from .watchdog import Watchdog
+
+DAEMON_SOCKET_NAME = "daemon.sock"
+LOG_ROTATE_INTERVAL = 30.0  # seconds
+
+# Unix socket paths are limited to ~108 bytes on Linux.
+_MAX_SOCKET_PATH = 100
+_MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+Handler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class DaemonError(RuntimeError):
+    """Raised by DaemonClient when the daemon reports a failed request."""
+
+
+class DaemonUnavailable(ConnectionError):
+    """Raised when no daemon is listening on the control socket."""
+
+
+def daemon_socket_path(project_root: Path) -> Path:
+    return Path(project_root) / STATE_DIRECTORY_NAME / DAEMON_SOCKET_NAME
+
+
+def serialize_pool_health(health: Any) -> Dict[str, Any]:
+    return {
+        "status": health.status,
+        "total_instances": health.total_instances,
+        "healthy": health.healthy_instances,
+        "unhealthy": health.unhealthy_instances,
+        "details": health.details,
+    }
+
+
+class OrchestratorDaemon:
+    """Serve orchestrator operations to CLI clients over a Unix socket."""
+
+    def __init__(
+        self,
+        orchestrator: AgentOrchestrator,
+        *,
+        socket_path: Optional[Path] = None,
+        autoscale: bool = True,
+        watchdog: bool = True,
+    ) -> None:
+        self.orchestrator = orchestrator
+        # The daemon is a process of its own and may leave a busy cgroup root
+        # for a supervisor leaf; one-shot CLI commands never move themselves.
+        orchestrator.resources.supervise = True
+        self.socket_path = socket_path or daemon_socket_path(orchestrator.project_root)
+        self.logger = logging.getLogger(__name__)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._stopped: Optional[asyncio.Event] = None
+        self._clients: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+        self._log_rotation: Optional[asyncio.Task] = None
+        # Orchestrator mutations are not re-entrant (instance id reservation,
+        # pool bookkeeping), so they are serialized across clients.
+        self._mutation_lock = asyncio.Lock()
+        self.autoscaler = Autoscaler(orchestrator, lock=self._mutation_lock) if autoscale else None
+        self.watchdog = Watchdog(orchestrator, lock=self._mutation_lock) if watchdog else None
+        self._handlers: Dict[str, Handler] = {
+            "ping": self._ping,
+            "deploy": self._deploy,
+            "scale": self._scale,
+            "apply": self._apply,
+            "health": self._health,
+            "deployment": self._deployment,
+            "deployments": self._deployments,
+            "restart": self._restart,
+            "shutdown": self._shutdown,
+            "logs": self._logs,
+            "workflow.run": self._workflow_run,
+            "stop": self._stop,
+        }
+
+    def register(self, method: str, handler: Handler) -> None:
+        """Expose an additional API method."""
+
+        self._handlers[method] = handler
+
+    async def serve_forever(self) -> None:
+        self._stopped = asyncio.Event()
+        self._prepare_socket()
+        self._server = await asyncio.start_unix_server(
+            self._handle_client, path=str(self.socket_path), limit=_MAX_REQUEST_BYTES
+        )
+        os.chmod(self.socket_path, 0o600)
+
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(signum, self._stopped.set)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        latest = self.orchestrator.resolve_deployment_id(None, required=False)
+        if latest is not None:
+            # The latest deployment is the one autoscaling and workflows target.
+            self.orchestrator.get_deployment(latest)
+        self.orchestrator.watch_hydrated()
+        if self.autoscaler is not None:
+            self.autoscaler.start()
+        if self.watchdog is not None:
+            self.watchdog.start()
+        self._log_rotation = asyncio.create_task(self._rotate_logs())
+        self.logger.info("AgentSwarm daemon listening on %s", self.socket_path)
+        try:
+            await self._stopped.wait()
+        finally:
+            await self._shutdown_server()
+
+    async def _shutdown_server(self) -> None:
+        if self._log_rotation is not None:
+            self._log_rotation.cancel()
+            await asyncio.gather(self._log_rotation, return_exceptions=True)
+        if self.autoscaler is not None:
+            await self.autoscaler.stop()
+        if self.watchdog is not None:
+            await self.watchdog.stop()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        # Closing the transports ends each pending readline with EOF, so the
+        # client handlers finish on their own instead of being cancelled.
+        for writer in list(self._clients):
+            writer.close()
+        await asyncio.gather(*self._clients.values(), return_exceptions=True)
+        self.socket_path.unlink(missing_ok=True)
+        await self.orchestrator.settle()
+        # Agents write their own log files, so releasing the orchestrator's
+        # watchers leaves them running and logging.
+        self.orchestrator.close()
+        self.logger.info("AgentSwarm daemon stopped")
+
+    async def _rotate_logs(self) -> None:
+        while True:
+            await asyncio.sleep(LOG_ROTATE_INTERVAL)
+            try:
+                await self.orchestrator.rotate_logs()
+            except Exception as exc:  # noqa: BLE001 - keep rotating
+                self.logger.error("Log rotation failed: %s", exc)
+
+    def _prepare_socket(self) -> None:
+        if len(str(self.socket_path)) > _MAX_SOCKET_PATH:
+            raise ValueError(f"Socket path too long for a Unix socket: {self.socket_path}")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            if DaemonClient(self.socket_path).is_running():
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+            self.socket_path.unlink()  # Stale socket from a crashed daemon
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._clients[writer] = asyncio.current_task()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self._dispatch(line)
+                writer.write(json.dumps(response, default=str).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._clients.pop(writer, None)
+            writer.close()
+
+    async def _dispatch(self, line: bytes) -> Dict[str, Any]:
+        try:
+            request = json.loads(line)
+            method = request["method"]
+            params = request.get("params") or {}
+        except (ValueError, KeyError, TypeError):
+            return {"ok": False, "error": "Malformed request"}
+
+        handler = self._handlers.get(method)
+        if handler is None:
+            return {"ok": False, "error": f"Unknown method '{method}'"}
+
+        try:
+            return {"ok": True, "result": await handler(params)}
+        except Exception as exc:  # noqa: BLE001 - reported to the client
+            self.logger.exception("Daemon request %s failed", method)
+            return {"ok": False, "error": str(exc)}
+
+    # ------------------------------------------------------------------
+    # API methods
+    # ------------------------------------------------------------------
+    async def _ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"pid": os.getpid(), "deployments": len(self.orchestrator.deployment_summaries())}
+
+    async def _deploy(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        config_dict = params["config"]
+        config = SwarmConfig(
+            agents=config_dict.get("agents", {}),
+            deployment=config_dict.get("deployment", {}),
+            metadata=config_dict.get("metadata", {}),
+        )
+        async with self._mutation_lock:
+            deployment = await self.orchestrator.deploy_swarm(config)
+        return StateBackend._serialize_deployment(deployment)
+
+    async def _scale(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        async with self._mutation_lock:
+            changed = await self.orchestrator.scale_agents(
+                params["agent_type"],
+                int(params["delta"]),
+                deployment_id=params.get("deployment_id"),
+            )
+        return {"changed": [StateBackend._serialize_process(proc) for proc in changed]}
+
+    async def _apply(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        async with self._mutation_lock:
+            plan = await self.orchestrator.apply_config(
+                params["config"],
+                deployment_id=params.get("deployment_id"),
+                prune=bool(params.get("prune", False)),
+                dry_run=bool(params.get("dry_run", False)),
+            )
+        return plan.to_dict()
+
+    async def _health(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        status = await self.orchestrator.health_check(params.get("deployment_id"))
+        return {key: serialize_pool_health(health) for key, health in status.items()}
+
+    async def _deployment(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        deployment_id = self.orchestrator.resolve_deployment_id(
+            params.get("deployment_id"), required=False
+        )
+        if deployment_id is None:
+            return None
+        try:
+            deployment = self.orchestrator.get_deployment(deployment_id)
+        except ValueError:
+            return None
+        return StateBackend._serialize_deployment(deployment)
+
+    async def _deployments(self, params: Dict[str, Any]) -> Any:
+        return [
+            {
+                "deployment_id": summary.deployment_id,
+                "start_time": summary.start_time,
+                "agents": summary.agent_counts,
+                "standby": summary.standby_counts,
+            }
+            for summary in self.orchestrator.deployment_summaries()
+        ]
+
+    async def _restart(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        async with self._mutation_lock:
+            replaced = await self.orchestrator.rolling_restart(
+                params["agent_type"],
+                deployment_id=params.get("deployment_id"),
+                max_unavailable=params.get("max_unavailable"),
+                min_available=params.get("min_available"),
+            )
+        return {"replaced": [StateBackend._serialize_process(proc) for proc in replaced]}
+
+    async def _shutdown(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        async with self._mutation_lock:
+            await self.orchestrator.shutdown_deployment(
+                params["deployment_id"], force=bool(params.get("force", False))
+            )
+        return {"deployment_id": params["deployment_id"]}
+
+    async def _logs(self, params: Dict[str, Any]) -> Any:
+        return self.orchestrator.get_instance_logs(
+            params["agent_type"],
+            int(params["instance_id"]),
+            lines=int(params.get("lines", 100)),
+            deployment_id=params.get("deployment_id"),
+        )
+
+    async def _workflow_run(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        from ..workflows.cache import StepCache
+        from ..workflows.models import AgentWorkflowExecutor
+        from ..workflows.orchestrator import WorkflowManager, WorkflowOrchestrator
+
+        deployment_id = self.orchestrator.resolve_deployment_id(params.get("deployment_id"))
+        deployment = self.orchestrator.get_deployment(deployment_id)
+        executor = AgentWorkflowExecutor(deployment.agents)
+        workflow_orchestrator = WorkflowOrchestrator(
+            executor,
+            state_dir=self.orchestrator.project_root / "workflow_state",
+            demand=self.autoscaler.demand(deployment_id) if self.autoscaler else None,
+            max_concurrency=params.get("max_concurrency"),
+            step_cache=StepCache.for_project(self.orchestrator.project_root) if params.get("cache") else None,
+        )
+        execution = await WorkflowManager(workflow_orchestrator).run_workflow_by_name(
+            params["name"], params.get("context") or {}
+        )
+        return {"execution_id": execution.id}
+
+    async def _stop(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if self._stopped is not None:
+            # Reply first; the server shuts down once the response is sent.
+            asyncio.get_running_loop().call_soon(self._stopped.set)
+        return {"stopping": True}
+
+
+class DaemonClient:
+    """Synchronous client used by CLI commands; one round trip per call."""
+
+    def __init__(self, socket_path: Path, *, timeout: Optional[float] = 30.0) -> None:
+        self.socket_path = Path(socket_path)
+        self.timeout = timeout
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> Optional["DaemonClient"]:
+        """Return a client if a daemon is serving ``project_root``."""
+
+        path = daemon_socket_path(project_root)
+        if not path.exists():
+            return None
+        client = cls(path)
+        return client if client.is_running() else None
+
+    def is_running(self) -> bool:
+        try:
+            self.call("ping", timeout=2.0)
+        except (DaemonUnavailable, DaemonError):
+            return False
+        return True
+
+    def call(self, method: str, *, timeout: Optional[float] = ..., **params: Any) -> Any:
+        if timeout is ...:
+            timeout = self.timeout
+        payload = json.dumps({"method": method, "params": params}, default=str).encode("utf-8")
+
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(timeout)
+                sock.connect(str(self.socket_path))
+                sock.sendall(payload + b"\n")
+                response = self._read_line(sock)
+        except (FileNotFoundError, ConnectionRefusedError) as exc:
+            raise DaemonUnavailable(f"No daemon listening on {self.socket_path}") from exc
+        except OSError as exc:
+            raise DaemonUnavailable(f"Daemon connection failed: {exc}") from exc
+
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "Unknown daemon error"))
+        return response.get("result")
+
+    @staticmethod
+    def _read_line(sock: socket.socket) -> Dict[str, Any]:
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+        if not chunks:
+            raise DaemonUnavailable("Daemon closed the connection without replying")
+        return json.loads(b"".join(chunks))
@@ -0,0 +1,180 @@
+"""Agent output capture: per-instance log files written directly by agents."""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import AgentConfig, parse_size
+
+LOG_DIRECTORY_NAME = "logs"
+
+DEFAULT_MAX_LOG_BYTES = 10 * 1024 * 1024
+DEFAULT_LOG_BACKUPS = 3
+
+
+class RotatingLogFile:
+    """Size-rotated log file (``name.log`` -> ``name.log.1``...) owned by an agent.
+
+    The agent writes to the file itself through an ``O_APPEND`` descriptor,
+    so nothing in this process sits between the agent and its output. Since
+    the agent keeps that descriptor open, a live log is rotated by copying it
+    to ``.1`` and truncating it in place (logrotate's ``copytruncate``); lines
+    written between the copy and the truncate are lost.
+    """
+
+    def __init__(self, path: Path, *, max_bytes: int, backup_count: int) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+    def open_for_writer(self) -> int:
+        """Start a fresh file for a new writer and return an fd for its stdout/stderr.
+
+        Output of the previous process in this slot moves to the first backup,
+        so the live file only ever holds the current process's output.
+        """
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self._size() > 0:
+            self._rotate(copy=False)
+        return os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_CLOEXEC, 0o644)
+
+    def rotate_if_needed(self) -> bool:
+        if not self.max_bytes or self._size() <= self.max_bytes:
+            return False
+        self._rotate(copy=True)
+        return True
+
+    def _size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _rotate(self, *, copy: bool) -> None:
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = self.path.with_name(f"{self.path.name}.{index}")
+                if source.exists():
+                    os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+            first_backup = self.path.with_name(f"{self.path.name}.1")
+            if copy:
+                shutil.copyfile(self.path, first_backup)
+            else:
+                os.replace(self.path, first_backup)
+                return
+        elif not copy:
+            self.path.unlink(missing_ok=True)
+            return
+        os.truncate(self.path, 0)
+
+
+class AgentLogs:
+    """Per-instance log files under ``log_root``.
+
+    Agents get their log file as stdout and stderr when they are spawned, so
+    output keeps being captured after the CLI command or daemon that started
+    them exits. Size limits are enforced by :meth:`rotate`, which the daemon
+    runs periodically and one-shot commands run on exit; without a daemon a
+    busy agent's log can outgrow ``max_size`` between commands.
+
+    All methods touch the filesystem and are meant to run off the event loop.
+    """
+
+    def __init__(
+        self,
+        log_root: Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_LOG_BYTES,
+        backup_count: int = DEFAULT_LOG_BACKUPS,
+    ) -> None:
+        self.log_root = log_root
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.logger = logging.getLogger(__name__)
+        self._files: Dict[Path, RotatingLogFile] = {}
+
+    def log_path(self, deployment_id: str, agent_type: str, instance_id: int) -> Path:
+        return self.log_root / deployment_id / f"{agent_type}-{instance_id}.log"
+
+    def open(
+        self,
+        deployment_id: str,
+        agent_type: str,
+        instance_id: int,
+        agent_config: Optional[AgentConfig] = None,
+    ) -> int:
+        """Return a write fd for a new agent process; the caller closes its copy."""
+
+        return self.track(deployment_id, agent_type, instance_id, agent_config).open_for_writer()
+
+    def track(
+        self,
+        deployment_id: str,
+        agent_type: str,
+        instance_id: int,
+        agent_config: Optional[AgentConfig] = None,
+    ) -> RotatingLogFile:
+        """Remember the log limits configured for an instance's file."""
+
+        path = self.log_path(deployment_id, agent_type, instance_id)
+        options = self._log_options(agent_config or {})
+        log = RotatingLogFile(path, max_bytes=options["max_bytes"], backup_count=options["backup_count"])
+        self._files[path] = log
+        return log
+
+    def tail(self, deployment_id: str, agent_type: str, instance_id: int, lines: int = 100) -> List[str]:
+        return read_log_tail(self.log_path(deployment_id, agent_type, instance_id), lines)
+
+    def rotate(self) -> int:
+        """Rotate every log under ``log_root`` that outgrew its limit."""
+
+        rotated = 0
+        for path in self.log_root.glob("*/*.log"):
+            log = self._files.get(path)
+            if log is None:
+                log = RotatingLogFile(path, max_bytes=self.max_bytes, backup_count=self.backup_count)
+            try:
+                rotated += log.rotate_if_needed()
+            except OSError as exc:
+                self.logger.warning("Could not rotate %s: %s", path, exc)
+        return rotated
+
+    def forget(self, deployment_id: str) -> None:
+        """Drop the limits remembered for a deployment that has been shut down."""
+
+        directory = self.log_root / deployment_id
+        for path in [path for path in self._files if path.parent == directory]:
+            del self._files[path]
+
+    def _log_options(self, agent_config: AgentConfig) -> Dict[str, int]:
+        overrides: Dict[str, Any] = agent_config.get("logs", {}) or {}
+        max_size = overrides.get("max_size")
+        return {
+            "max_bytes": parse_size(max_size) if max_size is not None else self.max_bytes,
+            "backup_count": int(overrides.get("backups", self.backup_count)),
+        }
+
+
+def read_log_tail(path: Path, lines: int = 100, *, chunk_size: int = 8192) -> List[str]:
+    """Read the last ``lines`` lines of a log file without loading all of it."""
+
+    if lines <= 0 or not path.exists():
+        return []
+
+    with path.open("rb") as handle:
+        handle.seek(0, os.SEEK_END)
+        position = handle.tell()
+        data = b""
+        while position > 0 and data.count(b"\n") <= lines:
+            step = min(chunk_size, position)
+            position -= step
+            handle.seek(position)
+            data = handle.read(step) + data
+
+    text = data.decode("utf-8", errors="replace")
+    return text.splitlines()[-lines:]
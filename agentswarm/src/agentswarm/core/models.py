@@ -21,11 +21,32 @@ class AgentProcess:
     cwd: Optional[str] = None
     env: Optional[Dict[str, str]] = None
     start_time: float = field(default_factory=time.time)
+    log_path: Optional[str] = None
+    exit_code: Optional[int] = None
+    exit_time: Optional[float] = None
+    cgroup: Optional[str] = None
+    cpus: Optional[str] = None  # pinned CPUs in cpulist format, e.g. "0-3"
     handle: Optional[subprocess.Popen] = field(default=None, repr=False)
+    # Workflow steps currently running on this instance; not persisted.
+    active_steps: int = field(default=0, repr=False)
+    # Event loop a ProcessWatcher registered this process with; exits are
+    # only recorded while that loop runs.
+    watch_loop: Optional[Any] = field(default=None, repr=False)
+
+    @property
+    def watched(self) -> bool:
+        return self.watch_loop is not None and self.watch_loop.is_running()
 
     def is_alive(self) -> bool:
-        if self.handle is not None and self.handle.poll() is None:
+        # Exits of watched processes are recorded by ProcessWatcher as they
+        # happen, so their liveness is answered without a syscall. Once the
+        # watcher's loop has stopped, fall back to probing the process.
+        if self.exit_time is not None:
+            return False
+        if self.watched:
             return True
+        if self.handle is not None:
+            return self.handle.poll() is None
         if self.pid <= 0:
             return False
         try:
@@ -35,12 +56,14 @@ class AgentProcess:
         return True
 
     def terminate(self, *, graceful: bool = True) -> None:
-        if self.handle is not None and self.handle.poll() is None:
-            if graceful:
-                self.handle.terminate()
-            else:
-                self.handle.kill()
-        else:
+        if self.handle is not None:
+            # Never signal a reaped child by pid: the pid may have been reused.
+            if self.handle.poll() is None:
+                if graceful:
+                    self.handle.terminate()
+                else:
+                    self.handle.kill()
+        elif self.pid > 0:
             try:
                 if graceful:
                     os.kill(self.pid, 15)
@@ -59,3 +82,22 @@ class SwarmDeployment:
     config: Any  # SwarmConfig, but avoid circular imports
     deployment_id: str
     start_time: str
+    standby: Dict[str, List[AgentProcess]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class DeploymentSummary:
+    """Lightweight index entry for a recorded deployment."""
+
+    deployment_id: str
+    start_time: str
+    agent_counts: Dict[str, int] = field(default_factory=dict)
+    standby_counts: Dict[str, int] = field(default_factory=dict)
+    # CPU pins (cpulist format) of instances that have not exited.
+    pinned_cpus: List[str] = field(default_factory=list)
+    # Whether any agent has a watchdog budget (see ``has_instance_budgets``).
+    budgeted: bool = False
+
+    @property
+    def total_instances(self) -> int:
+        return sum(self.agent_counts.values())
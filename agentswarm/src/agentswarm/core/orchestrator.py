@@ -4,15 +4,30 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import re
+import shlex
 import subprocess
+import time
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
-from .agent_pool import AgentPool
-from .config import AgentConfig, SwarmConfig
-from .models import AgentProcess, SwarmDeployment
-from .state import STATE_DIRECTORY_NAME, SwarmStateStore
+from .agent_pool import DEFAULT_READINESS_TIMEOUT, AgentPool, LaunchThrottle, Readiness
+from .apply import ApplyPlan, plan_apply
+from .config import AgentConfig, SwarmConfig, has_instance_budgets, parse_duration
+from .logs import LOG_DIRECTORY_NAME, AgentLogs
+from .models import AgentProcess, DeploymentSummary, SwarmDeployment
+from .placement import CpuPlacer, PlacementPolicy, format_cpulist, parse_cpulist, pinning
+from .resources import ResourceLimits, ResourceManager
+from .spawner import AgentSpawner, format_command
+from .state import STATE_DIRECTORY_NAME, StateBackend, open_state_store, thaw
+from .watcher import ProcessWatcher
+
+DEFAULT_SHUTDOWN_GRACE = 5.0  # seconds
+_EXIT_POLL_INTERVAL = 0.05  # seconds
+_KILL_REAP_TIMEOUT = 1.0  # seconds
+_READINESS_LOG_LINES = 200
 
 
 class AgentOrchestrator:
@@ -22,20 +37,32 @@ class AgentOrchestrator:
         self,
         *,
         project_root: Optional[Path] = None,
-        state_store: Optional[SwarmStateStore] = None,
+        state_store: Optional[StateBackend] = None,
     ) -> None:
         self.logger = logging.getLogger(__name__)
         self.project_root = Path(project_root).resolve() if project_root else Path.cwd()
         if state_store is None:
             state_dir = self.project_root / STATE_DIRECTORY_NAME
-            self.state_store = SwarmStateStore(state_dir)
+            self.state_store = open_state_store(state_dir)
         else:
             self.state_store = state_store
 
+        self.spawner = AgentSpawner()
+        self.logs = AgentLogs(self.state_store.base_path / LOG_DIRECTORY_NAME)
+        self.watcher = ProcessWatcher(on_exit=self._on_process_exit)
+        self.resources = ResourceManager()
+        self.placer = CpuPlacer()
         self.pools: Dict[Tuple[str, str], AgentPool] = {}
+        # Materialized deployments; the index covers everything recorded and
+        # deployments are hydrated from state the first time they are used.
         self.deployments: Dict[str, SwarmDeployment] = {}
+        self._index: Dict[str, DeploymentSummary] = {}
+        # Hydrated processes are registered with the watcher lazily, once an
+        # event loop is running.
+        self._unwatched: List[AgentProcess] = []
+        self._background: Set[asyncio.Task] = set()
 
-        self._hydrate_from_state()
+        self._load_index()
 
     # ------------------------------------------------------------------
     # Deployment lifecycle
@@ -45,11 +72,27 @@ class AgentOrchestrator:
         self.logger.info("Deploying swarm %s", deployment_id)
 
         agents: Dict[str, List[AgentProcess]] = {}
-
-        for agent_type, agent_config in config.iter_agents():
-            pool = self._ensure_pool(deployment_id, agent_type, agent_config)
-            created, _ = await pool.scale(agent_config.get("instances", 1))
-            agents[agent_type] = list(pool.running_instances)
+        throttle = LaunchThrottle.from_deployment(config.deployment)
+
+        # Launch every pool at once; the shared throttle caps total concurrency.
+        pools = [
+            (agent_type, agent_config, self._ensure_pool(deployment_id, agent_type, agent_config))
+            for agent_type, agent_config in config.iter_agents()
+        ]
+        try:
+            results = await _gather_all(
+                pool.scale(agent_config.get("instances", 1), throttle=throttle)
+                for _, agent_config, pool in pools
+            )
+            await _gather_all(pool.fill_standby(throttle=throttle) for _, _, pool in pools)
+        except BaseException:
+            # Nothing is recorded for a failed deployment, so stop whatever
+            # the other pools already launched instead of orphaning it.
+            await self._discard_pools(deployment_id, [pool for _, _, pool in pools], config)
+            raise
+
+        for (agent_type, _, pool), (created, _) in zip(pools, results):
+            agents[agent_type] = pool.running_instances
             self.logger.debug(
                 "Provisioned %s %s instances", len(created), agent_type
             )
@@ -59,9 +102,15 @@ class AgentOrchestrator:
             config=config,
             deployment_id=deployment_id,
             start_time=datetime.now(UTC).isoformat(),
+            standby={
+                agent_type: list(pool.standby_instances)
+                for agent_type, _, pool in pools
+                if pool.standby_instances
+            },
         )
 
         self.deployments[deployment_id] = deployment
+        self._index[deployment_id] = self._summarize(deployment)
         self._persist_state(deployment_id)
         return deployment
 
@@ -75,110 +124,472 @@ class AgentOrchestrator:
         if delta == 0:
             return []
 
-        target_deployment = self._resolve_deployment_id(deployment_id)
+        target_deployment = self.resolve_deployment_id(deployment_id)
         pool = self._get_pool(target_deployment, agent_type)
-        created, removed = await pool.scale(delta)
+        deployment = self.deployments[target_deployment]
+        throttle = LaunchThrottle.from_deployment(deployment.config.deployment)
+        try:
+            created, removed = await pool.scale(delta, throttle=throttle)
+        finally:
+            # A partly failed scale-up still recorded the instances it started.
+            self._sync_pool(deployment, pool)
+            self._persist_pool(target_deployment, pool)
+
+        if delta > 0 and pool.standby.count:
+            self._schedule_standby_refill(target_deployment, pool)
+        self.logger.info(
+            "Scaled deployment %s agent %s by %s", target_deployment, agent_type, delta
+        )
+        return created if delta > 0 else removed
 
+    async def rolling_restart(
+        self,
+        agent_type: str,
+        *,
+        deployment_id: Optional[str] = None,
+        max_unavailable: Optional[int] = None,
+        min_available: Optional[int] = None,
+    ) -> List[AgentProcess]:
+        """Restart a pool in place; defaults come from ``agents.<type>.restart``."""
+
+        target_deployment = self.resolve_deployment_id(deployment_id)
+        pool = self._get_pool(target_deployment, agent_type)
         deployment = self.deployments[target_deployment]
-        deployment.agents.setdefault(agent_type, [])
+        restart_config = pool.agent_config.get("restart") or {}
+        if max_unavailable is None:
+            max_unavailable = int(restart_config.get("max_unavailable", 1))
+        if min_available is None:
+            min_available = int(restart_config.get("min_available", 0))
+        readiness, timeout = self._readiness_probe(target_deployment, agent_type, pool.agent_config)
+
+        try:
+            replaced = await pool.rolling_restart(
+                max_unavailable=max_unavailable,
+                min_available=min_available,
+                readiness=readiness,
+                readiness_timeout=timeout,
+                throttle=LaunchThrottle.from_deployment(deployment.config.deployment),
+            )
+        finally:
+            self._sync_pool(deployment, pool)
+            self._persist_pool(target_deployment, pool)
+        return replaced
 
-        if delta > 0:
-            deployment.agents[agent_type].extend(created)
-        else:
-            to_remove = {proc.instance_id for proc in removed}
-            deployment.agents[agent_type] = [
-                proc
-                for proc in deployment.agents[agent_type]
-                if proc.instance_id not in to_remove
-            ]
+    async def apply_config(
+        self,
+        config: Mapping[str, Any],
+        *,
+        deployment_id: Optional[str] = None,
+        prune: bool = False,
+        dry_run: bool = False,
+    ) -> ApplyPlan:
+        """Bring a running deployment to the config data ``config`` in place.
+
+        ``config`` is layered over the deployment's config as described in
+        :func:`plan_apply`.
+
+        Pools are scaled only when their instance count changed and rolled
+        (running instances with the pool's restart budget, then standbys)
+        only when their command, resources or placement changed. Every other
+        instance keeps running untouched under the same deployment ID.
+        """
+
+        target_deployment = self.resolve_deployment_id(deployment_id)
+        deployment = self.get_deployment(target_deployment)
+        plan = plan_apply(deployment, config, prune=prune)
+        if dry_run or not plan.changed:
+            return plan
+
+        deployment.config = plan.config
+        throttle = LaunchThrottle.from_deployment(plan.config.deployment)
+        try:
+            for change in plan.changes:
+                if change.action == "unchanged":
+                    continue
+                if change.action == "remove":
+                    await self._remove_pool(deployment, change.agent_type)
+                    continue
+
+                agent_config = plan.config.agents[change.agent_type]
+                pool = self._ensure_pool(target_deployment, change.agent_type, agent_config)
+                pool.reconfigure(agent_config)
+                # Shrink before rolling and grow after, so no instance is
+                # restarted only to be stopped, and new ones start current.
+                if change.delta < 0:
+                    await pool.scale(change.delta, throttle=throttle)
+                if change.roll:
+                    await self.rolling_restart(change.agent_type, deployment_id=target_deployment)
+                    await pool.recycle_standby()
+                if change.delta > 0:
+                    await pool.scale(change.delta, throttle=throttle)
+
+                self._sync_pool(deployment, pool)
+                if pool.standby.count or pool.standby_instances:
+                    self._schedule_standby_refill(target_deployment, pool)
+        finally:
+            self._index[target_deployment] = self._summarize(deployment)
+            self._persist_state(target_deployment)
 
-        self._persist_state(target_deployment)
         self.logger.info(
-            "Scaled deployment %s agent %s by %s", target_deployment, agent_type, delta
+            "Applied config to deployment %s: %s",
+            target_deployment,
+            ", ".join(
+                f"{change.agent_type} {change.action}"
+                for change in plan.changes
+                if change.action != "unchanged"
+            )
+            or "settings only",
         )
-        return created if delta > 0 else removed
+        return plan
 
-    async def shutdown_deployment(self, deployment_id: str, *, force: bool = False) -> None:
-        if deployment_id not in self.deployments:
-            raise ValueError(f"Deployment {deployment_id} not found")
+    async def restart_instance(
+        self, agent_type: str, instance_id: int, *, deployment_id: Optional[str] = None
+    ) -> AgentProcess:
+        target_deployment = self.resolve_deployment_id(deployment_id)
+        pool = self._get_pool(target_deployment, agent_type)
+        try:
+            return await pool.restart_instance(instance_id)
+        finally:
+            self._sync_pool(self.deployments[target_deployment], pool)
+            self._persist_pool(target_deployment, pool)
+
+    async def stop_instance(
+        self, agent_type: str, instance_id: int, *, deployment_id: Optional[str] = None
+    ) -> AgentProcess:
+        target_deployment = self.resolve_deployment_id(deployment_id)
+        pool = self._get_pool(target_deployment, agent_type)
+        try:
+            return await pool.stop_instance(instance_id)
+        finally:
+            self._sync_pool(self.deployments[target_deployment], pool)
+            self._persist_pool(target_deployment, pool)
 
+    async def shutdown_deployment(
+        self,
+        deployment_id: str,
+        *,
+        force: bool = False,
+        grace: Optional[float] = None,
+    ) -> None:
+        deployment = self.get_deployment(deployment_id)
         self.logger.info("Shutting down deployment %s", deployment_id)
-        deployment = self.deployments[deployment_id]
-
-        for agent_type in list(deployment.agents.keys()):
-            pool = self._get_pool(deployment_id, agent_type)
-            for process in list(pool.running_instances):
-                await self._terminate_agent_process(process, force=force)
-            pool.running_instances.clear()
-            del self.pools[self._pool_key(deployment_id, agent_type)]
+        if grace is None:
+            grace = self._shutdown_grace(deployment.config)
+
+        pools = [
+            self._get_pool(deployment_id, agent_type)
+            for agent_type in list(deployment.agents.keys())
+        ]
+        processes = [
+            process
+            for pool in pools
+            for process in pool.running_instances + pool.standby_instances
+        ]
+        await self._terminate_agent_processes(processes, force=force, grace=grace)
+
+        for pool in pools:
+            pool.clear()
+            del self.pools[self._pool_key(deployment_id, pool.agent_type)]
 
         del self.deployments[deployment_id]
+        del self._index[deployment_id]
+        self.logs.forget(deployment_id)
         self.state_store.remove_deployment(deployment_id)
 
     async def list_deployments(self) -> List[SwarmDeployment]:
-        return list(self.deployments.values())
+        return [self.get_deployment(deployment_id) for deployment_id in list(self._index)]
+
+    def get_deployment(self, deployment_id: str) -> SwarmDeployment:
+        """Return a deployment, hydrating it from state on first access."""
+
+        deployment = self.deployments.get(deployment_id)
+        if deployment is not None:
+            return deployment
+        if deployment_id not in self._index:
+            raise ValueError(f"Deployment {deployment_id} not found")
+        return self._materialize(deployment_id)
+
+    def deployment_summaries(self) -> List[DeploymentSummary]:
+        """Index of every known deployment, oldest first, without hydrating."""
+
+        for deployment_id, deployment in self.deployments.items():
+            self._index[deployment_id] = self._summarize(deployment)
+        return list(self._index.values())
+
+    def resolve_deployment_id(
+        self, deployment_id: Optional[str], *, required: bool = True
+    ) -> Optional[str]:
+        """Return ``deployment_id``, or the most recent deployment when it is None."""
+
+        if deployment_id:
+            return deployment_id
+        if self._index:
+            return next(reversed(self._index.keys()))
+        if required:
+            raise ValueError("No deployments available")
+        return None
+
+    def watch_hydrated(self) -> None:
+        """Watch still-running processes hydrated from state for exits.
+
+        Must be called on the event loop that should record their exits;
+        long-lived callers such as the daemon call it once at start-up.
+        """
+
+        while self._unwatched:
+            self.watcher.watch(self._unwatched.pop())
+
+    async def settle(self) -> None:
+        """Wait for background pool maintenance such as standby refills."""
+
+        while self._background:
+            await asyncio.gather(*list(self._background), return_exceptions=True)
+
+    async def rotate_logs(self) -> int:
+        """Rotate agent logs that outgrew their size limit."""
+
+        return await asyncio.to_thread(self.logs.rotate)
+
+    def close(self) -> None:
+        """Release watchers; agent processes keep running and keep logging."""
+
+        self.watcher.close()
+        self.logs.rotate()
+        self.state_store.flush()
 
     # ------------------------------------------------------------------
     # Monitoring
     # ------------------------------------------------------------------
-    async def health_check(self) -> Dict[str, Any]:
+    async def health_check(self, deployment_id: Optional[str] = None) -> Dict[str, Any]:
+        """Check pool health for one deployment, or every deployment by default."""
+
+        targets = [deployment_id] if deployment_id else list(self._index)
+        for target in targets:
+            self.get_deployment(target)
+
+        self.watch_hydrated()
         summary: Dict[str, Any] = {}
-        for (deployment_id, agent_type), pool in self.pools.items():
-            key = f"{deployment_id}:{agent_type}"
-            summary[key] = await pool.health_check()
+        for (pool_deployment, agent_type), pool in self.pools.items():
+            if pool_deployment in targets:
+                key = f"{pool_deployment}:{agent_type}"
+                summary[key] = await pool.health_check()
         return summary
 
     async def get_agent_pool(self, agent_type: str, *, deployment_id: Optional[str] = None) -> Optional[AgentPool]:
-        target_deployment = self._resolve_deployment_id(deployment_id, required=False)
-        if target_deployment is None:
+        target_deployment = self.resolve_deployment_id(deployment_id, required=False)
+        if target_deployment is None or target_deployment not in self._index:
             return None
+        self.get_deployment(target_deployment)
         key = self._pool_key(target_deployment, agent_type)
         return self.pools.get(key)
 
+    def get_instance_logs(
+        self,
+        agent_type: str,
+        instance_id: int,
+        *,
+        lines: int = 100,
+        deployment_id: Optional[str] = None,
+    ) -> List[str]:
+        target_deployment = self.resolve_deployment_id(deployment_id)
+        return self.logs.tail(target_deployment, agent_type, instance_id, lines)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _hydrate_from_state(self) -> None:
-        for payload in self.state_store.list_deployments():
-            config_dict = payload.get("config", {})
-            config = SwarmConfig(
-                agents=config_dict.get("agents", {}),
-                deployment=config_dict.get("deployment", {}),
-                metadata=config_dict.get("metadata", {}),
+    def _load_index(self) -> None:
+        """Index every recorded deployment without hydrating any of them.
+
+        This skips rebuilding configs, processes and pools per deployment.
+        Producing the summaries is still O(state) on the JSON backend, which
+        parses its snapshot and journal on open; SQLite reads summary rows.
+        """
+
+        for entry in self.state_store.deployment_summaries():
+            self._index[entry["deployment_id"]] = DeploymentSummary(
+                deployment_id=entry["deployment_id"],
+                start_time=entry["start_time"],
+                agent_counts=entry["agents"],
+                standby_counts=entry["standby"],
+                pinned_cpus=entry["cpus"],
+                budgeted=entry["budgeted"],
             )
+            # Instances of deployments that are not hydrated yet still hold
+            # their CPUs, so new pins avoid them from the start.
+            for cpus in entry["cpus"]:
+                self.placer.claim(parse_cpulist(cpus))
+
+    def _materialize(self, deployment_id: str) -> SwarmDeployment:
+        payload = self.state_store.get_deployment(deployment_id)
+        if payload is None:
+            del self._index[deployment_id]
+            raise ValueError(f"Deployment {deployment_id} not found")
 
-            agents: Dict[str, List[AgentProcess]] = {}
-            deployment_id = payload["deployment_id"]
-
-            for agent_type, entries in payload.get("agents", {}).items():
-                processes: List[AgentProcess] = []
-                for entry in entries:
-                    process = AgentProcess(
-                        pid=entry.get("pid", -1),
-                        agent_type=agent_type,
-                        instance_id=entry.get("instance_id", len(processes) + 1),
-                        command=entry.get("command", ""),
-                        status=entry.get("status", "unknown"),
-                        cwd=entry.get("cwd"),
-                        start_time=entry.get("start_time", 0.0),
-                    )
-                    processes.append(process)
+        config_dict = thaw(payload.get("config", {}))
+        config = SwarmConfig(
+            agents=config_dict.get("agents", {}),
+            deployment=config_dict.get("deployment", {}),
+            metadata=config_dict.get("metadata", {}),
+        )
 
-                pool = self._ensure_pool(
-                    deployment_id,
-                    agent_type,
-                    config.agents.get(agent_type, {}),
-                )
-                pool.register_existing(processes)
-                agents[agent_type] = processes
+        agents: Dict[str, List[AgentProcess]] = {}
+        for agent_type, entries in payload.get("agents", {}).items():
+            processes = [
+                self._hydrate_process(agent_type, entry, index)
+                for index, entry in enumerate(entries, start=1)
+            ]
 
-            deployment = SwarmDeployment(
-                agents=agents,
-                config=config,
-                deployment_id=deployment_id,
-                start_time=payload.get("start_time", ""),
+            pool = self._ensure_pool(
+                deployment_id,
+                agent_type,
+                config.agents.get(agent_type, {}),
+            )
+            pool.register_existing(processes)
+            self._track_logs(deployment_id, agent_type, processes, config.agents.get(agent_type, {}))
+            agents[agent_type] = processes
+            self._adopt(processes)
+
+        standby: Dict[str, List[AgentProcess]] = {}
+        for agent_type, entries in payload.get("standby", {}).items():
+            processes = [
+                self._hydrate_process(agent_type, entry, index)
+                for index, entry in enumerate(entries, start=1)
+            ]
+            pool = self._ensure_pool(
+                deployment_id,
+                agent_type,
+                config.agents.get(agent_type, {}),
             )
-            self.deployments[deployment_id] = deployment
+            pool.register_standby(processes)
+            self._track_logs(deployment_id, agent_type, processes, config.agents.get(agent_type, {}))
+            standby[agent_type] = processes
+            self._adopt(processes)
+
+        deployment = SwarmDeployment(
+            agents=agents,
+            config=config,
+            deployment_id=deployment_id,
+            start_time=payload.get("start_time", ""),
+            standby=standby,
+        )
+        self.deployments[deployment_id] = deployment
+        return deployment
+
+    @staticmethod
+    def _summarize(deployment: SwarmDeployment) -> DeploymentSummary:
+        return DeploymentSummary(
+            deployment_id=deployment.deployment_id,
+            start_time=deployment.start_time,
+            agent_counts={
+                agent_type: len(processes) for agent_type, processes in deployment.agents.items()
+            },
+            standby_counts={
+                agent_type: len(processes) for agent_type, processes in deployment.standby.items()
+            },
+            pinned_cpus=[
+                process.cpus
+                for processes in (*deployment.agents.values(), *deployment.standby.values())
+                for process in processes
+                if process.cpus and process.exit_time is None
+            ],
+            budgeted=has_instance_budgets(
+                {"agents": deployment.config.agents, "deployment": deployment.config.deployment}
+            ),
+        )
+
+    @staticmethod
+    def _hydrate_process(agent_type: str, entry: Dict[str, Any], index: int) -> AgentProcess:
+        return AgentProcess(
+            pid=entry.get("pid", -1),
+            agent_type=agent_type,
+            instance_id=entry.get("instance_id", index),
+            command=entry.get("command", ""),
+            status=entry.get("status", "unknown"),
+            cwd=entry.get("cwd"),
+            start_time=entry.get("start_time", 0.0),
+            log_path=entry.get("log_path"),
+            exit_code=entry.get("exit_code"),
+            exit_time=entry.get("exit_time"),
+            cgroup=entry.get("cgroup"),
+            cpus=entry.get("cpus"),
+        )
+
+    def _track_logs(
+        self,
+        deployment_id: str,
+        agent_type: str,
+        processes: List[AgentProcess],
+        agent_config: AgentConfig,
+    ) -> None:
+        for process in processes:
+            self.logs.track(deployment_id, agent_type, process.instance_id, agent_config)
+
+    def _adopt(self, processes: List[AgentProcess]) -> None:
+        """Track hydrated processes that are still running.
+
+        Their CPU pins were already claimed from the index by ``_load_index``.
+        """
+
+        for process in processes:
+            if process.exit_time is None:
+                self._unwatched.append(process)
+
+    def _sync_pool(self, deployment: SwarmDeployment, pool: AgentPool) -> None:
+        """Mirror a pool's running and standby instances onto its deployment."""
+
+        deployment.agents[pool.agent_type] = pool.running_instances
+        if pool.standby_instances:
+            deployment.standby[pool.agent_type] = list(pool.standby_instances)
+        else:
+            deployment.standby.pop(pool.agent_type, None)
+
+    async def _remove_pool(self, deployment: SwarmDeployment, agent_type: str) -> None:
+        key = self._pool_key(deployment.deployment_id, agent_type)
+        pool = self.pools.get(key)
+        if pool is not None:
+            await self._terminate_agent_processes(
+                pool.running_instances + pool.standby_instances,
+                grace=self._shutdown_grace(deployment.config),
+            )
+            pool.clear()
+            del self.pools[key]
+        deployment.agents.pop(agent_type, None)
+        deployment.standby.pop(agent_type, None)
+
+    async def _discard_pools(
+        self, deployment_id: str, pools: List[AgentPool], config: SwarmConfig
+    ) -> None:
+        """Terminate and forget pools of a deployment that was never recorded."""
+
+        processes = [
+            process for pool in pools for process in pool.running_instances + pool.standby_instances
+        ]
+        if processes:
+            self.logger.warning(
+                "Deployment %s failed; stopping %s instances already started",
+                deployment_id,
+                len(processes),
+            )
+        await self._terminate_agent_processes(processes, grace=self._shutdown_grace(config))
+        for pool in pools:
+            pool.clear()
+            self.pools.pop(self._pool_key(deployment_id, pool.agent_type), None)
+        self.logs.forget(deployment_id)
+
+    def _schedule_standby_refill(self, deployment_id: str, pool: AgentPool) -> None:
+        async def refill() -> None:
+            try:
+                await pool.fill_standby()
+            except Exception as exc:  # noqa: BLE001 - keep the loop alive
+                self.logger.error("Standby refill for %s failed: %s", pool.agent_type, exc)
+            deployment = self.deployments.get(deployment_id)
+            if deployment is not None:
+                self._sync_pool(deployment, pool)
+                self._persist_pool(deployment_id, pool)
+
+        task = asyncio.create_task(refill())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
 
     def _ensure_pool(
         self,
@@ -194,7 +605,9 @@ class AgentOrchestrator:
                 )
 
             async def terminator(process: AgentProcess) -> None:
-                await self._terminate_agent_process(process)
+                deployment = self.deployments.get(deployment_id)
+                grace = self._shutdown_grace(deployment.config if deployment else None)
+                await self._terminate_agent_processes([process], grace=grace)
 
             self.pools[key] = AgentPool(
                 agent_type=agent_type,
@@ -212,15 +625,56 @@ class AgentOrchestrator:
         instance_id: int,
         config: AgentConfig,
     ) -> AgentProcess:
-        command = self._build_agent_command(agent_type, instance_id, config)
-        process = subprocess.Popen(
-            command,
-            shell=True,
-            cwd=str(self.project_root),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
+        argv = self._build_agent_command(agent_type, instance_id, config)
+        command = format_command(argv)
+        limits = ResourceLimits.from_config(config)
+        leaf = await asyncio.to_thread(
+            self.resources.prepare, deployment_id, agent_type, instance_id, limits
         )
+        cpus: Tuple[int, ...] = ()
+        try:
+            placement = PlacementPolicy.from_config(config)
+            if placement is not None:
+                cpus = self.placer.reserve(placement, agent_type, instance_id)
+            # The agent writes its output straight to the log file, so it
+            # keeps logging after this process and its event loop are gone.
+            log_fd = await asyncio.to_thread(
+                self.logs.open, deployment_id, agent_type, instance_id, config
+            )
+            try:
+                with self.resources.entering(leaf) as enter_cgroup:
+                    process = await self.spawner.spawn(
+                        argv,
+                        cwd=str(self.project_root),
+                        stdout=log_fd,
+                        stderr=log_fd,
+                        preexec_fn=pinning(cpus, enter_cgroup),
+                    )
+            finally:
+                os.close(log_fd)
+        except BaseException as exc:
+            # The leaf must not outlive a failed launch, whatever the cause;
+            # only spawn errors become a failed instance, the rest propagate.
+            if leaf is not None:
+                self.resources.release_cgroup(leaf)
+            self.placer.release(cpus)
+            if not isinstance(exc, (OSError, ValueError, subprocess.SubprocessError)):
+                raise
+            self.logger.error(
+                "Failed to start %s instance %s for deployment %s: %s",
+                agent_type,
+                instance_id,
+                deployment_id,
+                exc,
+            )
+            return AgentProcess(
+                pid=-1,
+                agent_type=agent_type,
+                instance_id=instance_id,
+                command=command,
+                status="failed",
+                cwd=str(self.project_root),
+            )
 
         agent_process = AgentProcess(
             pid=process.pid,
@@ -228,8 +682,14 @@ class AgentOrchestrator:
             instance_id=instance_id,
             command=command,
             cwd=str(self.project_root),
+            log_path=str(self.logs.log_path(deployment_id, agent_type, instance_id)),
+            cgroup=str(leaf) if leaf is not None else None,
+            cpus=format_cpulist(cpus) if cpus else None,
             handle=process,
         )
+        if leaf is None:
+            self.resources.apply_rlimits(agent_process, limits)
+        self.watcher.watch(agent_process)
 
         self.logger.info(
             "Started %s instance %s for deployment %s (pid=%s)",
@@ -240,57 +700,155 @@ class AgentOrchestrator:
         )
         return agent_process
 
-    async def _terminate_agent_process(
-        self, process: AgentProcess, force: bool = False
+    async def _terminate_agent_processes(
+        self,
+        processes: List[AgentProcess],
+        *,
+        force: bool = False,
+        grace: float = DEFAULT_SHUTDOWN_GRACE,
     ) -> None:
-        if process.handle is not None and process.handle.poll() is None:
-            process.handle.terminate() if not force else process.handle.kill()
-            loop = asyncio.get_running_loop()
-            try:
-                await asyncio.wait_for(
-                    loop.run_in_executor(None, process.handle.wait),
-                    timeout=5,
-                )
-            except asyncio.TimeoutError:
-                process.handle.kill()
-        else:
+        """Signal every process at once and share one grace deadline.
+
+        Processes still alive when the deadline passes are escalated to
+        SIGKILL together, so teardown takes roughly one grace period no
+        matter how many instances are involved.
+        """
+
+        if not processes:
+            return
+
+        self.watch_hydrated()
+        for process in processes:
             process.terminate(graceful=not force)
 
-        process.status = "terminated"
+        loop = asyncio.get_running_loop()
+        pending = await self._wait_for_exit(processes, deadline=loop.time() + grace)
+        if pending:
+            self.logger.warning(
+                "%s agent processes ignored SIGTERM after %.1fs; sending SIGKILL",
+                len(pending),
+                grace,
+            )
+            for process in pending:
+                process.terminate(graceful=False)
+            await self._wait_for_exit(pending, deadline=loop.time() + _KILL_REAP_TIMEOUT)
+
+        for process in processes:
+            process.status = "terminated"
+
+    async def _wait_for_exit(
+        self, processes: List[AgentProcess], *, deadline: float
+    ) -> List[AgentProcess]:
+        """Wait until every process has exited or the deadline passes.
+
+        Watched processes are awaited through their exit events; only
+        processes the watcher could not register are polled.
+        """
+
+        loop = asyncio.get_running_loop()
+        pending = [process for process in processes if process.is_alive()]
+        waiters = {self.watcher.exit_future(process) for process in pending if process.watched}
+        polled = [process for process in pending if not process.watched]
+
+        while (waiters or polled) and loop.time() < deadline:
+            timeout = deadline - loop.time()
+            if polled:
+                timeout = min(timeout, _EXIT_POLL_INTERVAL)
+            if waiters:
+                _, waiters = await asyncio.wait(waiters, timeout=timeout)
+            else:
+                await asyncio.sleep(timeout)
+            polled = [process for process in polled if process.is_alive()]
+
+        for waiter in waiters:
+            waiter.cancel()
+        return [process for process in pending if process.is_alive()]
+
+    def _on_process_exit(self, process: AgentProcess) -> None:
+        self.logger.info(
+            "%s instance %s exited (pid=%s, code=%s)",
+            process.agent_type,
+            process.instance_id,
+            process.pid,
+            process.exit_code,
+        )
+        self.resources.release(process)
+        self.placer.unplace(process)
+
+    def _readiness_probe(
+        self, deployment_id: str, agent_type: str, agent_config: AgentConfig
+    ) -> Tuple[Optional[Readiness], float]:
+        """Build the readiness check declared under ``agents.<type>.readiness``."""
+
+        raw = agent_config.get("readiness") or {}
+        timeout = parse_duration(raw.get("timeout"), default=DEFAULT_READINESS_TIMEOUT)
+        min_uptime = parse_duration(raw.get("min_uptime"))
+        pattern = re.compile(raw["log_pattern"]) if raw.get("log_pattern") else None
+        if pattern is None and not min_uptime:
+            return None, timeout
+
+        async def ready(process: AgentProcess) -> bool:
+            if min_uptime and time.time() - process.start_time < min_uptime:
+                return False
+            if pattern is None:
+                return True
+            # The log file is started afresh for every launch, so only output
+            # of this replacement counts.
+            lines = await asyncio.to_thread(
+                self.logs.tail, deployment_id, agent_type, process.instance_id, _READINESS_LOG_LINES
+            )
+            return any(pattern.search(line) for line in lines)
+
+        return ready, timeout
+
+    @staticmethod
+    def _shutdown_grace(config: Optional[SwarmConfig]) -> float:
+        if config is None:
+            return DEFAULT_SHUTDOWN_GRACE
+        return parse_duration(
+            config.deployment.get("shutdown_grace"), default=DEFAULT_SHUTDOWN_GRACE
+        )
 
     def _build_agent_command(
         self, agent_type: str, instance_id: int, config: AgentConfig
-    ) -> str:
+    ) -> List[str]:
+        command = config.get("command")
+        if command:
+            # ``agents.<type>.command`` overrides the built-in CLI; a string
+            # is split like a shell would, ``{instance_id}`` is substituted.
+            argv = shlex.split(command) if isinstance(command, str) else [str(arg) for arg in command]
+            return [arg.replace("{instance_id}", str(instance_id)) for arg in argv]
+
+        prompt = f"Working on instance {instance_id}"
         commands = {
-            "codex": f'codex exec "Working on instance {instance_id}"',
-            "claude": f'claude -p "Working on instance {instance_id}"',
-            "gemini": f'gemini "Working on instance {instance_id}"',
-            "copilot": f'gh copilot explain "Working on instance {instance_id}"',
+            "codex": ["codex", "exec", prompt],
+            "claude": ["claude", "-p", prompt],
+            "gemini": ["gemini", prompt],
+            "copilot": ["gh", "copilot", "explain", prompt],
         }
 
-        return commands.get(agent_type, f'echo "Unknown agent type: {agent_type}"')
+        return commands.get(agent_type, ["echo", f"Unknown agent type: {agent_type}"])
 
     def _persist_state(self, deployment_id: str) -> None:
         if deployment_id in self.deployments:
             self.state_store.record_deployment(self.deployments[deployment_id])
 
-    def _resolve_deployment_id(
-        self, deployment_id: Optional[str], *, required: bool = True
-    ) -> Optional[str]:
-        if deployment_id:
-            return deployment_id
-        if self.deployments:
-            # Most recent deployment
-            return next(reversed(self.deployments.keys()))
-        if required:
-            raise ValueError("No deployments available")
-        return None
+    def _persist_pool(self, deployment_id: str, pool: AgentPool) -> None:
+        # Journal only the pool that changed instead of the whole deployment.
+        if deployment_id in self.deployments:
+            self.state_store.update_agents(
+                deployment_id,
+                pool.agent_type,
+                pool.running_instances,
+                standby=pool.standby_instances,
+            )
 
     @staticmethod
     def _pool_key(deployment_id: str, agent_type: str) -> Tuple[str, str]:
         return deployment_id, agent_type
 
     def _get_pool(self, deployment_id: str, agent_type: str) -> AgentPool:
+        self.get_deployment(deployment_id)
         key = self._pool_key(deployment_id, agent_type)
         if key not in self.pools:
             raise ValueError(
@@ -300,5 +858,19 @@ class AgentOrchestrator:
 
     def _generate_deployment_id(self) -> str:
         timestamp = datetime.now(UTC).strftime("%Y%m%d%H%M%S")
-        suffix = len(self.deployments)
+        suffix = len(self._index)
         return f"swarm-{timestamp}-{suffix}"
+
+
+async def _gather_all(awaitables: Iterable[Awaitable[Any]]) -> List[Any]:
+    """Like ``asyncio.gather`` but let every awaitable finish before raising.
+
+    Plain ``gather`` propagates the first error while the others keep
+    running unobserved, so their results (started processes) would be lost.
+    """
+
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
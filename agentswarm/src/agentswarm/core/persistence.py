@@ -0,0 +1,169 @@
+"""Atomic, coalesced writes for state files."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Optional, Set
+
+FSYNC_ENV = "AGENTSWARM_FSYNC"
+FSYNC_POLICIES = {"always", "batched", "never"}
+DEFAULT_FSYNC_POLICY = "batched"
+DEFAULT_DEBOUNCE = 0.5  # seconds
+
+
+def fsync_policy(policy: Optional[str] = None) -> str:
+    """Resolve an fsync policy, defaulting to ``$AGENTSWARM_FSYNC``.
+
+    ``always`` syncs every write, including each journal append; ``batched``
+    syncs whole-file writes (snapshots, coalesced saves) and explicit
+    flushes; ``never`` leaves durability to the page cache.
+    """
+
+    policy = policy or os.environ.get(FSYNC_ENV) or DEFAULT_FSYNC_POLICY
+    if policy not in FSYNC_POLICIES:
+        raise ValueError(
+            f"Unknown fsync policy '{policy}'. Expected one of: {', '.join(sorted(FSYNC_POLICIES))}"
+        )
+    return policy
+
+
+def atomic_write(path: Path, data: bytes, *, fsync: bool = True) -> None:
+    """Replace ``path`` with ``data`` so readers see the old or new file, never a mix.
+
+    The data goes to a temporary file in the same directory, which is then
+    renamed over the target. With ``fsync`` the file and the directory entry
+    are synced, so the new contents also survive a power loss.
+    """
+
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            if fsync:
+                os.fsync(handle.fileno())
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    if fsync:
+        fsync_directory(path.parent)
+
+
+def fsync_directory(path: Path) -> None:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return  # Not supported on this platform
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class CoalescingWriter:
+    """Write a file at most once per debounce window, however often it changes.
+
+    Owners call :meth:`mark_dirty` after each mutation; ``render`` is only
+    invoked when the file is actually written. Inside a running event loop
+    the write is scheduled on the loop, so it happens on the same thread as
+    the mutations. Without a loop the first change after a quiet period is
+    written at once and the changes that follow within the window are
+    deferred to the next write. Pending changes are written by
+    :meth:`flush` and, as a last resort, at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        render: Callable[[], bytes],
+        *,
+        debounce: float = DEFAULT_DEBOUNCE,
+        fsync: Optional[str] = None,
+    ) -> None:
+        self.path = path
+        self.debounce = debounce
+        self.fsync = fsync_policy(fsync)
+        self.logger = logging.getLogger(__name__)
+        self._render = render
+        self._dirty = False
+        self._last_write = -float("inf")
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._timer_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+        _pending_writers.add(self)
+        if self._timer is not None:
+            if not self._timer_loop.is_closed():
+                return
+            self._timer = None  # The loop ended before the write was due
+
+        delay = self._last_write + self.debounce - time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if delay <= 0:
+                self.flush()
+            return
+        self._timer = loop.call_later(max(0.0, delay), self._on_timer)
+        self._timer_loop = loop
+
+    def flush(self) -> None:
+        """Write pending changes now."""
+
+        self._cancel_timer()
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            atomic_write(self.path, self._render(), fsync=self.fsync != "never")
+        except Exception:
+            self._dirty = True
+            raise
+        finally:
+            self._last_write = time.monotonic()
+        _pending_writers.discard(self)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _on_timer(self) -> None:
+        self._timer = None
+        try:
+            self.flush()
+        except Exception as exc:  # noqa: BLE001 - retried on the next change
+            self.logger.error("Failed to write %s: %s", self.path, exc)
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+# Writers with unwritten changes, kept alive until they are flushed.
+_pending_writers: Set[CoalescingWriter] = set()
+
+
+@atexit.register
+def _flush_pending_writers() -> None:
+    for writer in list(_pending_writers):
+        try:
+            writer.flush()
+        except Exception as exc:  # noqa: BLE001 - keep flushing the others
+            writer.logger.error("Failed to write %s at exit: %s", writer.path, exc)
@@ -0,0 +1,247 @@
+"""CPU affinity and NUMA-aware placement of agent instances."""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .config import PLACEMENT_MODES, AgentConfig
+from .models import AgentProcess
+
+NODE_SYSFS_PATH = Path("/sys/devices/system/node")
+
+
+def parse_cpulist(value: str) -> Tuple[int, ...]:
+    """Parse the kernel's cpulist format (``"0-3,8,10-11"``)."""
+
+    cpus: List[int] = []
+    for part in value.strip().split(","):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            if "-" in part:
+                start, end = part.split("-", 1)
+                cpus.extend(range(int(start), int(end) + 1))
+            else:
+                cpus.append(int(part))
+        except ValueError as exc:
+            raise ValueError(f"Invalid CPU list '{value}'") from exc
+    return tuple(sorted(set(cpus)))
+
+
+def format_cpulist(cpus: Iterable[int]) -> str:
+    """Render CPUs in the compact cpulist format."""
+
+    ranges: List[str] = []
+    ordered = sorted(set(cpus))
+    index = 0
+    while index < len(ordered):
+        start = end = ordered[index]
+        while index + 1 < len(ordered) and ordered[index + 1] == end + 1:
+            index += 1
+            end = ordered[index]
+        ranges.append(str(start) if start == end else f"{start}-{end}")
+        index += 1
+    return ",".join(ranges)
+
+
+@dataclass(slots=True)
+class NumaTopology:
+    """CPUs usable by this process, grouped by NUMA node."""
+
+    nodes: Dict[int, Tuple[int, ...]]
+
+    @classmethod
+    def detect(cls, sysfs_path: Path = NODE_SYSFS_PATH) -> "NumaTopology":
+        allowed = set(os.sched_getaffinity(0))
+        nodes: Dict[int, Tuple[int, ...]] = {}
+        try:
+            entries = sorted(sysfs_path.glob("node[0-9]*"), key=lambda p: int(p.name[4:]))
+        except OSError:
+            entries = []
+        for entry in entries:
+            try:
+                cpus = parse_cpulist((entry / "cpulist").read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            usable = tuple(cpu for cpu in cpus if cpu in allowed)
+            if usable:
+                nodes[int(entry.name[4:])] = usable
+        if not nodes:
+            # No NUMA information (containers, non-Linux sysfs): one node.
+            nodes[0] = tuple(sorted(allowed))
+        return cls(nodes=nodes)
+
+    @property
+    def cpus(self) -> Tuple[int, ...]:
+        return tuple(cpu for cpus in self.nodes.values() for cpu in cpus)
+
+
+@dataclass(slots=True)
+class PlacementPolicy:
+    """Placement declared under ``agents.<type>.placement``.
+
+    ``spread`` puts each new instance on the least loaded NUMA node, ``pack``
+    fills one node before moving on to the next. ``nodes`` and ``cpus``
+    restrict the candidates; ``cpus_per_instance`` sets the size of each pin.
+    """
+
+    mode: str = "spread"
+    cpus_per_instance: int = 1
+    nodes: Optional[Tuple[int, ...]] = None
+    cpus: Optional[Tuple[int, ...]] = None
+
+    @classmethod
+    def from_config(cls, agent_config: AgentConfig) -> Optional["PlacementPolicy"]:
+        raw = agent_config.get("placement")
+        if not raw:
+            return None
+        if isinstance(raw, str):
+            raw = {"mode": raw}
+        mode = raw.get("mode", "spread")
+        if mode not in PLACEMENT_MODES:
+            raise ValueError(
+                f"Unknown placement mode '{mode}'."
+                f" Expected one of: {', '.join(sorted(PLACEMENT_MODES))}"
+            )
+        if mode == "none":
+            return None
+
+        cpus_per_instance = int(raw.get("cpus_per_instance", 1))
+        if cpus_per_instance < 1:
+            raise ValueError("placement.cpus_per_instance must be a positive integer")
+
+        nodes = raw.get("nodes")
+        cpus = raw.get("cpus")
+        return cls(
+            mode=mode,
+            cpus_per_instance=cpus_per_instance,
+            nodes=tuple(int(node) for node in nodes) if nodes is not None else None,
+            cpus=parse_cpulist(str(cpus)) if cpus is not None else None,
+        )
+
+
+class CpuPlacer:
+    """Assign CPU sets to instances, balancing load across cores and nodes.
+
+    Every pinned CPU carries a reference count shared by all pools and
+    deployments of the orchestrator, so pools land on different cores until
+    the host is saturated; after that CPUs are shared as evenly as possible.
+    """
+
+    def __init__(self, topology: Optional[NumaTopology] = None) -> None:
+        self.logger = logging.getLogger(__name__)
+        self._topology = topology
+        self._load: Dict[int, int] = {}
+
+    @property
+    def topology(self) -> NumaTopology:
+        if self._topology is None:
+            self._topology = NumaTopology.detect()
+        return self._topology
+
+    def assign(self, policy: PlacementPolicy) -> Tuple[int, ...]:
+        candidates = self._candidates(policy)
+        if not candidates:
+            return ()
+
+        if policy.mode == "pack":
+            node = next(
+                (
+                    node
+                    for node, cpus in candidates.items()
+                    if sum(1 for cpu in cpus if not self._load.get(cpu))
+                    >= policy.cpus_per_instance
+                ),
+                None,
+            )
+        else:
+            node = None
+        if node is None:
+            node = min(candidates, key=lambda node: (self._node_load(candidates[node]), node))
+
+        # Take the least loaded CPUs of the node; spill over to other nodes
+        # only when the node is smaller than the request.
+        ordered = sorted(candidates[node], key=lambda cpu: (self._load.get(cpu, 0), cpu))
+        if len(ordered) < policy.cpus_per_instance:
+            rest = [cpu for other, cpus in candidates.items() if other != node for cpu in cpus]
+            ordered += sorted(rest, key=lambda cpu: (self._load.get(cpu, 0), cpu))
+        chosen = tuple(sorted(ordered[: policy.cpus_per_instance]))
+        self.claim(chosen)
+        return chosen
+
+    def claim(self, cpus: Iterable[int]) -> None:
+        for cpu in cpus:
+            self._load[cpu] = self._load.get(cpu, 0) + 1
+
+    def release(self, cpus: Iterable[int]) -> None:
+        for cpu in cpus:
+            remaining = self._load.get(cpu, 0) - 1
+            if remaining > 0:
+                self._load[cpu] = remaining
+            else:
+                self._load.pop(cpu, None)
+
+    def reserve(
+        self, policy: PlacementPolicy, agent_type: str, instance_id: int
+    ) -> Tuple[int, ...]:
+        """Assign CPUs to an instance that is about to be spawned.
+
+        The caller pins the child with :func:`pinning` and releases the CPUs
+        again if the spawn fails.
+        """
+
+        cpus = self.assign(policy)
+        if not cpus:
+            self.logger.warning(
+                "No CPUs match the placement of %s instance %s", agent_type, instance_id
+            )
+        return cpus
+
+    def unplace(self, process: AgentProcess) -> None:
+        if process.cpus:
+            self.release(parse_cpulist(process.cpus))
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _candidates(self, policy: PlacementPolicy) -> Dict[int, Tuple[int, ...]]:
+        candidates: Dict[int, Tuple[int, ...]] = {}
+        for node, cpus in self.topology.nodes.items():
+            if policy.nodes is not None and node not in policy.nodes:
+                continue
+            if policy.cpus is not None:
+                cpus = tuple(cpu for cpu in cpus if cpu in policy.cpus)
+            if cpus:
+                candidates[node] = cpus
+        return candidates
+
+    def _node_load(self, cpus: Tuple[int, ...]) -> float:
+        return sum(self._load.get(cpu, 0) for cpu in cpus) / len(cpus)
+
+
+def pinning(
+    cpus: Iterable[int], preexec_fn: Optional[Callable[[], Any]] = None
+) -> Optional[Callable[[], Any]]:
+    """Return a ``preexec_fn`` that pins the child to ``cpus`` before exec.
+
+    Affinity is inherited, so every process and thread the agent starts runs
+    on its CPUs; pinning after the spawn would miss the ones it has already
+    forked. ``preexec_fn`` runs first: joining a cgroup with a cpuset resets
+    the affinity. If pinning fails, the spawn fails.
+    """
+
+    cpus = frozenset(cpus)
+    if not cpus:
+        return preexec_fn
+
+    def pin() -> None:
+        if preexec_fn is not None:
+            preexec_fn()
+        os.sched_setaffinity(0, cpus)
+
+    return pin
@@ -0,0 +1,176 @@
+"""Indexed storage for the instances of an agent pool."""
+
+from __future__ import annotations
+
+import heapq
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from .models import AgentProcess
+
+
+class InstanceIdAllocator:
+    """Hand out the lowest free instance id, reusing released ones."""
+
+    def __init__(self) -> None:
+        self._high_water = 0
+        self._free: List[int] = []
+        self._free_set: Set[int] = set()
+
+    def allocate(self) -> int:
+        while self._free:
+            instance_id = heapq.heappop(self._free)
+            if instance_id in self._free_set:
+                self._free_set.discard(instance_id)
+                return instance_id
+        self._high_water += 1
+        return self._high_water
+
+    def release(self, instance_id: int) -> None:
+        if 0 < instance_id <= self._high_water and instance_id not in self._free_set:
+            self._push_free(instance_id)
+
+    def claim(self, instance_id: int) -> None:
+        """Mark an externally chosen id (e.g. from persisted state) as in use."""
+
+        if instance_id <= 0:
+            return
+        if instance_id > self._high_water:
+            for gap in range(self._high_water + 1, instance_id):
+                self._push_free(gap)
+            self._high_water = instance_id
+        else:
+            # Stale heap entries are skipped lazily by allocate().
+            self._free_set.discard(instance_id)
+
+    def _push_free(self, instance_id: int) -> None:
+        self._free_set.add(instance_id)
+        heapq.heappush(self._free, instance_id)
+
+
+class InstanceRegistry:
+    """Running instances of one pool with O(1) lookup by id.
+
+    Instances keep their provisioning order, so the newest ones can be popped
+    in O(1) on scale-down. A secondary index groups instance ids by status.
+    Statuses are changed by other components (the exit watcher, terminate),
+    so the index is repaired lazily when read; call :meth:`reindex` after a
+    status change to make the process visible under its new status at once.
+    """
+
+    def __init__(
+        self,
+        processes: Iterable[AgentProcess] = (),
+        *,
+        allocator: Optional[InstanceIdAllocator] = None,
+    ) -> None:
+        self.ids = allocator or InstanceIdAllocator()
+        self._by_id: Dict[int, AgentProcess] = {}
+        self._by_status: Dict[str, Dict[int, None]] = {}
+        self._indexed_status: Dict[int, str] = {}
+        for process in processes:
+            self.add(process)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[AgentProcess]:
+        return iter(list(self._by_id.values()))
+
+    def __contains__(self, instance_id: object) -> bool:
+        return instance_id in self._by_id
+
+    def get(self, instance_id: int) -> Optional[AgentProcess]:
+        return self._by_id.get(instance_id)
+
+    def add(self, process: AgentProcess) -> None:
+        instance_id = process.instance_id
+        if instance_id in self._by_id:
+            raise ValueError(f"Instance {instance_id} is already registered")
+        self.ids.claim(instance_id)
+        self._by_id[instance_id] = process
+        self._index(instance_id, process.status)
+
+    def replace(self, process: AgentProcess) -> Optional[AgentProcess]:
+        """Swap in a new process for an existing id, keeping its position."""
+
+        previous = self._by_id.get(process.instance_id)
+        if previous is None:
+            self.add(process)
+            return None
+        self._by_id[process.instance_id] = process
+        self.reindex(process)
+        return previous
+
+    def remove(self, instance_id: int, *, release: bool = True) -> Optional[AgentProcess]:
+        process = self._by_id.pop(instance_id, None)
+        if process is None:
+            return None
+        self._unindex(instance_id)
+        if release:
+            self.ids.release(instance_id)
+        return process
+
+    def newest_first(self) -> Iterator[AgentProcess]:
+        """Iterate from the most recently added instance; do not mutate meanwhile."""
+
+        for instance_id in reversed(self._by_id):
+            yield self._by_id[instance_id]
+
+    def pop_last(self, count: int, *, release: bool = True) -> List[AgentProcess]:
+        """Remove and return up to ``count`` of the most recently added instances."""
+
+        removed: List[AgentProcess] = []
+        while self._by_id and len(removed) < count:
+            instance_id, process = self._by_id.popitem()
+            self._unindex(instance_id)
+            if release:
+                self.ids.release(instance_id)
+            removed.append(process)
+        return removed
+
+    def clear(self) -> None:
+        for instance_id in self._by_id:
+            self.ids.release(instance_id)
+        self._by_id.clear()
+        self._by_status.clear()
+        self._indexed_status.clear()
+
+    def with_status(self, status: str) -> List[AgentProcess]:
+        bucket = self._by_status.get(status)
+        if not bucket:
+            return []
+        matches: List[AgentProcess] = []
+        for instance_id in list(bucket):
+            process = self._by_id[instance_id]
+            if process.status == status:
+                matches.append(process)
+            else:
+                self._index(instance_id, process.status)
+        return matches
+
+    def count_by_status(self) -> Dict[str, int]:
+        for process in self._by_id.values():
+            if self._indexed_status.get(process.instance_id) != process.status:
+                self._index(process.instance_id, process.status)
+        return {status: len(bucket) for status, bucket in self._by_status.items() if bucket}
+
+    def reindex(self, process: AgentProcess) -> None:
+        if self._by_id.get(process.instance_id) is process:
+            self._index(process.instance_id, process.status)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _index(self, instance_id: int, status: str) -> None:
+        previous = self._indexed_status.get(instance_id)
+        if previous == status:
+            return
+        if previous is not None:
+            self._by_status[previous].pop(instance_id, None)
+        self._by_status.setdefault(status, {})[instance_id] = None
+        self._indexed_status[instance_id] = status
+
+    def _unindex(self, instance_id: int) -> None:
+        status = self._indexed_status.pop(instance_id, None)
+        if status is not None:
+            self._by_status[status].pop(instance_id, None)
@@ -0,0 +1,360 @@
+"""Per-instance resource limits: cgroup v2 leaves with an rlimit fallback."""
+
+from __future__ import annotations
+
+import errno
+import functools
+import logging
+import math
+import os
+import resource
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .config import AgentConfig, parse_size
+from .models import AgentProcess
+
+CGROUP_ROOT_ENV = "AGENTSWARM_CGROUP_ROOT"
+CGROUP_GROUP_NAME = "agentswarm"
+CGROUP_SUPERVISOR_NAME = "supervisor"
+
+_CONTROLLERS = ("memory", "cpu", "pids")
+_MIN_CPU_WEIGHT = 1
+_MAX_CPU_WEIGHT = 10000
+_DEFAULT_CPU_WEIGHT = 100
+
+
+@dataclass(slots=True)
+class ResourceLimits:
+    """Limits declared under ``agents.<type>.resources``.
+
+    ``memory`` accepts sizes such as ``"2GB"``; ``cpu_weight`` is the cgroup v2
+    weight (1-10000, default 100); ``pids`` caps processes in the instance's
+    cgroup. Zero means unlimited.
+    """
+
+    memory_max: int = 0
+    cpu_weight: int = 0
+    pids_max: int = 0
+
+    @classmethod
+    def from_config(cls, agent_config: AgentConfig) -> "ResourceLimits":
+        raw = agent_config.get("resources") or {}
+        memory = raw.get("memory")
+        cpu_weight = int(raw.get("cpu_weight", 0))
+        if cpu_weight and not _MIN_CPU_WEIGHT <= cpu_weight <= _MAX_CPU_WEIGHT:
+            raise ValueError(
+                f"resources.cpu_weight must be between {_MIN_CPU_WEIGHT} and {_MAX_CPU_WEIGHT}"
+            )
+        return cls(
+            memory_max=parse_size(memory) if memory is not None else 0,
+            cpu_weight=cpu_weight,
+            pids_max=max(0, int(raw.get("pids", 0))),
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.memory_max or self.cpu_weight or self.pids_max)
+
+
+class ResourceManager:
+    """Apply ResourceLimits to spawned agents.
+
+    When a delegated cgroup v2 subtree is writable, every instance gets its
+    own leaf ``<root>/agentswarm/<deployment>/<agent>-<id>`` with
+    ``memory.max``, ``cpu.weight`` and ``pids.max`` set before it is spawned,
+    and the child joins the leaf before it execs the agent (see
+    :meth:`entering`), so no agent code runs outside its limits. Otherwise
+    limits fall back to ``prlimit`` (RLIMIT_DATA for memory; RLIMIT_AS would
+    trip over the large address space reservations of JIT runtimes) and a
+    nice value derived from the CPU weight; ``pids`` has no per-process
+    rlimit equivalent and is skipped.
+
+    The root defaults to the caller's own cgroup and can be overridden with
+    ``AGENTSWARM_CGROUP_ROOT`` (e.g. the cgroup of a ``Delegate=yes`` systemd
+    unit). cgroup v2 only enables controllers for children of a cgroup that
+    has no processes of its own. When the root is the caller's own cgroup,
+    the caller moves itself into ``<root>/supervisor`` first, but only with
+    ``supervise`` set (the daemon) or an explicitly configured root: a
+    plain CLI command never relocates the user's process. If other processes
+    share the cgroup (an interactive shell's session scope, say) the move is
+    undone and the rlimit fallback is used; point ``AGENTSWARM_CGROUP_ROOT``
+    at a delegated, otherwise empty cgroup in that case.
+    """
+
+    def __init__(self, cgroup_root: Optional[Path] = None, *, supervise: bool = False) -> None:
+        self.logger = logging.getLogger(__name__)
+        self.supervise = supervise
+        self._requested_root = cgroup_root
+        self._base: Optional[Path] = None
+        self._probed = False
+        # Instances are prepared concurrently from worker threads.
+        self._probe_lock = threading.Lock()
+
+    @property
+    def cgroup_base(self) -> Optional[Path]:
+        """Writable ``agentswarm`` cgroup directory, or None without delegation."""
+
+        with self._probe_lock:
+            if not self._probed:
+                self._base = self._prepare_base()
+                self._probed = True
+        return self._base
+
+    def prepare(
+        self,
+        deployment_id: str,
+        agent_type: str,
+        instance_id: int,
+        limits: ResourceLimits,
+    ) -> Optional[Path]:
+        """Create and configure the cgroup leaf of an instance about to be spawned.
+
+        Returns None when the instance has no limits or no cgroup can be
+        used; apply :meth:`apply_rlimits` after spawning it instead.
+        """
+
+        if not limits:
+            return None
+        base = self.cgroup_base
+        if base is None:
+            return None
+        try:
+            return self._make_leaf(base, deployment_id, f"{agent_type}-{instance_id}", limits)
+        except OSError as exc:
+            self.logger.warning(
+                "Could not create a cgroup for %s instance %s: %s", agent_type, instance_id, exc
+            )
+            return None
+
+    @contextmanager
+    def entering(self, leaf: Optional[Path]) -> Iterator[Optional[Callable[[], None]]]:
+        """Yield a ``preexec_fn`` that moves the spawned child into ``leaf``.
+
+        The child writes to a descriptor opened here, a single syscall that
+        is safe between fork and exec even though agents are spawned from
+        executor threads. If it fails, the spawn fails instead of running
+        the agent unconfined.
+        """
+
+        if leaf is None:
+            yield None
+            return
+        procs = os.open(leaf / "cgroup.procs", os.O_WRONLY | os.O_CLOEXEC)
+        try:
+            # "0" names the writing process, i.e. the child itself.
+            yield functools.partial(os.write, procs, b"0")
+        finally:
+            os.close(procs)
+
+    def apply_rlimits(self, process: AgentProcess, limits: ResourceLimits) -> None:
+        """Fallback for instances without a cgroup leaf."""
+
+        if not limits or process.pid <= 0:
+            return
+        try:
+            if limits.memory_max:
+                resource.prlimit(
+                    process.pid, resource.RLIMIT_DATA, (limits.memory_max, limits.memory_max)
+                )
+            if limits.cpu_weight:
+                nice = _weight_to_nice(limits.cpu_weight)
+                # Raising priority needs privileges; only lower it.
+                if nice > 0:
+                    os.setpriority(os.PRIO_PROCESS, process.pid, nice)
+        except (OSError, ValueError) as exc:
+            self.logger.warning(
+                "Could not apply rlimits to %s instance %s: %s",
+                process.agent_type,
+                process.instance_id,
+                exc,
+            )
+
+    def release(self, process: AgentProcess) -> None:
+        """Remove an exited instance's cgroup leaf."""
+
+        if process.cgroup:
+            self.release_cgroup(Path(process.cgroup))
+
+    def release_cgroup(self, leaf: Path) -> None:
+        try:
+            leaf.rmdir()
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            # Still populated (e.g. a surviving grandchild); leave it for now.
+            self.logger.debug("Keeping cgroup %s: %s", leaf, exc)
+            return
+        parent = leaf.parent
+        if parent != self._base:
+            try:
+                parent.rmdir()  # Last instance of the deployment
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _prepare_base(self) -> Optional[Path]:
+        explicit = self._requested_root or os.environ.get(CGROUP_ROOT_ENV)
+        root = explicit or _own_cgroup()
+        if root is None:
+            return None
+        root = Path(root)
+        base = root / CGROUP_GROUP_NAME
+        created: List[Path] = []
+        moved = False
+        try:
+            available = set(_read_text(root / "cgroup.controllers").split())
+            wanted = [name for name in _CONTROLLERS if name in available]
+            if not wanted:
+                return None
+            _make_dir(base, created)
+            try:
+                _enable_controllers(root, wanted)
+            except OSError as exc:
+                if exc.errno != errno.EBUSY or root != _own_cgroup():
+                    raise
+                if not (self.supervise or explicit):
+                    raise
+                # No internal processes: step out of the root before
+                # enabling controllers for its children.
+                supervisor = root / CGROUP_SUPERVISOR_NAME
+                _make_dir(supervisor, created)
+                _write_text(supervisor / "cgroup.procs", "0")
+                moved = True
+                _enable_controllers(root, wanted)
+            _enable_controllers(base, wanted)
+        except OSError as exc:
+            self.logger.debug("cgroup v2 delegation unavailable under %s: %s", root, exc)
+            self._undo_prepare(root, created, moved)
+            return None
+        return base
+
+    def _undo_prepare(self, root: Path, created: List[Path], moved: bool) -> None:
+        try:
+            if moved:
+                _write_text(root / "cgroup.procs", "0")
+            for path in reversed(created):
+                path.rmdir()
+        except OSError as exc:
+            self.logger.warning("Could not undo cgroup changes under %s: %s", root, exc)
+
+    def _make_leaf(
+        self,
+        base: Path,
+        deployment_id: str,
+        name: str,
+        limits: ResourceLimits,
+    ) -> Path:
+        # Leaves of one deployment are created concurrently from worker
+        # threads; both steps are idempotent.
+        deployment_group = base / deployment_id
+        deployment_group.mkdir(exist_ok=True)
+        controllers = _read_text(base / "cgroup.subtree_control").split()
+        _enable_controllers(deployment_group, controllers)
+
+        leaf = deployment_group / name
+        leaf.mkdir(exist_ok=True)
+        if limits.memory_max:
+            _write_text(leaf / "memory.max", str(limits.memory_max))
+        if limits.cpu_weight:
+            _write_text(leaf / "cpu.weight", str(limits.cpu_weight))
+        if limits.pids_max:
+            _write_text(leaf / "pids.max", str(limits.pids_max))
+        return leaf
+
+
+def read_cgroup_stats(path: str | Path) -> Dict[str, Any]:
+    """Current usage and throttle counters of a cgroup leaf."""
+
+    leaf = Path(path)
+    stats: Dict[str, Any] = {}
+    try:
+        stats["memory_current"] = int(_read_text(leaf / "memory.current"))
+        memory_max = _read_text(leaf / "memory.max").strip()
+        stats["memory_max"] = None if memory_max == "max" else int(memory_max)
+        events = _read_keyed(leaf / "memory.events")
+        stats["memory_high_events"] = events.get("high", 0)
+        stats["memory_max_events"] = events.get("max", 0)
+        stats["oom_kills"] = events.get("oom_kill", 0)
+    except (OSError, ValueError):
+        pass
+    try:
+        cpu = _read_keyed(leaf / "cpu.stat")
+        stats["cpu_usage_usec"] = cpu.get("usage_usec", 0)
+        stats["cpu_nr_throttled"] = cpu.get("nr_throttled", 0)
+        stats["cpu_throttled_usec"] = cpu.get("throttled_usec", 0)
+    except (OSError, ValueError):
+        pass
+    try:
+        stats["pids_current"] = int(_read_text(leaf / "pids.current"))
+    except (OSError, ValueError):
+        pass
+    return stats
+
+
+def _own_cgroup() -> Optional[Path]:
+    mount = _cgroup2_mount()
+    if mount is None:
+        return None
+    try:
+        for line in _read_text(Path("/proc/self/cgroup")).splitlines():
+            if line.startswith("0::"):
+                return mount / line[3:].lstrip("/")
+    except OSError:
+        pass
+    return None
+
+
+def _cgroup2_mount() -> Optional[Path]:
+    try:
+        mountinfo = _read_text(Path("/proc/self/mountinfo"))
+    except OSError:
+        return None
+    for line in mountinfo.splitlines():
+        # "<id> <parent> <dev> <root> <mount point> <opts> ... - <fstype> ..."
+        fields = line.split(" - ", 1)
+        if len(fields) == 2 and fields[1].startswith("cgroup2 "):
+            return Path(fields[0].split()[4])
+    return None
+
+
+def _make_dir(path: Path, created: List[Path]) -> None:
+    try:
+        path.mkdir()
+    except FileExistsError:
+        return
+    created.append(path)
+
+
+def _enable_controllers(cgroup: Path, controllers: Any) -> None:
+    enabled = set(_read_text(cgroup / "cgroup.subtree_control").split())
+    missing = [name for name in controllers if name not in enabled]
+    if missing:
+        _write_text(cgroup / "cgroup.subtree_control", " ".join(f"+{name}" for name in missing))
+
+
+def _weight_to_nice(weight: int) -> int:
+    # The kernel maps each nice step to roughly a 1.25x change in weight.
+    nice = round(-math.log(weight / _DEFAULT_CPU_WEIGHT) / math.log(1.25))
+    return max(-20, min(19, nice))
+
+
+def _read_keyed(path: Path) -> Dict[str, int]:
+    return {
+        key: int(value)
+        for key, value in (line.split() for line in _read_text(path).splitlines() if line)
+    }
+
+
+def _read_text(path: Path) -> str:
+    with path.open("r", encoding="utf-8") as handle:
+        return handle.read()
+
+
+def _write_text(path: Path, value: str) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write(value)
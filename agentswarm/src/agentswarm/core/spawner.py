@@ -0,0 +1,64 @@
+"""Process spawning for agent instances."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import shlex
+import subprocess
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+class AgentSpawner:
+    """Exec agent binaries directly from argv lists without blocking the loop.
+
+    Commands are executed without an intermediate ``/bin/sh`` and the
+    fork/exec happens on the default executor, so concurrent launches overlap
+    instead of stalling the event loop one after another.
+
+    ``asyncio.create_subprocess_exec`` is deliberately not used: its transport
+    kills still-running children when it is closed or garbage collected, which
+    would take every agent down as soon as a one-shot CLI command exits. For
+    the same reason agents should not be given pipes read by this process:
+    pass a file descriptor as ``stdout``/``stderr`` so output does not depend
+    on the spawning process staying alive.
+    """
+
+    def __init__(self, *, stdout: int = subprocess.DEVNULL, stderr: int = subprocess.DEVNULL) -> None:
+        self.stdout = stdout
+        self.stderr = stderr
+        self.logger = logging.getLogger(__name__)
+
+    async def spawn(
+        self,
+        argv: Sequence[str],
+        *,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        stdout: Optional[int] = None,
+        stderr: Optional[int] = None,
+        preexec_fn: Optional[Callable[[], Any]] = None,
+    ) -> subprocess.Popen:
+        if not argv:
+            raise ValueError("Cannot spawn an agent without a command")
+
+        loop = asyncio.get_running_loop()
+        launch = functools.partial(
+            subprocess.Popen,
+            list(argv),
+            cwd=cwd,
+            env=env,
+            stdout=self.stdout if stdout is None else stdout,
+            stderr=self.stderr if stderr is None else stderr,
+            preexec_fn=preexec_fn,
+        )
+        handle = await loop.run_in_executor(None, launch)
+        self.logger.debug("Spawned %s (pid=%s)", argv[0], handle.pid)
+        return handle
+
+
+def format_command(argv: List[str]) -> str:
+    """Render an argv list as a shell-quoted string for display and state."""
+
+    return shlex.join(argv)
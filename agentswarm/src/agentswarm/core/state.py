@@ -2,13 +2,56 @@
 
 from __future__ import annotations
 
-import json
+import fcntl
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from types import MappingProxyType
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from .codec import StateCodec, decode, json_dumps, json_loads
+from .config import has_instance_budgets
+from .persistence import atomic_write, fsync_policy
 
 STATE_DIRECTORY_NAME = ".agentswarm"
 STATE_FILE_NAME = "state.json"
+JOURNAL_FILE_NAME = "state.journal"
+SQLITE_FILE_NAME = "state.db"
+MIGRATED_SUFFIX = ".migrated"
+
+STATE_BACKEND_ENV = "AGENTSWARM_STATE_BACKEND"
+STATE_BACKENDS = {"json", "sqlite"}
+
+DEFAULT_COMPACT_BYTES = 1024 * 1024
+DEFAULT_COMPACT_INTERVAL = 300.0  # seconds
+
+
+class JournalRetiredError(RuntimeError):
+    """The JSON journal was migrated away while this process waited for it."""
+
+
+def freeze(value: Any) -> Any:
+    """Return a read-only copy: mappings become proxies, lists become tuples."""
+
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a mutable (and JSON/YAML serializable) copy of a frozen view."""
+
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
 
 
 def _default_state() -> Dict[str, Any]:
@@ -19,69 +62,68 @@ def _default_state() -> Dict[str, Any]:
     }
 
 
-class SwarmStateStore:
-    """Simple JSON-backed state store for orchestrator metadata."""
+class StateBackend(ABC):
+    """Storage interface for deployment metadata.
 
-    def __init__(self, base_path: Path) -> None:
-        self.base_path = base_path
-        self.base_path.mkdir(parents=True, exist_ok=True)
-        self.state_path = self.base_path / STATE_FILE_NAME
-        self._state = self._load()
+    Deployments are written in the shape produced by
+    :meth:`_serialize_deployment` and read back as frozen views (see
+    :func:`freeze`): read-only mappings and tuples that backends may cache
+    and share between callers. Use :func:`thaw` for a mutable copy.
+    """
 
-    # ------------------------------------------------------------------
-    # Core persistence helpers
-    # ------------------------------------------------------------------
-    def _load(self) -> Dict[str, Any]:
-        if not self.state_path.exists():
-            return _default_state()
-
-        with self.state_path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return _default_state() | data
+    base_path: Path
 
-    def _save(self) -> None:
-        self._state["last_updated"] = datetime.now(UTC).isoformat()
-        with self.state_path.open("w", encoding="utf-8") as handle:
-            json.dump(self._state, handle, indent=2)
-
-    # ------------------------------------------------------------------
-    # Deployment management
-    # ------------------------------------------------------------------
+    @abstractmethod
     def record_deployment(self, deployment: Any) -> None:
-        deployments = self._state.setdefault("deployments", {})
-        deployments[deployment.deployment_id] = self._serialize_deployment(deployment)
-        self._state["last_deployment_id"] = deployment.deployment_id
-        self._save()
+        """Store a new deployment and make it the latest one."""
 
+    @abstractmethod
     def update_deployment(self, deployment_id: str, payload: Dict[str, Any]) -> None:
-        deployments = self._state.setdefault("deployments", {})
-        if deployment_id not in deployments:
-            raise KeyError(f"Deployment {deployment_id} not found")
-        deployments[deployment_id].update(payload)
-        self._save()
+        """Replace top-level fields of a deployment."""
+
+    @abstractmethod
+    def update_agents(
+        self,
+        deployment_id: str,
+        agent_type: str,
+        processes: Iterable[Any],
+        *,
+        standby: Iterable[Any] = (),
+    ) -> None:
+        """Persist the instances of a single pool without touching the rest."""
 
+    @abstractmethod
     def remove_deployment(self, deployment_id: str) -> None:
-        deployments = self._state.setdefault("deployments", {})
-        deployments.pop(deployment_id, None)
-        if self._state.get("last_deployment_id") == deployment_id:
-            self._state["last_deployment_id"] = next(iter(deployments or []), None)
-        self._save()
+        ...
 
-    def get_deployment(self, deployment_id: str) -> Optional[Dict[str, Any]]:
-        deployments = self._state.setdefault("deployments", {})
-        payload = deployments.get(deployment_id)
-        return json.loads(json.dumps(payload)) if payload else None
+    @abstractmethod
+    def get_deployment(self, deployment_id: str) -> Optional[Mapping[str, Any]]:
+        ...
 
-    def latest_deployment(self) -> Optional[Dict[str, Any]]:
-        deployment_id = self._state.get("last_deployment_id")
-        if not deployment_id:
-            return None
-        return self.get_deployment(deployment_id)
+    @abstractmethod
+    def latest_deployment(self) -> Optional[Mapping[str, Any]]:
+        ...
 
-    def list_deployments(self) -> Iterable[Dict[str, Any]]:
-        deployments = self._state.setdefault("deployments", {})
-        for payload in deployments.values():
-            yield json.loads(json.dumps(payload))
+    @abstractmethod
+    def deployment_summaries(self) -> List[Dict[str, Any]]:
+        """Ids, instance counts, live CPU pins and whether watchdog budgets are
+        set, for every deployment, oldest first."""
+
+    @abstractmethod
+    def list_deployments(self) -> Iterable[Mapping[str, Any]]:
+        ...
+
+    @abstractmethod
+    def as_dict(self) -> Mapping[str, Any]:
+        """The whole state in the ``state.json`` layout."""
+
+    def flush(self) -> None:
+        """Make every change written so far durable."""
+
+    def close(self) -> None:
+        """Flush and release resources held by the backend."""
+
+        self.flush()
 
     # ------------------------------------------------------------------
     # Serialization helpers
@@ -93,9 +135,14 @@ class SwarmStateStore:
             "start_time": deployment.start_time,
             "config": deployment.config.to_dict() if hasattr(deployment.config, "to_dict") else {},
             "agents": {
-                agent_type: [SwarmStateStore._serialize_process(proc) for proc in processes]
+                agent_type: [StateBackend._serialize_process(proc) for proc in processes]
                 for agent_type, processes in deployment.agents.items()
             },
+            "standby": {
+                agent_type: [StateBackend._serialize_process(proc) for proc in processes]
+                for agent_type, processes in getattr(deployment, "standby", {}).items()
+                if processes
+            },
         }
 
     @staticmethod
@@ -108,11 +155,364 @@ class SwarmStateStore:
             "status": getattr(process, "status", None),
             "cwd": getattr(process, "cwd", None),
             "start_time": getattr(process, "start_time", None),
+            "log_path": getattr(process, "log_path", None),
+            "exit_code": getattr(process, "exit_code", None),
+            "exit_time": getattr(process, "exit_time", None),
+            "cgroup": getattr(process, "cgroup", None),
+            "cpus": getattr(process, "cpus", None),
         }
         return {key: value for key, value in payload.items() if value is not None}
 
+
+class SwarmStateStore(StateBackend):
+    """Journaled JSON state store for orchestrator metadata.
+
+    ``state.json`` holds a snapshot; every mutation since the snapshot is
+    appended to ``state.journal`` as one JSON line, so persisting a change
+    costs O(change) rather than a rewrite of all deployments. Loading replays
+    the journal over the snapshot, and the journal is folded back into a new
+    snapshot once it outgrows ``compact_bytes`` or ``compact_interval``
+    seconds have passed since the last compaction.
+
+    Snapshots are replaced atomically and synced before the journal is
+    truncated. Journal appends are synced individually only with the
+    ``always`` fsync policy; otherwise on :meth:`flush`. Snapshots are
+    written with ``codec``; journal lines are always JSON.
+    """
+
+    def __init__(
+        self,
+        base_path: Path,
+        *,
+        compact_bytes: int = DEFAULT_COMPACT_BYTES,
+        compact_interval: float = DEFAULT_COMPACT_INTERVAL,
+        fsync: Optional[str] = None,
+        codec: Optional[StateCodec] = None,
+    ) -> None:
+        self.base_path = base_path
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.state_path = self.base_path / STATE_FILE_NAME
+        self.journal_path = self.base_path / JOURNAL_FILE_NAME
+        self.compact_bytes = compact_bytes
+        self.compact_interval = compact_interval
+        self.fsync = fsync_policy(fsync)
+        self.codec = codec or StateCodec()
+        self.logger = logging.getLogger(__name__)
+        self._last_compaction = time.monotonic()
+        self._state = self._load()
+        # Frozen views handed out by the getters, rebuilt only when the
+        # deployment changes.
+        self._views: Dict[str, Mapping[str, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # Core persistence helpers
+    # ------------------------------------------------------------------
+    def _load(self) -> Dict[str, Any]:
+        state = self._read_snapshot()
+        if self.journal_path.exists():
+            with self.journal_path.open("rb") as handle:
+                for record in self._read_journal(handle):
+                    self._apply(state, record)
+        return state
+
+    def _read_snapshot(self) -> Dict[str, Any]:
+        if not self.state_path.exists():
+            return _default_state()
+
+        return _default_state() | decode(self.state_path.read_bytes())
+
+    def _read_journal(self, handle: Any) -> List[Dict[str, Any]]:
+        records = []
+        for line in handle:
+            try:
+                records.append(json_loads(line))
+            except ValueError:
+                # A torn line from an interrupted append.
+                self.logger.warning("Ignoring corrupt state journal entry in %s", self.journal_path)
+        return records
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        record["at"] = datetime.now(UTC).isoformat()
+        self._apply(self._state, record)
+        self._refresh_view(record)
+        line = json_dumps(record) + b"\n"
+
+        # The lock keeps appends from other CLI processes or the daemon from
+        # interleaving with a compaction that truncates the journal.
+        with _locked_journal(self.journal_path) as handle:
+            if handle.seek(0, os.SEEK_END) > 0:
+                handle.seek(-1, os.SEEK_END)
+                if handle.read(1) != b"\n":
+                    # Terminate a torn entry so it cannot swallow this one.
+                    line = b"\n" + line
+            handle.write(line)
+            handle.flush()
+            if self.fsync == "always":
+                os.fsync(handle.fileno())
+            journal_size = handle.tell()
+
+        if journal_size >= self.compact_bytes or (
+            time.monotonic() - self._last_compaction >= self.compact_interval
+        ):
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold the journal into a fresh snapshot and truncate it."""
+
+        with _locked_journal(self.journal_path) as handle:
+            # Rebuild from disk so entries appended by other processes
+            # since this store loaded are kept.
+            handle.seek(0)
+            state = self._read_snapshot()
+            for record in self._read_journal(handle):
+                self._apply(state, record)
+
+            # The snapshot must be durable before the journal entries it
+            # absorbed are dropped.
+            atomic_write(
+                self.state_path,
+                self.codec.encode(state),
+                fsync=self.fsync != "never",
+            )
+            handle.truncate(0)
+
+        self._state = state
+        self._views.clear()
+        self._last_compaction = time.monotonic()
+
+    def flush(self) -> None:
+        if self.fsync == "never" or not self.journal_path.exists():
+            return
+        with self.journal_path.open("rb") as handle:
+            os.fsync(handle.fileno())
+
+    def _refresh_view(self, record: Dict[str, Any]) -> None:
+        if record["op"] == "put":
+            self._views.pop(record["deployment"]["deployment_id"], None)
+            return
+        deployment_id = record["deployment_id"]
+        view = self._views.get(deployment_id)
+        if view is None or record["op"] != "agents":
+            self._views.pop(deployment_id, None)
+            return
+
+        # Swap in the one pool that changed and share everything else.
+        agent_type = record["agent_type"]
+        agents = MappingProxyType({**view["agents"], agent_type: freeze(record["agents"])})
+        standby = dict(view.get("standby", {}))
+        if record.get("standby"):
+            standby[agent_type] = freeze(record["standby"])
+        else:
+            standby.pop(agent_type, None)
+        self._views[deployment_id] = MappingProxyType(
+            {**view, "agents": agents, "standby": MappingProxyType(standby)}
+        )
+
+    @staticmethod
+    def _apply(state: Dict[str, Any], record: Dict[str, Any]) -> None:
+        """Apply one journal record; every operation is idempotent."""
+
+        deployments = state.setdefault("deployments", {})
+        op = record.get("op")
+        if op == "put":
+            deployment = record["deployment"]
+            deployments[deployment["deployment_id"]] = deployment
+            state["last_deployment_id"] = deployment["deployment_id"]
+        elif op == "update":
+            if record["deployment_id"] in deployments:
+                deployments[record["deployment_id"]].update(record["payload"])
+        elif op == "agents":
+            deployment = deployments.get(record["deployment_id"])
+            if deployment is not None:
+                agent_type = record["agent_type"]
+                deployment.setdefault("agents", {})[agent_type] = record["agents"]
+                standby = deployment.setdefault("standby", {})
+                if record.get("standby"):
+                    standby[agent_type] = record["standby"]
+                else:
+                    standby.pop(agent_type, None)
+        elif op == "remove":
+            deployments.pop(record["deployment_id"], None)
+            if state.get("last_deployment_id") == record["deployment_id"]:
+                # The most recent remaining deployment, as in SQLite.
+                state["last_deployment_id"] = next(reversed(deployments), None)
+        else:
+            return
+        state["last_updated"] = record.get("at")
+
+    # ------------------------------------------------------------------
+    # Deployment management
+    # ------------------------------------------------------------------
+    def record_deployment(self, deployment: Any) -> None:
+        self._append({"op": "put", "deployment": self._serialize_deployment(deployment)})
+
+    def update_deployment(self, deployment_id: str, payload: Dict[str, Any]) -> None:
+        deployments = self._state.setdefault("deployments", {})
+        if deployment_id not in deployments:
+            raise KeyError(f"Deployment {deployment_id} not found")
+        self._append({"op": "update", "deployment_id": deployment_id, "payload": payload})
+
+    def update_agents(
+        self,
+        deployment_id: str,
+        agent_type: str,
+        processes: Iterable[Any],
+        *,
+        standby: Iterable[Any] = (),
+    ) -> None:
+        """Persist the instances of a single pool without touching the rest."""
+
+        deployments = self._state.setdefault("deployments", {})
+        if deployment_id not in deployments:
+            raise KeyError(f"Deployment {deployment_id} not found")
+        self._append(
+            {
+                "op": "agents",
+                "deployment_id": deployment_id,
+                "agent_type": agent_type,
+                "agents": [self._serialize_process(proc) for proc in processes],
+                "standby": [self._serialize_process(proc) for proc in standby],
+            }
+        )
+
+    def remove_deployment(self, deployment_id: str) -> None:
+        self._append({"op": "remove", "deployment_id": deployment_id})
+
+    def get_deployment(self, deployment_id: str) -> Optional[Mapping[str, Any]]:
+        view = self._views.get(deployment_id)
+        if view is None:
+            payload = self._state.setdefault("deployments", {}).get(deployment_id)
+            if not payload:
+                return None
+            view = self._views[deployment_id] = freeze(payload)
+        return view
+
+    def latest_deployment(self) -> Optional[Mapping[str, Any]]:
+        deployment_id = self._state.get("last_deployment_id")
+        if not deployment_id:
+            return None
+        return self.get_deployment(deployment_id)
+
+    def deployment_summaries(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "deployment_id": deployment_id,
+                "start_time": payload.get("start_time", ""),
+                "agents": {
+                    agent_type: len(entries)
+                    for agent_type, entries in payload.get("agents", {}).items()
+                },
+                "standby": {
+                    agent_type: len(entries)
+                    for agent_type, entries in payload.get("standby", {}).items()
+                },
+                "cpus": [
+                    entry["cpus"]
+                    for role in ("agents", "standby")
+                    for entries in payload.get(role, {}).values()
+                    for entry in entries
+                    if entry.get("cpus") and entry.get("exit_time") is None
+                ],
+                "budgeted": has_instance_budgets(payload.get("config", {})),
+            }
+            for deployment_id, payload in self._state.setdefault("deployments", {}).items()
+        ]
+
+    def list_deployments(self) -> Iterable[Mapping[str, Any]]:
+        for deployment_id in list(self._state.setdefault("deployments", {})):
+            view = self.get_deployment(deployment_id)
+            if view is not None:
+                yield view
+
     # ------------------------------------------------------------------
     # Convenience accessors used by CLI
     # ------------------------------------------------------------------
-    def as_dict(self) -> Dict[str, Any]:
-        return json.loads(json.dumps(self._state))
+    def as_dict(self) -> Mapping[str, Any]:
+        return MappingProxyType(
+            {
+                "deployments": MappingProxyType(
+                    {payload["deployment_id"]: payload for payload in self.list_deployments()}
+                ),
+                "last_deployment_id": self._state.get("last_deployment_id"),
+                "last_updated": self._state.get("last_updated"),
+            }
+        )
+
+
+def open_state_store(base_path: Path, *, backend: Optional[str] = None) -> StateBackend:
+    """Open the state store of a project.
+
+    The backend is ``backend``, else ``$AGENTSWARM_STATE_BACKEND``, else
+    SQLite when ``state.db`` exists and the JSON journal otherwise. Asking
+    for SQLite on a project that still has JSON state migrates it first.
+    """
+
+    backend = backend or os.environ.get(STATE_BACKEND_ENV)
+    if backend is None:
+        backend = "sqlite" if (base_path / SQLITE_FILE_NAME).exists() else "json"
+    if backend not in STATE_BACKENDS:
+        raise ValueError(
+            f"Unknown state backend '{backend}'. Expected one of: {', '.join(sorted(STATE_BACKENDS))}"
+        )
+    if backend == "json":
+        return SwarmStateStore(base_path)
+
+    from .state_sqlite import SqliteStateStore
+
+    if not (base_path / SQLITE_FILE_NAME).exists() and (
+        (base_path / STATE_FILE_NAME).exists() or (base_path / JOURNAL_FILE_NAME).exists()
+    ):
+        return migrate_to_sqlite(base_path)
+    return SqliteStateStore(base_path)
+
+
+def migrate_to_sqlite(base_path: Path) -> StateBackend:
+    """Copy JSON state into ``state.db`` and retire the JSON files.
+
+    The JSON files are renamed with a ``.migrated`` suffix rather than
+    deleted, so the migration can be undone by renaming them back. The
+    journal lock is held from reading the JSON state until the files are
+    retired, so no append or compaction can slip in between. JSON stores
+    that write afterwards get :class:`JournalRetiredError` instead of
+    appending to a journal nobody reads.
+    """
+
+    from .state_sqlite import SqliteStateStore
+
+    try:
+        with _locked_journal(base_path / JOURNAL_FILE_NAME):
+            source = SwarmStateStore(base_path)
+            target = SqliteStateStore(base_path)
+            target.import_state(thaw(source.as_dict()))
+            for path in (source.state_path, source.journal_path):
+                if path.exists():
+                    os.replace(path, path.with_name(path.name + MIGRATED_SUFFIX))
+    except JournalRetiredError:
+        # Another process migrated first.
+        return SqliteStateStore(base_path)
+    return target
+
+
+@contextmanager
+def _locked_journal(journal_path: Path) -> Iterator[BinaryIO]:
+    """Open the journal for appending under an exclusive ``flock``."""
+
+    retired = f"State journal {journal_path} was retired; reopen the state store"
+    if not journal_path.exists() and journal_path.with_name(
+        journal_path.name + MIGRATED_SUFFIX
+    ).exists():
+        raise JournalRetiredError(retired)
+    journal_path.parent.mkdir(parents=True, exist_ok=True)
+    with journal_path.open("a+b") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            try:
+                current = os.stat(journal_path)
+            except FileNotFoundError:
+                current = None
+            if current is None or not os.path.samestat(current, os.fstat(handle.fileno())):
+                # Renamed away while this process waited for the lock.
+                raise JournalRetiredError(retired)
+            yield handle
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
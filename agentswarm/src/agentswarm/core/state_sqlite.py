@@ -0,0 +1,475 @@
+"""SQLite state backend for multi-process deployments."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .config import has_instance_budgets
+from .persistence import fsync_policy
+from .state import SQLITE_FILE_NAME, StateBackend, freeze
+
+SCHEMA_VERSION = 1
+DEFAULT_BUSY_TIMEOUT = 10.0  # seconds
+
+_ROLES = ("agents", "standby")
+# Columns of a deployment row; every other top-level key lives in ``extra``.
+_DEPLOYMENT_COLUMNS = ("deployment_id", "start_time", "config")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS deployments (
+    deployment_id TEXT PRIMARY KEY,
+    start_time TEXT NOT NULL DEFAULT '',
+    config TEXT NOT NULL DEFAULT '{}',
+    extra TEXT NOT NULL DEFAULT '{}',
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS pools (
+    deployment_id TEXT NOT NULL
+        REFERENCES deployments (deployment_id) ON DELETE CASCADE,
+    agent_type TEXT NOT NULL,
+    PRIMARY KEY (deployment_id, agent_type)
+);
+CREATE TABLE IF NOT EXISTS processes (
+    deployment_id TEXT NOT NULL
+        REFERENCES deployments (deployment_id) ON DELETE CASCADE,
+    agent_type TEXT NOT NULL,
+    role TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    instance_id INTEGER,
+    pid INTEGER,
+    status TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (deployment_id, agent_type, role, position)
+);
+CREATE INDEX IF NOT EXISTS idx_processes_agent_type ON processes (agent_type, status);
+CREATE INDEX IF NOT EXISTS idx_processes_status ON processes (status);
+"""
+
+
+class SqliteStateStore(StateBackend):
+    """State in ``state.db``: one row per deployment and one per process.
+
+    The database runs in WAL mode, so readers never block the writer and
+    any number of CLI processes and the daemon can share it. Writes are
+    short ``BEGIN IMMEDIATE`` transactions that wait up to ``busy_timeout``
+    for a concurrent writer, and updating one pool rewrites only that
+    pool's process rows. Frozen views are cached until ``PRAGMA
+    data_version`` reports a commit from another connection or this store
+    writes, so every read still sees the latest committed state.
+    """
+
+    def __init__(
+        self,
+        base_path: Path,
+        *,
+        busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+        fsync: Optional[str] = None,
+    ) -> None:
+        self.base_path = base_path
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.base_path / SQLITE_FILE_NAME
+        self.logger = logging.getLogger(__name__)
+        self._conn = sqlite3.connect(
+            self.db_path,
+            timeout=busy_timeout,
+            isolation_level=None,  # transactions are managed explicitly
+            check_same_thread=False,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._views: Dict[str, Mapping[str, Any]] = {}
+        self._views_version: Optional[Tuple[int, int]] = None
+        self._writes = 0
+        self.fsync = fsync_policy(fsync)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # NORMAL syncs the WAL at checkpoints only; FULL syncs every commit.
+        synchronous = {"always": "FULL", "batched": "NORMAL", "never": "OFF"}[self.fsync]
+        self._conn.execute(f"PRAGMA synchronous={synchronous}")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        with self._transaction() as conn:
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
+
+    def flush(self) -> None:
+        if self.fsync != "never":
+            self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Deployment management
+    # ------------------------------------------------------------------
+    def record_deployment(self, deployment: Any) -> None:
+        self._put(self._serialize_deployment(deployment))
+
+    def update_deployment(self, deployment_id: str, payload: Dict[str, Any]) -> None:
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT extra FROM deployments WHERE deployment_id = ?", (deployment_id,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"Deployment {deployment_id} not found")
+
+            extra = json.loads(row["extra"])
+            columns: Dict[str, Any] = {}
+            for key, value in payload.items():
+                if key == "config":
+                    columns["config"] = json.dumps(value)
+                elif key == "start_time":
+                    columns["start_time"] = value or ""
+                elif key in _ROLES:
+                    # Replacing the whole mapping, as the JSON store does.
+                    conn.execute(
+                        "DELETE FROM processes WHERE deployment_id = ? AND role = ?",
+                        (deployment_id, key),
+                    )
+                    if key == "agents":
+                        conn.execute("DELETE FROM pools WHERE deployment_id = ?", (deployment_id,))
+                    for agent_type, entries in (value or {}).items():
+                        self._insert_processes(conn, deployment_id, agent_type, key, entries)
+                elif key != "deployment_id":
+                    extra[key] = value
+            columns["extra"] = json.dumps(extra)
+            columns["updated_at"] = _now()
+            assignments = ", ".join(f"{column} = ?" for column in columns)
+            conn.execute(
+                f"UPDATE deployments SET {assignments} WHERE deployment_id = ?",
+                (*columns.values(), deployment_id),
+            )
+            self._touch(conn)
+
+    def update_agents(
+        self,
+        deployment_id: str,
+        agent_type: str,
+        processes: Iterable[Any],
+        *,
+        standby: Iterable[Any] = (),
+    ) -> None:
+        agents = [self._serialize_process(proc) for proc in processes]
+        standby_entries = [self._serialize_process(proc) for proc in standby]
+        with self._transaction() as conn:
+            updated = conn.execute(
+                "UPDATE deployments SET updated_at = ? WHERE deployment_id = ?",
+                (_now(), deployment_id),
+            ).rowcount
+            if not updated:
+                raise KeyError(f"Deployment {deployment_id} not found")
+            conn.execute(
+                "DELETE FROM processes WHERE deployment_id = ? AND agent_type = ?",
+                (deployment_id, agent_type),
+            )
+            self._insert_processes(conn, deployment_id, agent_type, "agents", agents)
+            self._insert_processes(conn, deployment_id, agent_type, "standby", standby_entries)
+            self._touch(conn)
+
+    def remove_deployment(self, deployment_id: str) -> None:
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM deployments WHERE deployment_id = ?", (deployment_id,))
+            if self._meta(conn, "last_deployment_id") == deployment_id:
+                row = conn.execute(
+                    "SELECT deployment_id FROM deployments ORDER BY rowid DESC LIMIT 1"
+                ).fetchone()
+                self._set_meta(conn, "last_deployment_id", row[0] if row else None)
+            self._touch(conn)
+
+    def get_deployment(self, deployment_id: str) -> Optional[Mapping[str, Any]]:
+        with self._snapshot() as conn:
+            return self._view(conn, deployment_id)
+
+    def latest_deployment(self) -> Optional[Mapping[str, Any]]:
+        with self._snapshot() as conn:
+            deployment_id = self._meta(conn, "last_deployment_id")
+            return self._view(conn, deployment_id) if deployment_id else None
+
+    def deployment_summaries(self) -> List[Dict[str, Any]]:
+        with self._snapshot() as conn:
+            return self._read_summaries(conn)
+
+    def list_deployments(self) -> Iterable[Mapping[str, Any]]:
+        deployment_ids = [
+            row[0]
+            for row in self._conn.execute("SELECT deployment_id FROM deployments ORDER BY rowid")
+        ]
+        for deployment_id in deployment_ids:
+            payload = self.get_deployment(deployment_id)
+            if payload is not None:
+                yield payload
+
+    def list_processes(
+        self,
+        *,
+        agent_type: Optional[str] = None,
+        status: Optional[str] = None,
+        deployment_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Running instances matching the filters, served from the indexes."""
+
+        clauses: List[str] = ["role = 'agents'"]
+        params: List[Any] = []
+        for column, value in (
+            ("deployment_id", deployment_id),
+            ("agent_type", agent_type),
+            ("status", status),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        rows = self._conn.execute(
+            f"SELECT deployment_id, data FROM processes WHERE {' AND '.join(clauses)}"
+            " ORDER BY deployment_id, agent_type, position",
+            params,
+        )
+        return [
+            {"deployment_id": row["deployment_id"], **json.loads(row["data"])} for row in rows
+        ]
+
+    def as_dict(self) -> Mapping[str, Any]:
+        with self._snapshot() as conn:
+            deployments = {}
+            for (deployment_id,) in conn.execute(
+                "SELECT deployment_id FROM deployments ORDER BY rowid"
+            ).fetchall():
+                deployments[deployment_id] = self._view(conn, deployment_id)
+            return freeze(
+                {
+                    "deployments": deployments,
+                    "last_deployment_id": self._meta(conn, "last_deployment_id"),
+                    "last_updated": self._meta(conn, "last_updated"),
+                }
+            )
+
+    def import_state(self, state: Dict[str, Any]) -> None:
+        """Load a ``state.json`` layout in one transaction (used by migration)."""
+
+        with self._transaction() as conn:
+            for payload in state.get("deployments", {}).values():
+                self._write_deployment(conn, payload)
+            self._set_meta(conn, "last_deployment_id", state.get("last_deployment_id"))
+            self._set_meta(conn, "last_updated", state.get("last_updated") or _now())
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    @contextmanager
+    def _snapshot(self) -> Iterator[sqlite3.Connection]:
+        # A read transaction, so multi-statement reads see one WAL snapshot.
+        self._conn.execute("BEGIN")
+        try:
+            yield self._conn
+        finally:
+            self._conn.execute("COMMIT")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # IMMEDIATE takes the write lock up front, so concurrent writers
+        # queue on busy_timeout instead of failing on lock upgrade.
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        self._writes += 1
+
+    def _view(self, conn: sqlite3.Connection, deployment_id: str) -> Optional[Mapping[str, Any]]:
+        version = (conn.execute("PRAGMA data_version").fetchone()[0], self._writes)
+        if version != self._views_version:
+            self._views.clear()
+            self._views_version = version
+        view = self._views.get(deployment_id)
+        if view is None:
+            payload = self._read_deployment(conn, deployment_id)
+            if payload is None:
+                return None
+            view = self._views[deployment_id] = freeze(payload)
+        return view
+
+    def _read_deployment(
+        self, conn: sqlite3.Connection, deployment_id: str
+    ) -> Optional[Dict[str, Any]]:
+        row = conn.execute(
+            "SELECT * FROM deployments WHERE deployment_id = ?", (deployment_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        agent_types = [
+            pool[0]
+            for pool in conn.execute(
+                "SELECT agent_type FROM pools WHERE deployment_id = ?", (deployment_id,)
+            )
+        ]
+        processes = conn.execute(
+            "SELECT agent_type, role, data FROM processes WHERE deployment_id = ?"
+            " ORDER BY agent_type, role, position",
+            (deployment_id,),
+        ).fetchall()
+        return self._assemble(row, agent_types, processes)
+
+    def _read_summaries(self, conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+        summaries: Dict[str, Dict[str, Any]] = {}
+        for row in conn.execute(
+            "SELECT deployment_id, start_time, config FROM deployments ORDER BY rowid"
+        ):
+            summaries[row["deployment_id"]] = {
+                "deployment_id": row["deployment_id"],
+                "start_time": row["start_time"],
+                "agents": {},
+                "standby": {},
+                "cpus": [],
+                "budgeted": has_instance_budgets(json.loads(row["config"])),
+            }
+        for row in conn.execute(
+            "SELECT deployment_id, agent_type, role, COUNT(*) AS count FROM processes"
+            " GROUP BY deployment_id, agent_type, role"
+        ):
+            summary = summaries.get(row["deployment_id"])
+            if summary is not None:
+                summary[row["role"]][row["agent_type"]] = row["count"]
+        for row in conn.execute(
+            "SELECT deployment_id, json_extract(data, '$.cpus') AS cpus FROM processes"
+            " WHERE json_extract(data, '$.cpus') IS NOT NULL"
+            " AND json_extract(data, '$.exit_time') IS NULL"
+            " ORDER BY rowid"
+        ):
+            summary = summaries.get(row["deployment_id"])
+            if summary is not None:
+                summary["cpus"].append(row["cpus"])
+        # Pools scaled down to zero still belong to their deployment.
+        for row in conn.execute("SELECT deployment_id, agent_type FROM pools"):
+            summary = summaries.get(row["deployment_id"])
+            if summary is not None:
+                summary["agents"].setdefault(row["agent_type"], 0)
+        return list(summaries.values())
+
+    def _put(self, payload: Dict[str, Any]) -> None:
+        with self._transaction() as conn:
+            self._write_deployment(conn, payload)
+            self._set_meta(conn, "last_deployment_id", payload["deployment_id"])
+            self._touch(conn)
+
+    def _write_deployment(self, conn: sqlite3.Connection, payload: Dict[str, Any]) -> None:
+        deployment_id = payload["deployment_id"]
+        extra = {
+            key: value
+            for key, value in payload.items()
+            if key not in _DEPLOYMENT_COLUMNS and key not in _ROLES
+        }
+        conn.execute(
+            "INSERT INTO deployments (deployment_id, start_time, config, extra, updated_at)"
+            " VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (deployment_id) DO UPDATE SET start_time = excluded.start_time,"
+            " config = excluded.config, extra = excluded.extra, updated_at = excluded.updated_at",
+            (
+                deployment_id,
+                payload.get("start_time") or "",
+                json.dumps(payload.get("config", {})),
+                json.dumps(extra),
+                _now(),
+            ),
+        )
+        conn.execute("DELETE FROM processes WHERE deployment_id = ?", (deployment_id,))
+        conn.execute("DELETE FROM pools WHERE deployment_id = ?", (deployment_id,))
+        for role in _ROLES:
+            for agent_type, entries in payload.get(role, {}).items():
+                self._insert_processes(conn, deployment_id, agent_type, role, entries)
+
+    @staticmethod
+    def _insert_processes(
+        conn: sqlite3.Connection,
+        deployment_id: str,
+        agent_type: str,
+        role: str,
+        entries: List[Dict[str, Any]],
+    ) -> None:
+        if role == "agents":
+            conn.execute(
+                "INSERT OR IGNORE INTO pools (deployment_id, agent_type) VALUES (?, ?)",
+                (deployment_id, agent_type),
+            )
+        conn.executemany(
+            "INSERT INTO processes"
+            " (deployment_id, agent_type, role, position, instance_id, pid, status, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    deployment_id,
+                    agent_type,
+                    role,
+                    position,
+                    entry.get("instance_id"),
+                    entry.get("pid"),
+                    entry.get("status"),
+                    json.dumps(entry, separators=(",", ":")),
+                )
+                for position, entry in enumerate(entries)
+            ],
+        )
+
+    @staticmethod
+    def _assemble(
+        row: sqlite3.Row, agent_types: List[str], processes: List[sqlite3.Row]
+    ) -> Dict[str, Any]:
+        config = json.loads(row["config"])
+        extra = json.loads(row["extra"])
+        pools: Dict[str, Dict[str, List[Dict[str, Any]]]] = {role: {} for role in _ROLES}
+        for agent_type in agent_types:
+            pools["agents"][agent_type] = []
+        for process in processes:
+            pools[process["role"]].setdefault(process["agent_type"], []).append(
+                json.loads(process["data"])
+            )
+
+        # Present pools in config order, like the deployment that wrote them.
+        order = {agent_type: index for index, agent_type in enumerate(config.get("agents", {}))}
+
+        def ordered(entries: Dict[str, Any]) -> Dict[str, Any]:
+            return dict(
+                sorted(entries.items(), key=lambda item: (order.get(item[0], len(order)), item[0]))
+            )
+
+        return {
+            "deployment_id": row["deployment_id"],
+            "start_time": row["start_time"],
+            "config": config,
+            "agents": ordered(pools["agents"]),
+            "standby": ordered(pools["standby"]),
+            **extra,
+        }
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta(conn: sqlite3.Connection, key: str, value: Optional[str]) -> None:
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?)"
+            " ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def _touch(self, conn: sqlite3.Connection) -> None:
+        self._set_meta(conn, "last_updated", _now())
+
+
+def _now() -> str:
+    return datetime.now(UTC).isoformat()
@@ -0,0 +1,268 @@
+"""Enforce wall-clock timeouts and RSS growth budgets on agent instances."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
+
+import psutil
+
+from .config import AgentConfig, parse_duration, parse_size
+from .models import AgentProcess
+
+if TYPE_CHECKING:
+    from .orchestrator import AgentOrchestrator
+
+DEFAULT_WATCHDOG_INTERVAL = 30.0  # seconds
+DEFAULT_RSS_WARMUP = 60.0  # seconds
+WATCHDOG_ACTIONS = {"recycle", "kill"}
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+@dataclass(slots=True)
+class WatchdogPolicy:
+    """Budgets for one agent type.
+
+    ``timeout`` comes from ``resources.timeout`` and falls back to
+    ``deployment.instance_timeout``; both are off unless set. The
+    deployment-wide ``deployment.timeout`` always carries a default, so it
+    is not an instance budget. ``rss_growth`` (``resources.rss_growth``) is how
+    far RSS may climb above the lowest value seen once ``rss_warmup`` has
+    passed. ``on_violation`` is ``recycle`` (restart in place) or ``kill``.
+    """
+
+    timeout: float = 0.0
+    rss_growth: int = 0
+    rss_warmup: float = DEFAULT_RSS_WARMUP
+    action: str = "recycle"
+
+    @classmethod
+    def from_config(
+        cls, agent_config: AgentConfig, deployment_config: Dict[str, Any]
+    ) -> Optional["WatchdogPolicy"]:
+        resources = agent_config.get("resources") or {}
+        timeout = parse_duration(
+            resources.get("timeout", deployment_config.get("instance_timeout"))
+        )
+        rss_growth = resources.get("rss_growth")
+        rss_growth = parse_size(rss_growth) if rss_growth is not None else 0
+        if not timeout and not rss_growth:
+            return None
+
+        action = resources.get("on_violation", "recycle")
+        if action not in WATCHDOG_ACTIONS:
+            raise ValueError(
+                f"Unknown watchdog action '{action}'."
+                f" Expected one of: {', '.join(sorted(WATCHDOG_ACTIONS))}"
+            )
+        return cls(
+            timeout=timeout,
+            rss_growth=rss_growth,
+            rss_warmup=parse_duration(resources.get("rss_warmup"), default=DEFAULT_RSS_WARMUP),
+            action=action,
+        )
+
+
+@dataclass(slots=True)
+class Violation:
+    deployment_id: str
+    agent_type: str
+    instance_id: int
+    pid: int
+    reason: str
+    action: str
+
+
+class Watchdog:
+    """Periodically check running instances against their budgets.
+
+    Runs on the daemon's event loop next to the autoscaler; one-shot CLI
+    commands do not enforce budgets, so ``resources.timeout`` and
+    ``resources.rss_growth`` need a running daemon. Uptime is
+    derived from ``AgentProcess.start_time`` and RSS is read from
+    ``/proc/<pid>/statm``, so a tick costs one small read per instance that
+    has an RSS budget. Violators are recycled through
+    ``AgentPool.restart_instance`` so pool capacity is restored, or killed.
+    """
+
+    def __init__(
+        self,
+        orchestrator: "AgentOrchestrator",
+        *,
+        lock: Optional[asyncio.Lock] = None,
+        interval: float = DEFAULT_WATCHDOG_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.orchestrator = orchestrator
+        self.logger = logging.getLogger(__name__)
+        self.interval = interval
+        self._lock = lock or asyncio.Lock()
+        self._clock = clock
+        self._baselines: Dict[int, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def tick(self) -> List[Violation]:
+        """Check every instance once and enforce; returns what was enforced."""
+
+        violations = self.check()
+        # check() may have hydrated deployments; watch their processes here.
+        self.orchestrator.watch_hydrated()
+        enforced: List[Violation] = []
+        for violation in violations:
+            async with self._lock:
+                try:
+                    if await self._enforce(violation):
+                        enforced.append(violation)
+                except Exception as exc:  # noqa: BLE001 - retry next interval
+                    self.logger.error(
+                        "Could not %s %s instance %s: %s",
+                        violation.action,
+                        violation.agent_type,
+                        violation.instance_id,
+                        exc,
+                    )
+        return enforced
+
+    def check(self) -> List[Violation]:
+        """Find violators in every recorded deployment that sets budgets.
+
+        Deployments without budgets are skipped without being hydrated;
+        budgeted ones are hydrated on first sight, even when no command has
+        touched them since the daemon started.
+        """
+
+        now = self._clock()
+        violations: List[Violation] = []
+        live: Set[int] = set()
+        for summary in self.orchestrator.deployment_summaries():
+            if not summary.budgeted:
+                continue
+            deployment_id = summary.deployment_id
+            try:
+                deployment = self.orchestrator.get_deployment(deployment_id)
+            except ValueError:
+                continue  # Removed by another process since it was indexed
+            for agent_type, agent_config in deployment.config.agents.items():
+                try:
+                    policy = WatchdogPolicy.from_config(agent_config, deployment.config.deployment)
+                except ValueError as exc:
+                    self.logger.warning("Ignoring watchdog budgets for %s: %s", agent_type, exc)
+                    continue
+                if policy is None:
+                    continue
+                pool = self.orchestrator.pools.get((deployment_id, agent_type))
+                if pool is None:
+                    continue
+                for process in pool.registry:
+                    if not process.is_alive():
+                        continue
+                    live.add(process.pid)
+                    reason = self._check_process(process, policy, now)
+                    if reason is not None:
+                        violations.append(
+                            Violation(
+                                deployment_id=deployment_id,
+                                agent_type=agent_type,
+                                instance_id=process.instance_id,
+                                pid=process.pid,
+                                reason=reason,
+                                action=policy.action,
+                            )
+                        )
+
+        for pid in [pid for pid in self._baselines if pid not in live]:
+            del self._baselines[pid]
+        return violations
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.tick()
+            except Exception as exc:  # noqa: BLE001 - keep the loop alive
+                self.logger.error("Watchdog tick failed: %s", exc)
+
+    def _check_process(
+        self, process: AgentProcess, policy: WatchdogPolicy, now: float
+    ) -> Optional[str]:
+        uptime = now - process.start_time
+        if policy.timeout and uptime > policy.timeout:
+            return f"running for {uptime:.0f}s (timeout {policy.timeout:.0f}s)"
+        if not policy.rss_growth or uptime < policy.rss_warmup:
+            return None
+
+        rss = _read_rss(process.pid)
+        if rss is None:
+            return None
+        baseline = self._baselines.get(process.pid)
+        if baseline is None or rss < baseline:
+            self._baselines[process.pid] = rss
+            return None
+        growth = rss - baseline
+        if growth > policy.rss_growth:
+            return (
+                f"RSS grew by {growth // (1024 * 1024)}MB"
+                f" (budget {policy.rss_growth // (1024 * 1024)}MB)"
+            )
+        return None
+
+    async def _enforce(self, violation: Violation) -> bool:
+        pool = self.orchestrator.pools.get((violation.deployment_id, violation.agent_type))
+        process = pool.registry.get(violation.instance_id) if pool is not None else None
+        if process is None or process.pid != violation.pid or not process.is_alive():
+            return False  # Replaced or gone while waiting for the lock
+
+        self.logger.warning(
+            "%s instance %s (pid=%s) %s; %s",
+            violation.agent_type,
+            violation.instance_id,
+            violation.pid,
+            violation.reason,
+            "recycling" if violation.action == "recycle" else "killing",
+        )
+        self._baselines.pop(violation.pid, None)
+        if violation.action == "recycle":
+            await self.orchestrator.restart_instance(
+                violation.agent_type, violation.instance_id, deployment_id=violation.deployment_id
+            )
+        else:
+            await self.orchestrator.stop_instance(
+                violation.agent_type, violation.instance_id, deployment_id=violation.deployment_id
+            )
+        return True
+
+
+def _read_rss(pid: int) -> Optional[int]:
+    try:
+        with open(f"/proc/{pid}/statm", "rb") as handle:
+            return int(handle.read().split()[1]) * _PAGE_SIZE
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, IndexError):
+        return None
+    try:
+        return psutil.Process(pid).memory_info().rss
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
@@ -0,0 +1,192 @@
+"""Event-driven tracking of agent process exits."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import signal
+import time
+from typing import Callable, Dict, List, Optional
+
+from .models import AgentProcess
+
+
+ExitCallback = Callable[[AgentProcess], None]
+
+
+class ProcessWatcher:
+    """Record agent exits as they happen instead of probing every process.
+
+    On Linux each agent gets a pidfd registered with the event loop, which
+    becomes readable the moment the process exits. Where pidfds are not
+    available, spawned children are reaped from a SIGCHLD handler instead.
+    Watched processes answer ``is_alive`` from their recorded exit state, so
+    health and status checks no longer issue a syscall per instance.
+
+    Registrations are tied to the loop they were made on: after that loop
+    stops, processes probe themselves again until they are watched anew.
+    """
+
+    def __init__(self, *, on_exit: Optional[ExitCallback] = None) -> None:
+        self.logger = logging.getLogger(__name__)
+        self._on_exit = on_exit
+        self._processes: Dict[int, AgentProcess] = {}
+        self._pidfds: Dict[int, int] = {}
+        self._waiters: Dict[int, List[asyncio.Future]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sigchld_installed = False
+        self._pidfd_supported = hasattr(os, "pidfd_open")
+
+    def watch(self, process: AgentProcess) -> bool:
+        """Start tracking ``process``; must be called from the event loop.
+
+        Returns False when the process cannot be watched, in which case
+        ``AgentProcess.is_alive`` keeps probing it directly.
+        """
+
+        if process.watched or process.exit_time is not None:
+            return True
+        if process.pid <= 0:
+            return False
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._reset(loop)
+            if process.watched:
+                return True
+
+        if self._pidfd_supported and self._watch_pidfd(process, loop):
+            return True
+        if process.handle is not None and self._install_sigchld(loop):
+            self._register(process)
+            # The child may have exited before the handler was installed.
+            if process.handle.poll() is not None:
+                self._record_exit(process, process.handle.returncode)
+            return True
+        return False
+
+    def unwatch(self, process: AgentProcess) -> None:
+        self._processes.pop(process.pid, None)
+        self._close_pidfd(process.pid)
+        for future in self._waiters.pop(process.pid, []):
+            if not future.done():
+                future.cancel()
+        process.watch_loop = None
+
+    def exit_future(self, process: AgentProcess) -> asyncio.Future:
+        """Future resolved with the exit code once ``process`` exits."""
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        if process.exit_time is not None:
+            future.set_result(process.exit_code)
+        else:
+            self._waiters.setdefault(process.pid, []).append(future)
+        return future
+
+    def close(self) -> None:
+        for pid in list(self._pidfds):
+            self._close_pidfd(pid)
+        if self._sigchld_installed and self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_signal_handler(signal.SIGCHLD)
+        self._sigchld_installed = False
+        for process in self._processes.values():
+            process.watch_loop = None
+        self._processes.clear()
+        self._waiters.clear()
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _reset(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Registrations belong to a single loop; one-shot CLI commands may
+        # run several loops in sequence, so move everything to the new one.
+        previous = list(self._processes.values())
+        self.close()
+        self._loop = loop
+        for process in previous:
+            self.watch(process)
+
+    def _watch_pidfd(self, process: AgentProcess, loop: asyncio.AbstractEventLoop) -> bool:
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except ProcessLookupError:
+            self._register(process)
+            self._record_exit(process, self._reap(process))
+            return True
+        except OSError:
+            # Kernel without pidfd support (ENOSYS) or restricted sandbox.
+            self._pidfd_supported = False
+            return False
+
+        self._register(process)
+        self._pidfds[process.pid] = pidfd
+        loop.add_reader(pidfd, self._on_pidfd_ready, process.pid)
+        return True
+
+    def _install_sigchld(self, loop: asyncio.AbstractEventLoop) -> bool:
+        if self._sigchld_installed:
+            return True
+        try:
+            loop.add_signal_handler(signal.SIGCHLD, self._on_sigchld)
+        except (NotImplementedError, RuntimeError, ValueError):
+            # Not on the main thread or not a Unix loop.
+            return False
+        self._sigchld_installed = True
+        return True
+
+    def _register(self, process: AgentProcess) -> None:
+        self._processes[process.pid] = process
+        process.watch_loop = self._loop
+
+    def _on_pidfd_ready(self, pid: int) -> None:
+        self._close_pidfd(pid)
+        process = self._processes.get(pid)
+        if process is not None:
+            self._record_exit(process, self._reap(process))
+
+    def _on_sigchld(self) -> None:
+        for pid, process in list(self._processes.items()):
+            if pid in self._pidfds or process.handle is None:
+                continue
+            if process.handle.poll() is not None:
+                self._record_exit(process, process.handle.returncode)
+
+    def _record_exit(self, process: AgentProcess, exit_code: Optional[int]) -> None:
+        self._processes.pop(process.pid, None)
+        process.watch_loop = None
+        process.exit_code = exit_code
+        process.exit_time = time.time()
+        if process.status == "running":
+            process.status = "exited"
+
+        for future in self._waiters.pop(process.pid, []):
+            if not future.done():
+                future.set_result(exit_code)
+
+        self.logger.debug(
+            "%s instance %s exited (pid=%s, code=%s)",
+            process.agent_type,
+            process.instance_id,
+            process.pid,
+            exit_code,
+        )
+        if self._on_exit is not None:
+            self._on_exit(process)
+
+    def _close_pidfd(self, pid: int) -> None:
+        pidfd = self._pidfds.pop(pid, None)
+        if pidfd is None:
+            return
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(pidfd)
+        os.close(pidfd)
+
+    @staticmethod
+    def _reap(process: AgentProcess) -> Optional[int]:
+        # Only our own children can be reaped; hydrated processes belong to
+        # an earlier CLI invocation and their exit status is unavailable.
+        if process.handle is None:
+            return None
+        return process.handle.poll()
@@ -0,0 +1,157 @@
+"""Content-addressed cache of workflow step results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from ..core.codec import StateCodec, decode
+from ..core.config import parse_size
+from ..core.persistence import atomic_write
+from ..core.state import STATE_DIRECTORY_NAME, thaw
+from .models import WorkflowDefinition, WorkflowStep
+
+STEP_CACHE_SIZE_ENV = "AGENTSWARM_STEP_CACHE_SIZE"
+STEP_CACHE_DIRECTORY = Path("cache") / "steps"
+DEFAULT_STEP_CACHE_SIZE = "256MB"
+# Bump when the key or entry layout changes so old entries become misses.
+STEP_CACHE_VERSION = 1
+
+
+class StepCache:
+    """Step results stored on disk by a hash of everything that produced them.
+
+    The key covers the workflow definition and version, the step's ID,
+    agent type, task and parameters, the results of its dependencies and
+    the execution's initial context, so a step is served from the cache only
+    when it would be asked the exact same question again. Entries are
+    evicted least recently used first once the directory grows past
+    ``max_size``; a hit refreshes the entry's mtime. Unreadable entries and
+    failed writes are treated as misses, since the cache is only an
+    optimization. Lookups and stores block on file I/O, so the workflow
+    orchestrator runs them in worker threads.
+    """
+
+    def __init__(self, directory: Path, *, max_size: Optional[int | str] = None) -> None:
+        self.directory = directory
+        if max_size is None:
+            max_size = os.environ.get(STEP_CACHE_SIZE_ENV, DEFAULT_STEP_CACHE_SIZE)
+        self.max_size = parse_size(max_size)
+        self.codec = StateCodec()
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def for_project(cls, project_root: Path, **kwargs: Any) -> "StepCache":
+        """Cache under the project's ``.agentswarm/cache/steps`` directory."""
+
+        return cls(project_root / STATE_DIRECTORY_NAME / STEP_CACHE_DIRECTORY, **kwargs)
+
+    @staticmethod
+    def key(
+        definition: WorkflowDefinition,
+        step: WorkflowStep,
+        dependency_results: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Hex digest identifying one step's inputs."""
+
+        material = {
+            "version": STEP_CACHE_VERSION,
+            "definition": [definition.id, definition.version],
+            "step": [step.id, step.agent_type, step.task],
+            "parameters": thaw(step.parameters),
+            "dependencies": dependency_results,
+            "context": context or {},
+        }
+        canonical = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """Return ``(True, result)`` on a hit and ``(False, None)`` otherwise."""
+
+        path = self._entry_path(key)
+        try:
+            entry = decode(path.read_bytes())
+        except FileNotFoundError:
+            return False, None
+        except Exception as exc:  # noqa: BLE001 - a broken entry is just a miss
+            self.logger.debug("Ignoring unreadable step cache entry %s: %s", path, exc)
+            return False, None
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return False, None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True, entry.get("result")
+
+    def store(self, key: str, result: Any) -> None:
+        """Record ``result`` for ``key`` and evict old entries past the size cap."""
+
+        entry = {"key": key, "result": result}
+        try:
+            payload = self.codec.encode(entry)
+            # Results without a JSON equivalent would not come back unchanged.
+            if decode(payload) != entry:
+                self.logger.debug("Not caching step result for %s: it does not round-trip", key)
+                return
+            self.directory.mkdir(parents=True, exist_ok=True)
+            atomic_write(self._entry_path(key), payload, fsync=False)
+            self._evict(keep=key)
+        except Exception as exc:  # noqa: BLE001 - caching is best effort
+            self.logger.debug("Could not write step cache entry %s: %s", key, exc)
+
+    def size(self) -> int:
+        """Bytes currently used by cache entries."""
+
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def clear(self) -> int:
+        """Remove every entry and return how many were removed."""
+
+        removed = 0
+        for path, _ in self._entries():
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.bin"
+
+    def _entries(self) -> list[Tuple[Path, os.stat_result]]:
+        entries = []
+        try:
+            with os.scandir(self.directory) as scan:
+                for item in scan:
+                    if item.name.endswith(".bin") and item.is_file():
+                        try:
+                            entries.append((Path(item.path), item.stat()))
+                        except FileNotFoundError:
+                            continue
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        entries = self._entries()
+        total = sum(stat.st_size for _, stat in entries)
+        if total <= self.max_size:
+            return
+
+        kept = self._entry_path(keep)
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime_ns):
+            if total <= self.max_size:
+                break
+            if path == kept:
+                continue
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            self.logger.debug("Evicted step cache entry %s", path.name)
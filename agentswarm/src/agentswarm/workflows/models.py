@@ -8,10 +8,11 @@ from dataclasses import dataclass, field
 from datetime import datetime, UTC
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol, Union
+from typing import Any, Dict, List, Mapping, Optional, Protocol, Tuple, Union
 from uuid import uuid4
 
 from ..core.models import AgentProcess
+from ..core.state import freeze
 
 
 class WorkflowStatus(Enum):
@@ -42,39 +43,105 @@ class WorkflowType(Enum):
     VALIDATION = "validation"  # Validation or readiness checks
 
 
-@dataclass
+@dataclass(frozen=True)
 class WorkflowStep:
-    """Individual step in a workflow."""
+    """Individual step in a workflow.
+
+    Steps are part of a shared definition and never change at runtime; the
+    status and result of a step in one execution live in its ``StepRun``.
+    Containers are copied into read-only views on construction (see
+    ``freeze``), so callers keep their own lists and dicts. ``parameters``
+    is left out of the hash because mapping proxies are not hashable.
+    """
     id: str
     name: str
     description: str
     agent_type: str
     task: str
-    parameters: Dict[str, Any] = field(default_factory=dict)
-    dependencies: List[str] = field(default_factory=list)  # Step IDs this depends on
+    parameters: Mapping[str, Any] = field(default_factory=dict, hash=False)
+    dependencies: Tuple[str, ...] = ()  # Step IDs this depends on
     timeout: Optional[int] = None  # seconds
     retry_count: int = 0
     retry_delay: int = 1  # seconds
-    status: WorkflowStepStatus = WorkflowStepStatus.PENDING
-    result: Optional[Any] = None
-    error: Optional[str] = None
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
-    execution_time: Optional[float] = None
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "parameters", freeze(self.parameters))
+        object.__setattr__(self, "dependencies", tuple(self.dependencies))
 
-@dataclass
+
+@dataclass(frozen=True)
 class WorkflowDefinition:
-    """Complete workflow definition."""
+    """Complete workflow definition.
+
+    Definitions in ``WORKFLOW_REGISTRY`` are shared by every execution of a
+    workflow, so they are frozen all the way down, like ``WorkflowStep``;
+    per-run state lives on ``WorkflowExecution``.
+    """
     id: str
     name: str
     description: str
     type: WorkflowType
-    steps: List[WorkflowStep]
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    steps: Tuple[WorkflowStep, ...]
+    metadata: Mapping[str, Any] = field(default_factory=dict, hash=False)
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     version: str = "1.0.0"
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "steps", tuple(self.steps))
+        object.__setattr__(self, "metadata", freeze(self.metadata))
+
+    def topological_order(self) -> List[WorkflowStep]:
+        """Return the steps so that each follows all of its dependencies.
+
+        Uses Kahn's algorithm and keeps declaration order among steps that
+        become ready together. Raises ValueError for a dependency on an
+        unknown step or a dependency cycle.
+        """
+        steps = {step.id: step for step in self.steps}
+        remaining: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {step_id: [] for step_id in steps}
+        for step in self.steps:
+            dependencies = set(step.dependencies)
+            unknown = sorted(dependencies - steps.keys())
+            if unknown:
+                raise ValueError(
+                    f"Step '{step.id}' in workflow '{self.id}' depends on unknown step(s): {', '.join(unknown)}"
+                )
+            remaining[step.id] = len(dependencies)
+            for dependency in dependencies:
+                dependents[dependency].append(step.id)
+
+        ready = [step.id for step in self.steps if not remaining[step.id]]
+        order: List[WorkflowStep] = []
+        while ready:
+            step_id = ready.pop(0)
+            order.append(steps[step_id])
+            for dependent in dependents[step_id]:
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    ready.append(dependent)
+
+        if len(order) < len(steps):
+            cyclic = [step.id for step in self.steps if remaining[step.id]]
+            raise ValueError(
+                f"Workflow '{self.id}' has a dependency cycle through: {', '.join(cyclic)}"
+            )
+        return order
+
+
+@dataclass
+class StepRun:
+    """Runtime state of one step within one workflow execution."""
+    step_id: str
+    status: WorkflowStepStatus = WorkflowStepStatus.PENDING
+    attempts: int = 0
+    cached: bool = False  # Result served from the step cache, executor not called
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    execution_time: Optional[float] = None
+
 
 @dataclass
 class WorkflowExecution:
@@ -83,6 +150,7 @@ class WorkflowExecution:
     definition_id: str
     status: WorkflowStatus = WorkflowStatus.PENDING
     current_step: Optional[str] = None
+    steps: Dict[str, StepRun] = field(default_factory=dict)  # Step ID -> run, in definition order
     step_results: Dict[str, Any] = field(default_factory=dict)
     context: Dict[str, Any] = field(default_factory=dict)  # Shared data between steps
     start_time: Optional[datetime] = None
@@ -123,11 +191,15 @@ class AgentWorkflowExecutor:
         if not available_agents:
             raise RuntimeError(f"No running agents available for type: {step.agent_type}")
 
-        # Use first available agent (could implement load balancing)
-        agent = available_agents[0]
+        # Least busy agent; the count also keeps scale-down off busy instances
+        agent = min(available_agents, key=lambda proc: proc.active_steps)
 
-        # Simulate task execution (in real implementation, this would communicate with the agent)
-        await asyncio.sleep(0.1)  # Simulate processing time
+        agent.active_steps += 1
+        try:
+            # Simulate task execution (in real implementation, this would communicate with the agent)
+            await asyncio.sleep(0.1)  # Simulate processing time
+        finally:
+            agent.active_steps -= 1
 
         # Mock result based on task type
         if "search" in step.task.lower():
@@ -235,17 +235,21 @@ class WorkflowMonitor:
         if not execution:
             return {"error": "Execution not found"}
 
+        completed = sum(
+            1 for run in execution.steps.values() if run.status == WorkflowStepStatus.COMPLETED
+        )
         return {
             "id": execution.id,
             "definition_id": execution.definition_id,
             "status": execution.status.value,
             "current_step": execution.current_step,
-            "total_steps": len(execution.step_results),
-            "completed_steps": sum(1 for result in execution.step_results.values() if result),
+            "total_steps": len(execution.steps),
+            "completed_steps": completed,
+            "cached_steps": sum(1 for run in execution.steps.values() if run.cached),
             "start_time": execution.start_time.isoformat() if execution.start_time else None,
             "end_time": execution.end_time.isoformat() if execution.end_time else None,
             "execution_time": execution.execution_time,
-            "success_rate": len([r for r in execution.step_results.values() if r]) / len(execution.step_results) if execution.step_results else 0,
+            "success_rate": completed / len(execution.steps) if execution.steps else 0,
             "error": execution.error,
         }
 
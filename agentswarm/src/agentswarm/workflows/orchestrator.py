@@ -7,12 +7,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
 from datetime import datetime, UTC
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
+from ..core.autoscaler import DemandTracker
+from .cache import StepCache
 from .models import (
+    StepRun,
     WorkflowDefinition,
     WorkflowExecution,
     WorkflowExecutor,
@@ -32,8 +36,18 @@ class WorkflowOrchestrator:
         self,
         executor: WorkflowExecutor,
         state_dir: Optional[Path] = None,
+        demand: Optional[DemandTracker] = None,
+        max_concurrency: Optional[int] = None,
+        step_cache: Optional[StepCache] = None,
     ):
         self.executor = executor
+        # Opt-in memoization of step results across executions
+        self.step_cache = step_cache
+        # Default cap on concurrently running steps per execution; a
+        # definition's ``metadata["max_concurrency"]`` takes precedence.
+        self.max_concurrency = max_concurrency
+        # Optional autoscaler feed: pending and in-flight steps per agent type
+        self.demand = demand
         self.state_dir = state_dir or Path.cwd() / "workflow_state"
         self.state_dir.mkdir(exist_ok=True)
         self.logger = logging.getLogger(__name__)
@@ -44,23 +58,36 @@ class WorkflowOrchestrator:
         # In-memory state (could be persisted to disk/database)
         self.active_executions: Dict[str, WorkflowExecution] = {}
         self.completed_executions: Dict[str, WorkflowExecution] = {}
+        # Initial context per execution, part of every step cache key
+        self._cache_contexts: Dict[str, Dict[str, Any]] = {}
 
     async def execute_workflow(
         self,
         definition: WorkflowDefinition,
         initial_context: Optional[Dict[str, Any]] = None,
     ) -> WorkflowExecution:
-        """Execute a workflow definition."""
+        """Execute a workflow definition.
+
+        The definition is only read, so any number of executions of the same
+        definition may run concurrently; each keeps its own step state.
+        """
         execution = WorkflowExecution(
             id=str(uuid4()),
             definition_id=definition.id,
-            context=initial_context or {},
+            steps={step.id: StepRun(step.id) for step in definition.steps},
+            context=dict(initial_context or {}),
         )
 
         self.active_executions[execution.id] = execution
         self.state_store.save_execution(execution)
+        if self.step_cache is not None:
+            self._cache_contexts[execution.id] = dict(execution.context)
         self.logger.info(f"Starting workflow execution: {execution.id}")
 
+        if self.demand is not None:
+            for step in definition.steps:
+                self.demand.queued(step.agent_type)
+
         try:
             execution.start_time = datetime.now(UTC)
             execution.status = WorkflowStatus.RUNNING
@@ -68,10 +95,8 @@ class WorkflowOrchestrator:
 
             if definition.type in (WorkflowType.SEQUENTIAL, WorkflowType.VALIDATION):
                 await self._execute_sequential(definition, execution)
-            elif definition.type == WorkflowType.PARALLEL:
-                await self._execute_parallel(definition, execution)
-            elif definition.type == WorkflowType.PIPELINE:
-                await self._execute_pipeline(definition, execution)
+            elif definition.type in (WorkflowType.PARALLEL, WorkflowType.PIPELINE):
+                await self._execute_dag(definition, execution)
             else:
                 raise ValueError(f"Unsupported workflow type: {definition.type}")
 
@@ -81,6 +106,9 @@ class WorkflowOrchestrator:
         except Exception as e:
             execution.status = WorkflowStatus.FAILED
             execution.error = str(e)
+            for run in execution.steps.values():
+                if run.status == WorkflowStepStatus.PENDING:
+                    run.status = WorkflowStepStatus.SKIPPED
             self.logger.error(f"Workflow failed: {execution.id} - {e}")
 
         finally:
@@ -90,10 +118,17 @@ class WorkflowOrchestrator:
                     execution.end_time - execution.start_time
                 ).total_seconds()
 
+            if self.demand is not None:
+                for step in definition.steps:
+                    if execution.steps[step.id].start_time is None:
+                        self.demand.discard(step.agent_type)
+            self._cache_contexts.pop(execution.id, None)
+
             # Move to completed and save final state
             self.completed_executions[execution.id] = execution
             self.active_executions.pop(execution.id, None)
             self.state_store.save_execution(execution)
+            self.state_store.flush()
 
         return execution
 
@@ -104,99 +139,173 @@ class WorkflowOrchestrator:
     ) -> None:
         """Execute steps sequentially."""
         for step in definition.steps:
-            await self._execute_step(step, execution)
+            await self._execute_step(step, execution, self._cache_key(definition, step, execution))
 
-    async def _execute_parallel(
-        self,
-        definition: WorkflowDefinition,
-        execution: WorkflowExecution,
-    ) -> None:
-        """Execute independent steps in parallel."""
-        # Group steps by dependencies
-        independent_steps = [
-            step for step in definition.steps
-            if not step.dependencies
-        ]
-
-        # Execute independent steps in parallel
-        tasks = [
-            self._execute_step(step, execution)
-            for step in independent_steps
-        ]
-        await asyncio.gather(*tasks)
-
-        # Execute dependent steps (simplified - could be more sophisticated)
-        dependent_steps = [
-            step for step in definition.steps
-            if step.dependencies
-        ]
-
-        for step in dependent_steps:
-            if self._dependencies_satisfied(step, execution):
-                await self._execute_step(step, execution)
-
-    async def _execute_pipeline(
+    async def _execute_dag(
         self,
         definition: WorkflowDefinition,
         execution: WorkflowExecution,
     ) -> None:
-        """Execute steps as a pipeline (data flows between steps)."""
-        for step in definition.steps:
-            # Wait for dependencies
-            while not self._dependencies_satisfied(step, execution):
-                await asyncio.sleep(0.1)
+        """Execute steps as a dependency graph.
+
+        Each step starts as soon as its last dependency completes, up to the
+        workflow's concurrency limit. Unknown dependencies and cycles are
+        rejected before any step runs. After a failure no new steps are
+        started, steps already running are allowed to finish and the first
+        error is raised.
+        """
+        order = definition.topological_order()
+        limit = self._concurrency_limit(definition)
+
+        remaining = {step.id: len(set(step.dependencies)) for step in order}
+        dependents: Dict[str, List[WorkflowStep]] = {step.id: [] for step in order}
+        for step in order:
+            for dependency in set(step.dependencies):
+                dependents[dependency].append(step)
+
+        ready = deque(step for step in definition.steps if not remaining[step.id])
+        running: Dict[asyncio.Task, WorkflowStep] = {}
+        error: Optional[BaseException] = None
 
-            await self._execute_step(step, execution)
+        try:
+            while ready or running:
+                while ready and error is None and (limit is None or len(running) < limit):
+                    step = ready.popleft()
+                    task = asyncio.create_task(
+                        self._execute_step(step, execution, self._cache_key(definition, step, execution))
+                    )
+                    running[task] = step
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    step = running.pop(task)
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                        continue
+                    for dependent in dependents[step.id]:
+                        remaining[dependent.id] -= 1
+                        if not remaining[dependent.id]:
+                            ready.append(dependent)
+        finally:
+            # Only reached with tasks left when the workflow itself is cancelled
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        if error is not None:
+            raise error
+
+    def _concurrency_limit(self, definition: WorkflowDefinition) -> Optional[int]:
+        """Steps of one execution that may run at once (None: unlimited)."""
+        limit = definition.metadata.get("max_concurrency", self.max_concurrency)
+        if limit is None:
+            return None
+        limit = int(limit)
+        if limit < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {limit}")
+        return limit
 
     async def _execute_step(
         self,
         step: WorkflowStep,
         execution: WorkflowExecution,
+        cache_key: Optional[str] = None,
     ) -> None:
-        """Execute a single workflow step."""
+        """Execute a single workflow step.
+
+        With a ``cache_key`` a cached result is used instead of calling the
+        executor, and a fresh result is added to the step cache.
+        """
+        run = execution.steps[step.id]
         execution.current_step = step.id
-        step.status = WorkflowStepStatus.RUNNING
-        step.start_time = datetime.now(UTC)
+        run.status = WorkflowStepStatus.RUNNING
+        run.start_time = datetime.now(UTC)
+
+        if cache_key is not None:
+            hit, result = await asyncio.to_thread(self.step_cache.lookup, cache_key)
+            if hit:
+                if self.demand is not None:
+                    self.demand.discard(step.agent_type)
+                self._record_result(step, execution, result)
+                run.cached = True
+                run.end_time = datetime.now(UTC)
+                run.execution_time = (run.end_time - run.start_time).total_seconds()
+                self.logger.info(f"Step served from cache: {step.name}")
+                return
+
+        if self.demand is not None:
+            self.demand.started(step.agent_type)
 
         try:
             # Validate step can be executed
             if not await self.executor.validate_step(step):
                 raise RuntimeError(f"Step validation failed: {step.name}")
 
-            # Execute step with retry logic
-            result = await self._execute_with_retry(step, execution.context)
-
-            step.result = result
-            step.status = WorkflowStepStatus.COMPLETED
+            # Execute step with retry logic. The executor gets a snapshot:
+            # steps running alongside keep adding their results to the
+            # execution's context.
+            result = await self._execute_with_retry(step, run, dict(execution.context))
 
-            # Update execution context with step result
-            execution.step_results[step.id] = result
-            execution.context[f"step_{step.id}_result"] = result
+            self._record_result(step, execution, result)
+            if cache_key is not None:
+                await asyncio.to_thread(self.step_cache.store, cache_key, result)
 
             self.logger.info(f"Step completed: {step.name}")
 
         except Exception as e:
-            step.status = WorkflowStepStatus.FAILED
-            step.error = str(e)
+            run.status = WorkflowStepStatus.FAILED
+            run.error = str(e)
             self.logger.error(f"Step failed: {step.name} - {e}")
             raise
 
         finally:
-            step.end_time = datetime.now(UTC)
-            if step.start_time and step.end_time:
-                step.execution_time = (
-                    step.end_time - step.start_time
+            if self.demand is not None:
+                self.demand.finished(step.agent_type)
+            run.end_time = datetime.now(UTC)
+            if run.start_time and run.end_time:
+                run.execution_time = (
+                    run.end_time - run.start_time
                 ).total_seconds()
 
+    def _record_result(self, step: WorkflowStep, execution: WorkflowExecution, result: Any) -> None:
+        run = execution.steps[step.id]
+        run.result = result
+        run.status = WorkflowStepStatus.COMPLETED
+
+        # Update execution context with step result
+        execution.step_results[step.id] = result
+        execution.context[f"step_{step.id}_result"] = result
+
+    def _cache_key(
+        self,
+        definition: WorkflowDefinition,
+        step: WorkflowStep,
+        execution: WorkflowExecution,
+    ) -> Optional[str]:
+        """Step cache key once the step's dependencies have completed."""
+        if self.step_cache is None:
+            return None
+        dependency_results = {
+            dependency: execution.step_results.get(dependency) for dependency in step.dependencies
+        }
+        return self.step_cache.key(
+            definition, step, dependency_results, self._cache_contexts.get(execution.id)
+        )
+
     async def _execute_with_retry(
         self,
         step: WorkflowStep,
+        run: StepRun,
         context: Dict[str, Any],
     ) -> Any:
         """Execute step with retry logic."""
         last_error = None
 
         for attempt in range(step.retry_count + 1):
+            run.attempts = attempt + 1
             try:
                 return await self.executor.execute_step(step, context)
             except Exception as e:
@@ -212,18 +321,6 @@ class WorkflowOrchestrator:
 
         raise last_error
 
-    def _dependencies_satisfied(
-        self,
-        step: WorkflowStep,
-        execution: WorkflowExecution,
-    ) -> bool:
-        """Check if all dependencies for a step are satisfied."""
-        for dep_id in step.dependencies:
-            if dep_id not in execution.step_results:
-                return False
-
-        return True
-
     def get_execution_status(self, execution_id: str) -> Optional[WorkflowExecution]:
         """Get status of a workflow execution."""
         # Check active executions first
@@ -245,6 +342,7 @@ class WorkflowOrchestrator:
             execution = self.active_executions[execution_id]
             execution.status = WorkflowStatus.CANCELLED
             self.state_store.save_execution(execution)
+            self.state_store.flush()
             self.completed_executions[execution_id] = execution
             self.active_executions.pop(execution_id)
             return True
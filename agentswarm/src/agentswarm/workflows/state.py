@@ -1,35 +1,48 @@
 """Workflow State Management and Persistence."""
 
-import json
 import logging
 from datetime import datetime, UTC
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from .models import WorkflowExecution, WorkflowStatus
+from ..core.codec import StateCodec, decode
+from ..core.persistence import DEFAULT_DEBOUNCE, CoalescingWriter
+from .models import StepRun, WorkflowExecution, WorkflowStatus, WorkflowStepStatus
 
 
 class WorkflowStateStore:
     """Persistent storage for workflow execution state."""
 
-    def __init__(self, state_dir: Path):
+    def __init__(
+        self,
+        state_dir: Path,
+        *,
+        debounce: float = DEFAULT_DEBOUNCE,
+        fsync: Optional[str] = None,
+        codec: Optional[StateCodec] = None,
+    ):
         self.state_dir = state_dir
         self.state_dir.mkdir(parents=True, exist_ok=True)
         self.executions_file = self.state_dir / "workflow_executions.json"
+        self.codec = codec or StateCodec()
         self.logger = logging.getLogger(__name__)
 
         # In-memory cache
         self._executions: Dict[str, WorkflowExecution] = {}
         self._load_state()
 
+        # Bursts of step updates are coalesced into one atomic rewrite
+        self._writer = CoalescingWriter(
+            self.executions_file, self._render_state, debounce=debounce, fsync=fsync
+        )
+
     def _load_state(self) -> None:
         """Load workflow executions from disk."""
         if not self.executions_file.exists():
             return
 
         try:
-            with open(self.executions_file, 'r') as f:
-                data = json.load(f)
+            data = decode(self.executions_file.read_bytes())
 
             for exec_data in data.get("executions", []):
                 execution = self._deserialize_execution(exec_data)
@@ -40,16 +53,23 @@ class WorkflowStateStore:
             self.logger.error(f"Failed to load workflow state: {e}")
 
     def _save_state(self) -> None:
-        """Save workflow executions to disk."""
+        """Schedule a write of workflow executions to disk."""
         try:
-            data = {
-                "last_updated": datetime.now(UTC).isoformat(),
-                "executions": [self._serialize_execution(exec) for exec in self._executions.values()]
-            }
+            self._writer.mark_dirty()
+        except Exception as e:
+            self.logger.error(f"Failed to save workflow state: {e}")
 
-            with open(self.executions_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+    def _render_state(self) -> bytes:
+        data = {
+            "last_updated": datetime.now(UTC).isoformat(),
+            "executions": [self._serialize_execution(exec) for exec in self._executions.values()]
+        }
+        return self.codec.encode(data, default=str)
 
+    def flush(self) -> None:
+        """Write pending changes to disk now."""
+        try:
+            self._writer.flush()
         except Exception as e:
             self.logger.error(f"Failed to save workflow state: {e}")
 
@@ -60,6 +80,7 @@ class WorkflowStateStore:
             "definition_id": execution.definition_id,
             "status": execution.status.value,
             "current_step": execution.current_step,
+            "steps": [self._serialize_step_run(run) for run in execution.steps.values()],
             "step_results": execution.step_results,
             "context": execution.context,
             "start_time": execution.start_time.isoformat() if execution.start_time else None,
@@ -70,12 +91,22 @@ class WorkflowStateStore:
 
     def _deserialize_execution(self, data: Dict[str, Any]) -> WorkflowExecution:
         """Deserialize dictionary to workflow execution."""
+        step_results = data.get("step_results", {})
+        if "steps" in data:
+            runs = [self._deserialize_step_run(run, step_results) for run in data["steps"]]
+        else:
+            # Written before step runs were recorded: only results are known
+            runs = [
+                StepRun(step_id, status=WorkflowStepStatus.COMPLETED, result=result)
+                for step_id, result in step_results.items()
+            ]
         return WorkflowExecution(
             id=data["id"],
             definition_id=data["definition_id"],
             status=WorkflowStatus(data["status"]),
             current_step=data.get("current_step"),
-            step_results=data.get("step_results", {}),
+            steps={run.step_id: run for run in runs},
+            step_results=step_results,
             context=data.get("context", {}),
             start_time=datetime.fromisoformat(data["start_time"]) if data.get("start_time") else None,
             end_time=datetime.fromisoformat(data["end_time"]) if data.get("end_time") else None,
@@ -83,6 +114,36 @@ class WorkflowStateStore:
             error=data.get("error"),
         )
 
+    def _serialize_step_run(self, run: StepRun) -> Dict[str, Any]:
+        """Serialize a step run to dictionary.
+
+        Results are stored once, in the execution's ``step_results``.
+        """
+        return {
+            "step_id": run.step_id,
+            "status": run.status.value,
+            "attempts": run.attempts,
+            "cached": run.cached,
+            "error": run.error,
+            "start_time": run.start_time.isoformat() if run.start_time else None,
+            "end_time": run.end_time.isoformat() if run.end_time else None,
+            "execution_time": run.execution_time,
+        }
+
+    def _deserialize_step_run(self, data: Dict[str, Any], step_results: Dict[str, Any]) -> StepRun:
+        """Deserialize dictionary to step run."""
+        return StepRun(
+            step_id=data["step_id"],
+            status=WorkflowStepStatus(data["status"]),
+            attempts=data.get("attempts", 0),
+            cached=data.get("cached", False),
+            result=step_results.get(data["step_id"]),
+            error=data.get("error"),
+            start_time=datetime.fromisoformat(data["start_time"]) if data.get("start_time") else None,
+            end_time=datetime.fromisoformat(data["end_time"]) if data.get("end_time") else None,
+            execution_time=data.get("execution_time"),
+        )
+
     def save_execution(self, execution: WorkflowExecution) -> None:
         """Save a workflow execution."""
         self._executions[execution.id] = execution
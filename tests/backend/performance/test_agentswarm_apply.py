@@ -0,0 +1,163 @@
+"""
+AgentSwarm Config Apply
+=======================
+
+Applying a changed config to a running deployment must only touch the pools
+whose instance count or spawn settings changed; every other process keeps
+running under the same deployment ID. The config file is layered over the
+running config as written, so its omissions keep deployment overrides, while
+a pool's command, resources and placement are replaced as a whole.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.config import SwarmConfig  # noqa: E402
+from agentswarm.core.orchestrator import AgentOrchestrator  # noqa: E402
+
+
+def _config(**agents):
+    return SwarmConfig(agents=agents, deployment={"shutdown_grace": "1s"})
+
+
+def _file(**agents):
+    """Config data as ``apply`` reads it from the file."""
+
+    return {"agents": agents}
+
+
+def _pids(deployment, agent_type):
+    return [process.pid for process in deployment.agents.get(agent_type, [])]
+
+
+@pytest.mark.performance
+def test_apply_touches_only_changed_pools(tmp_path):
+    sleeper = ["sleep", "30"]
+
+    async def scenario():
+        orchestrator = AgentOrchestrator(project_root=tmp_path)
+        deployment = await orchestrator.deploy_swarm(
+            _config(
+                codex={"instances": 2, "command": sleeper},
+                claude={"instances": 1, "command": sleeper},
+                gemini={"instances": 1, "command": sleeper},
+            )
+        )
+        try:
+            before = {name: _pids(deployment, name) for name in ("codex", "claude", "gemini")}
+
+            plan = await orchestrator.apply_config(
+                _file(
+                    codex={"instances": 3},
+                    claude={"command": ["sleep", "31"]},
+                    gemini={"tasks": ["review"]},
+                ),
+                dry_run=True,
+            )
+            assert {change.agent_type: change.action for change in plan.changes} == {
+                "codex": "update",
+                "claude": "update",
+                "gemini": "update",
+            }
+            assert _pids(deployment, "codex") == before["codex"]
+
+            plan = await orchestrator.apply_config(
+                _file(
+                    codex={"instances": 3},
+                    claude={"command": ["sleep", "31"]},
+                    gemini={"tasks": ["review"]},
+                )
+            )
+            changes = {change.agent_type: change for change in plan.changes}
+            assert (changes["codex"].delta, changes["codex"].roll) == (1, False)
+            assert (changes["claude"].delta, changes["claude"].roll) == (0, True)
+            assert (changes["gemini"].delta, changes["gemini"].roll) == (0, False)
+
+            current = orchestrator.get_deployment(deployment.deployment_id)
+            assert current is deployment
+            assert _pids(current, "codex")[:2] == before["codex"]
+            assert len(_pids(current, "codex")) == 3
+            assert _pids(current, "claude") != before["claude"]
+            assert current.agents["claude"][0].command == "sleep 31"
+            assert _pids(current, "gemini") == before["gemini"]
+            assert current.config.agents["gemini"]["tasks"] == ["review"]
+            assert current.config.agents["codex"]["command"] == sleeper  # merged, not replaced
+
+            replay = await orchestrator.apply_config(
+                _file(codex={"instances": 3}, claude={"command": ["sleep", "31"]})
+            )
+            assert not replay.changed
+
+            pruned = await orchestrator.apply_config(_file(codex={"instances": 3}), prune=True)
+            assert [change.action for change in pruned.changes] == ["unchanged", "remove", "remove"]
+            assert set(current.agents) == {"codex"}
+            assert set(current.config.agents) == {"codex"}
+
+            reloaded = AgentOrchestrator(project_root=tmp_path)
+            stored = reloaded.get_deployment(deployment.deployment_id)
+            assert _pids(stored, "codex") == _pids(current, "codex")
+            assert set(stored.config.agents) == {"codex"}
+            reloaded.close()
+        finally:
+            await orchestrator.shutdown_deployment(deployment.deployment_id, force=True)
+            orchestrator.close()
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.performance
+def test_replaced_settings_and_deployment_overrides(tmp_path):
+    async def scenario():
+        orchestrator = AgentOrchestrator(project_root=tmp_path)
+        deployment = await orchestrator.deploy_swarm(
+            SwarmConfig(
+                agents={
+                    "codex": {
+                        "instances": 1,
+                        "command": ["sleep", "30"],
+                        "resources": {"memory": "1GB", "pids": 64},
+                        "placement": {"mode": "pack", "cpus_per_instance": 2},
+                        "standby": {"count": 0},
+                    }
+                },
+                deployment={"max_concurrent": 16, "shutdown_grace": "1s"},
+            )
+        )
+        try:
+            plan = await orchestrator.apply_config(
+                _file(
+                    codex={"resources": {"memory": "1GB"}, "placement": "spread", "standby": None}
+                ),
+                dry_run=True,
+            )
+            codex = plan.config.agents["codex"]
+            # Replaced, not merged: the pids limit and cpus_per_instance are gone.
+            assert codex["resources"] == {"memory": "1GB"}
+            assert codex["placement"] == "spread"
+            assert "standby" not in codex
+            (change,) = plan.changes
+            assert change.roll
+            assert change.reasons == ["resources changed", "placement changed", "removed standby"]
+
+            # Deployment settings the file leaves out keep their running values.
+            assert plan.config.deployment["max_concurrent"] == 16
+            assert plan.config.deployment["shutdown_grace"] == "1s"
+            assert not (await orchestrator.apply_config(_file(codex={"instances": 1}))).changed
+
+            plan = await orchestrator.apply_config(
+                {"deployment": {"max_concurrent": 4}}, dry_run=True
+            )
+            assert plan.config.deployment["max_concurrent"] == 4
+            assert [change.action for change in plan.changes] == ["unchanged"]
+            assert plan.changed
+        finally:
+            await orchestrator.shutdown_deployment(deployment.deployment_id, force=True)
+            orchestrator.close()
+
+    asyncio.run(scenario())
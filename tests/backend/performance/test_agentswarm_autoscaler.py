@@ -0,0 +1,119 @@
+"""
+AgentSwarm Autoscaler
+=====================
+
+``decide`` sizes a pool from workflow demand and resource signals. Scale-up
+follows demand after its cooldown; scale-down waits for load to fall below
+the hysteresis band and for the longer cooldown, so bursts do not flap the
+pool. Scale-down never takes a busy instance for lack of load.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.agent_pool import AgentPool  # noqa: E402
+from agentswarm.core.autoscaler import AutoscalePolicy, PoolSignals, ScalingState, decide  # noqa: E402
+from agentswarm.core.models import AgentProcess  # noqa: E402
+
+POLICY = AutoscalePolicy.from_config(
+    {
+        "instances": 2,
+        "autoscale": {
+            "min": 1,
+            "max": 10,
+            "target_steps": 2,
+            "hysteresis": 0.25,
+            "scale_up_cooldown": "30s",
+            "scale_down_cooldown": "5m",
+        },
+    }
+)
+
+
+def _decide(instances, pending, state=None, now=1000.0, **signals):
+    return decide(POLICY, PoolSignals(instances=instances, pending_steps=pending, **signals), state or ScalingState(), now)
+
+
+@pytest.mark.performance
+def test_scale_up_follows_demand_within_bounds():
+    assert _decide(2, pending=9) == 3  # ceil(9 / 2) = 5 instances
+    assert _decide(2, pending=100) == 8  # capped at max
+    assert _decide(2, pending=4) == 0
+    assert _decide(0, pending=0) == 1  # min is enforced even without demand
+    assert _decide(12, pending=100, state=ScalingState(last_scale_down=999.0)) == -2
+
+
+@pytest.mark.performance
+def test_scale_down_waits_for_the_hysteresis_band():
+    # 8 instances with a 25% band: demand for 7 keeps them, 6 or fewer shrinks.
+    assert _decide(8, pending=14) == 0
+    assert _decide(8, pending=13) == 0
+    assert _decide(8, pending=12) == -2
+    assert _decide(8, pending=10) == -3
+
+
+@pytest.mark.performance
+def test_cooldowns_throttle_repeated_decisions():
+    state = ScalingState(last_scale_up=990.0)
+    assert _decide(2, pending=9, state=state) == 0
+    assert _decide(2, pending=9, state=state, now=1020.0) == 3
+
+    # Scale-down waits for its cooldown after any change, up or down.
+    assert _decide(8, pending=0, state=state, now=1200.0) == 0
+    assert _decide(8, pending=0, state=state, now=1290.0) == -7
+    assert _decide(8, pending=0, state=ScalingState(last_scale_down=1100.0), now=1200.0) == 0
+
+
+@pytest.mark.performance
+def test_scale_down_spares_busy_instances():
+    assert _decide(8, pending=0, busy_instances=3) == -5
+    assert _decide(4, pending=0, busy_instances=4) == 0
+    # Above max the pool shrinks to max at once, and further only down to
+    # its busy instances.
+    assert _decide(12, pending=0, busy_instances=12) == -2
+    assert _decide(12, pending=0, busy_instances=4) == -8
+
+
+@pytest.mark.performance
+def test_decide_is_cheap():
+    state = ScalingState()
+    start = time.perf_counter()
+    for index in range(20_000):
+        _decide(8, pending=index % 40, state=state)
+    per_call = (time.perf_counter() - start) / 20_000
+    print(f"decide: {per_call * 1e6:.2f}us per call")
+    assert per_call < 1e-3
+
+
+@pytest.mark.performance
+def test_pool_scale_down_removes_idle_instances_first():
+    terminated = []
+
+    async def provisioner(instance_id, config):
+        return AgentProcess(pid=os.getpid(), agent_type="sim", instance_id=instance_id, command="sim")
+
+    async def terminator(process):
+        terminated.append(process.instance_id)
+
+    pool = AgentPool("sim", "bench", {}, provisioner, terminator)
+
+    async def scenario():
+        await pool.scale(6)
+        for process in pool.running_instances:
+            if process.instance_id in (2, 5, 6):
+                process.active_steps = 1
+        await pool.scale(-3)
+        await pool.scale(-2)
+
+    asyncio.run(scenario())
+
+    assert terminated == [4, 3, 1, 6, 5]
+    assert [process.instance_id for process in pool.running_instances] == [2]
@@ -0,0 +1,213 @@
+"""
+AgentSwarm Cgroup Placement
+===========================
+
+Agents with resource limits get a cgroup v2 leaf that is configured before
+they are spawned and that they join between fork and exec, so no agent code
+runs outside its limits. A delegated root that still holds the orchestrator
+itself is split off into a ``supervisor`` leaf first. These tests run
+against a fake cgroupfs of plain files.
+"""
+
+import asyncio
+import errno
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core import resources  # noqa: E402
+from agentswarm.core.config import SwarmConfig  # noqa: E402
+from agentswarm.core.orchestrator import AgentOrchestrator  # noqa: E402
+from agentswarm.core.resources import ResourceLimits, ResourceManager  # noqa: E402
+
+
+def _fake_cgroup(path):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "cgroup.controllers").write_text("cpuset cpu io memory pids\n")
+    (path / "cgroup.subtree_control").write_text("")
+    return path
+
+
+@pytest.fixture
+def cgroupfs(tmp_path, monkeypatch):
+    root = _fake_cgroup(tmp_path / "cgroup" / "agentswarm.service")
+    real_mkdir = Path.mkdir
+    real_rmdir = Path.rmdir
+    lock = threading.RLock()
+
+    def mkdir(self, *args, **kwargs):
+        # Like cgroupfs, new cgroups appear together with their interface files.
+        with lock:
+            existed = self.exists()
+            real_mkdir(self, *args, **kwargs)
+            if not existed and root in self.parents:
+                _fake_cgroup(self)
+                (self / "cgroup.procs").write_text("")
+
+    def rmdir(self):
+        # ...and their interface files do not keep them from being removed.
+        with lock:
+            if root in self.parents and not any(entry.is_dir() for entry in self.iterdir()):
+                for entry in self.iterdir():
+                    entry.unlink()
+            real_rmdir(self)
+
+    monkeypatch.setattr(Path, "mkdir", mkdir)
+    monkeypatch.setattr(Path, "rmdir", rmdir)
+    return root
+
+
+@pytest.mark.performance
+def test_agent_joins_its_cgroup_before_exec(tmp_path, cgroupfs):
+    orchestrator = AgentOrchestrator(project_root=tmp_path / "project")
+    orchestrator.resources = ResourceManager(cgroupfs)
+    # The agent prints its leaf's cgroup.procs (the child must have joined
+    # already) and limits; the leaf is removed once the agent exits.
+    config = SwarmConfig(
+        agents={
+            "worker": {
+                "instances": 2,
+                "command": [
+                    "sh",
+                    "-c",
+                    "cd ../cgroup/agentswarm.service/agentswarm/*/worker-$0"
+                    " && cat cgroup.procs memory.max cpu.weight pids.max",
+                    "{instance_id}",
+                ],
+                "resources": {"memory": "256MB", "cpu_weight": 50, "pids": 64},
+            }
+        }
+    )
+
+    deployment = asyncio.run(orchestrator.deploy_swarm(config))
+    try:
+        for process in deployment.agents["worker"]:
+            assert process.handle.wait(timeout=10) == 0
+            leaf = Path(process.cgroup)
+            assert leaf == cgroupfs / "agentswarm" / deployment.deployment_id / f"worker-{process.instance_id}"
+            assert orchestrator.get_instance_logs("worker", process.instance_id) == [
+                "0" + str(256 * 1024 * 1024) + "5064"  # the fake files have no newlines
+            ]
+        assert (cgroupfs / "cgroup.subtree_control").read_text() == "+memory +cpu +pids"
+    finally:
+        orchestrator.close()
+
+
+@pytest.mark.performance
+def test_failed_cgroup_join_does_not_run_the_agent(tmp_path, cgroupfs):
+    orchestrator = AgentOrchestrator(project_root=tmp_path / "project")
+    orchestrator.resources = manager = ResourceManager(cgroupfs)
+    prepare = manager.prepare
+
+    def unjoinable(*args):
+        leaf = prepare(*args)
+        (leaf / "cgroup.procs").unlink()
+        (leaf / "cgroup.procs").symlink_to("/dev/full")  # every write fails
+        return leaf
+
+    manager.prepare = unjoinable
+    marker = tmp_path / "ran"
+    config = SwarmConfig(
+        agents={
+            "worker": {
+                "instances": 1,
+                "command": ["touch", str(marker)],
+                "resources": {"memory": "256MB"},
+            }
+        }
+    )
+
+    try:
+        deployment = asyncio.run(orchestrator.deploy_swarm(config))
+    finally:
+        orchestrator.close()
+
+    (process,) = deployment.agents["worker"]
+    assert process.status == "failed" and process.pid == -1
+    assert not marker.exists()
+    assert prepare("d1", "worker", 2, ResourceLimits()) is None  # nothing to limit
+
+
+@pytest.mark.performance
+def test_busy_own_cgroup_moves_the_orchestrator_into_a_leaf(cgroupfs, monkeypatch):
+    enable = resources._enable_controllers
+    attempts = []
+
+    def enable_unless_populated(cgroup, controllers):
+        attempts.append(cgroup)
+        supervisor_procs = cgroupfs / "supervisor" / "cgroup.procs"
+        if cgroup == cgroupfs and not (supervisor_procs.exists() and supervisor_procs.read_text()):
+            raise OSError(errno.EBUSY, "Device or resource busy")
+        enable(cgroup, controllers)
+
+    monkeypatch.setattr(resources, "_enable_controllers", enable_unless_populated)
+    monkeypatch.setattr(resources, "_own_cgroup", lambda: cgroupfs)
+
+    # A one-shot CLI command never moves the user's process.
+    assert ResourceManager().cgroup_base is None
+    assert not (cgroupfs / "supervisor").exists() and not (cgroupfs / "agentswarm").exists()
+
+    attempts.clear()
+    assert ResourceManager(supervise=True).cgroup_base == cgroupfs / "agentswarm"
+    assert (cgroupfs / "supervisor" / "cgroup.procs").read_text() == "0"
+    assert attempts == [cgroupfs, cgroupfs, cgroupfs / "agentswarm"]
+
+
+@pytest.mark.performance
+def test_failed_move_is_undone(cgroupfs, monkeypatch):
+    def busy(cgroup, controllers):
+        raise OSError(errno.EBUSY, "Device or resource busy")  # siblings share the root
+
+    (cgroupfs / "cgroup.procs").write_text("")
+    monkeypatch.setattr(resources, "_enable_controllers", busy)
+    monkeypatch.setattr(resources, "_own_cgroup", lambda: cgroupfs)
+
+    assert ResourceManager(supervise=True).cgroup_base is None
+    assert (cgroupfs / "cgroup.procs").read_text() == "0"  # moved back
+    assert not (cgroupfs / "supervisor").exists() and not (cgroupfs / "agentswarm").exists()
+
+
+@pytest.mark.performance
+def test_busy_foreign_root_falls_back_to_rlimits(cgroupfs, monkeypatch):
+    def busy(cgroup, controllers):
+        raise OSError(errno.EBUSY, "Device or resource busy")
+
+    monkeypatch.setattr(resources, "_enable_controllers", busy)
+    monkeypatch.setattr(resources, "_own_cgroup", lambda: None)
+
+    assert ResourceManager(cgroupfs).cgroup_base is None
+    assert not (cgroupfs / "supervisor").exists()
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("error", [ValueError, RuntimeError])
+def test_failed_spawn_releases_the_leaf(tmp_path, cgroupfs, error):
+    orchestrator = AgentOrchestrator(project_root=tmp_path / "project")
+    orchestrator.resources = ResourceManager(cgroupfs)
+
+    async def spawn(argv, **kwargs):
+        raise error("cannot spawn")
+
+    orchestrator.spawner.spawn = spawn
+    config = SwarmConfig(
+        agents={"worker": {"instances": 1, "command": ["true"], "resources": {"memory": "256MB"}}}
+    )
+
+    try:
+        if error is ValueError:
+            deployment = asyncio.run(orchestrator.deploy_swarm(config))
+            (process,) = deployment.agents["worker"]
+            assert process.status == "failed"
+        else:
+            # Unexpected errors still propagate, but without leaking the leaf.
+            with pytest.raises(RuntimeError):
+                asyncio.run(orchestrator.deploy_swarm(config))
+    finally:
+        orchestrator.close()
+
+    assert [path.name for path in (cgroupfs / "agentswarm").rglob("worker-*")] == []
@@ -0,0 +1,120 @@
+"""
+AgentSwarm CLI Startup Benchmark
+================================
+
+``agentswarm --help`` and light subcommands are called from scripts in
+tight loops, so the entry point must not import rich, yaml, psutil or the
+workflow package, nor open the state store, before a subcommand needs them.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from click.testing import CliRunner  # noqa: E402
+
+from agentswarm.cli.main import LAZY_COMMANDS, cli  # noqa: E402
+
+# Import time spent on ``agentswarm --help``, as reported by -X importtime.
+# The eager CLI took about 230ms on the reference machine.
+HELP_IMPORT_BUDGET_MS = 120
+
+HEAVY_MODULES = ("rich", "yaml", "psutil", "agentswarm.workflows", "agentswarm.core")
+
+_HELP_SCRIPT = """
+import sys
+from agentswarm.cli.main import cli
+try:
+    cli(["--help"])
+except SystemExit:
+    pass
+heavy = sorted(
+    name for name in sys.modules
+    if any(name == prefix or name.startswith(prefix + ".") for prefix in sys.argv[1:])
+)
+print(",".join(heavy), file=sys.stderr)
+"""
+
+
+def _run_help():
+    env = dict(os.environ, PYTHONPATH=str(AGENTSWARM_SRC))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _HELP_SCRIPT, *HEAVY_MODULES],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=AGENTSWARM_SRC,
+        check=True,
+    )
+    lines = result.stderr.splitlines()
+    heavy = [name for name in lines[-1].split(",") if name]
+
+    # Top-level imports are the entries without indentation before the name;
+    # their cumulative times add up to the whole import cost.
+    total_us = 0
+    for line in lines[:-1]:
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000, heavy, result.stdout
+
+
+@pytest.mark.performance
+def test_help_stays_within_import_budget():
+    import_ms, heavy, output = min(
+        (_run_help() for _ in range(3)), key=lambda run: run[0]
+    )
+    print(f"agentswarm --help imports: {import_ms:.1f}ms")
+
+    assert "workflow" in output
+    assert heavy == []
+    assert import_ms < HELP_IMPORT_BUDGET_MS
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("name", sorted(LAZY_COMMANDS))
+def test_lazy_help_matches_command(name):
+    command = cli.get_command(None, name)
+    placeholder = type(command)(name, help=LAZY_COMMANDS[name][1])
+
+    assert command.get_short_help_str(200) == placeholder.get_short_help_str(200)
+
+
+@pytest.mark.performance
+def test_workflow_list_does_not_open_state_store(tmp_path):
+    result = CliRunner().invoke(cli, ["--project", str(tmp_path), "workflow", "list"])
+
+    assert result.exit_code == 0, result.output
+    assert "codebase-analysis" in result.output
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.performance
+def test_workflow_status_and_daemon_run_do_not_open_state_store(tmp_path, monkeypatch):
+    from agentswarm.cli import workflow as workflow_cli
+
+    class _Daemon:
+        def call(self, method, **params):
+            raise RuntimeError(f"{method} refused")
+
+    (tmp_path / "workflow_state").mkdir()
+    result = CliRunner().invoke(cli, ["--project", str(tmp_path), "workflow", "status", "missing"])
+    assert result.exit_code == 0, result.output
+    assert "not found" in result.output
+
+    # The daemon reads deployment state itself; the client must not open it.
+    monkeypatch.setattr(workflow_cli, "_get_daemon", lambda ctx: _Daemon())
+    result = CliRunner().invoke(
+        cli, ["--project", str(tmp_path), "workflow", "run", "codebase-analysis"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "workflow.run refused" in result.output
+    assert [path.name for path in tmp_path.iterdir()] == ["workflow_state"]
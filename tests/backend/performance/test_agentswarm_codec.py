@@ -0,0 +1,119 @@
+"""
+AgentSwarm State Codec Benchmark
+================================
+
+Load and save throughput of state snapshots for every codec available in
+this environment, at several state sizes. Files written by any codec, and
+plain JSON written before codecs existed, must load back unchanged.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core import codec  # noqa: E402
+from agentswarm.core.codec import StateCodec  # noqa: E402
+from agentswarm.core.state import SwarmStateStore, thaw  # noqa: E402
+
+SIZES = (10, 1_000, 10_000)  # processes per snapshot
+
+CODECS = [("json", "none"), ("json", "zlib")]
+if codec.msgpack is not None:
+    CODECS.append(("msgpack", "none"))
+if codec.zstandard is not None:
+    CODECS.append(("json", "zstd"))
+
+
+def _state(processes: int):
+    return {
+        "version": 2,
+        "last_deployment_id": "swarm-bench",
+        "deployments": {
+            "swarm-bench": {
+                "deployment_id": "swarm-bench",
+                "start_time": "2024-01-01T00:00:00+00:00",
+                "config": {"agents": {"codex": {"instances": processes}}},
+                "agents": {
+                    "codex": [
+                        {
+                            "pid": 10_000 + index,
+                            "agent_type": "codex",
+                            "instance_id": index,
+                            "command": f"codex --instance {index}",
+                            "cwd": "/srv/project",
+                            "log_path": f"/srv/project/.agentswarm/logs/codex-{index}.log",
+                            "cpus": str(index % 64),
+                        }
+                        for index in range(processes)
+                    ]
+                },
+            }
+        },
+    }
+
+
+def _best_of(func, rounds: int = 5) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("processes", SIZES)
+@pytest.mark.parametrize("format,compression", CODECS)
+def test_codec_throughput(format, compression, processes):
+    state = _state(processes)
+    state_codec = StateCodec(format, compression)
+    payload = state_codec.encode(state)
+
+    save = _best_of(lambda: state_codec.encode(state))
+    load = _best_of(lambda: codec.decode(payload))
+    baseline = _best_of(lambda: json.dumps(state, indent=2).encode("utf-8"))
+    print(
+        f"{format}+{compression} {processes} processes: {len(payload) / 1024:.0f} KiB,"
+        f" save {save * 1e3:.2f}ms (stdlib json {baseline * 1e3:.2f}ms), load {load * 1e3:.2f}ms"
+    )
+
+    assert codec.decode(payload) == state
+    if compression != "none":
+        assert len(payload) < len(json.dumps(state))
+
+
+@pytest.mark.performance
+@pytest.mark.skipif(codec.orjson is None, reason="orjson is not installed")
+def test_orjson_saves_faster_than_stdlib():
+    state = _state(10_000)
+
+    fast = _best_of(lambda: StateCodec("json", "none").encode(state))
+    stdlib = _best_of(lambda: json.dumps(state, indent=2).encode("utf-8"))
+    print(f"orjson save {fast * 1e3:.2f}ms, stdlib json {stdlib * 1e3:.2f}ms ({stdlib / fast:.1f}x)")
+
+    # orjson is typically several times faster; only a loss is a failure,
+    # so a noisy machine cannot flip the result.
+    assert fast < stdlib
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("format,compression", CODECS)
+def test_store_reads_snapshots_from_any_codec(tmp_path, format, compression):
+    legacy = _state(10)
+    (tmp_path / "state.json").write_text(json.dumps(legacy, indent=2))
+    assert thaw(SwarmStateStore(tmp_path).as_dict()["deployments"]) == legacy["deployments"]
+
+    store = SwarmStateStore(tmp_path, codec=StateCodec(format, compression))
+    store.remove_deployment("swarm-bench")
+    store.compact()
+
+    assert (tmp_path / "state.json").read_bytes().startswith(codec.MAGIC) == (
+        (format, compression) != ("json", "none")
+    )
+    assert thaw(SwarmStateStore(tmp_path).as_dict()["deployments"]) == {}
@@ -0,0 +1,98 @@
+"""
+AgentSwarm Config Cache
+=======================
+
+Loading an unchanged ``agentswarm.yaml`` must come from the parsed-config
+cache without re-running YAML parsing or validation, and any change to the
+file must invalidate the cached entry. Entries live in the project's state
+directory, never next to a config file kept elsewhere.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core import config as config_module  # noqa: E402
+from agentswarm.core.config import SwarmConfig  # noqa: E402
+
+AGENT_TYPES = 300
+
+
+@pytest.fixture
+def state_dir(tmp_path):
+    return tmp_path / "project" / ".agentswarm"
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "configs" / "agentswarm.yaml"
+    path.parent.mkdir()
+    agents = {
+        f"agent-{index}": {
+            "instances": 2,
+            "tasks": [f"task {task}" for task in range(20)],
+            "resources": {"memory": "2GB", "cpu_weight": 200},
+        }
+        for index in range(AGENT_TYPES)
+    }
+    path.write_text(yaml.safe_dump({"agents": agents, "deployment": {"strategy": "waves"}}))
+    return path
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+@pytest.mark.performance
+def test_cache_hit_skips_parsing_and_validation(config_path, state_dir, monkeypatch):
+    cold, cold_cost = _timed(lambda: SwarmConfig.from_file(config_path, state_dir=state_dir))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache hit must not parse or validate")
+
+    monkeypatch.setattr(config_module.yaml, "safe_load", fail)
+    monkeypatch.setattr(SwarmConfig, "validate", fail)
+    warm, warm_cost = _timed(lambda: SwarmConfig.from_file(config_path, state_dir=state_dir))
+    print(f"{AGENT_TYPES} agent types: cold {cold_cost * 1e3:.1f}ms, cached {warm_cost * 1e3:.1f}ms")
+
+    assert warm.to_dict() == cold.to_dict()
+    assert warm.deployment["timeout"] == "30m"  # normalized defaults are cached too
+    assert warm_cost * 10 < cold_cost
+    assert len(list((state_dir / "cache").iterdir())) == 1
+    assert list(config_path.parent.iterdir()) == [config_path]
+
+
+@pytest.mark.performance
+def test_changed_file_invalidates_entry(config_path, state_dir):
+    SwarmConfig.from_file(config_path, state_dir=state_dir)
+    stat = config_path.stat()
+    config_path.write_text(config_path.read_text().replace("task 1\n", "task one\n"))
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))  # same mtime, new content
+
+    reloaded = SwarmConfig.from_file(config_path, state_dir=state_dir)
+    assert reloaded.agents["agent-0"]["tasks"][1] == "task one"
+
+    config_path.write_text("agents:\n  codex:\n    instances: 0\n")
+    with pytest.raises(ValueError):
+        SwarmConfig.from_file(config_path, state_dir=state_dir)
+
+
+@pytest.mark.performance
+def test_cache_can_be_disabled(config_path, state_dir, monkeypatch):
+    monkeypatch.setenv(config_module.CONFIG_CACHE_ENV, "off")
+    SwarmConfig.from_file(config_path, state_dir=state_dir)
+    # Without a project state directory there is nowhere to cache.
+    monkeypatch.delenv(config_module.CONFIG_CACHE_ENV)
+    SwarmConfig.from_file(config_path)
+
+    assert not state_dir.exists()
+    assert list(config_path.parent.iterdir()) == [config_path]
@@ -0,0 +1,112 @@
+"""
+AgentSwarm Daemon Round Trip
+============================
+
+CLI commands reach a running daemon through DaemonClient: one JSON line per
+request over the project's Unix socket, served from the daemon's long-lived
+orchestrator. Stopping the daemon leaves the agents it started running and
+logging. A daemon that fails to start exits with a non-zero status.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from click.testing import CliRunner  # noqa: E402
+
+from agentswarm.cli.main import cli  # noqa: E402
+from agentswarm.core.daemon import DaemonClient, DaemonError, daemon_socket_path  # noqa: E402
+
+SERVE = """
+import asyncio, sys
+sys.path.insert(0, {src!r})
+from agentswarm.core.daemon import OrchestratorDaemon
+from agentswarm.core.orchestrator import AgentOrchestrator
+
+async def main():
+    orchestrator = AgentOrchestrator(project_root={project!r})
+    await OrchestratorDaemon(orchestrator, autoscale=False, watchdog=False).serve_forever()
+
+asyncio.run(main())
+"""
+
+TICKER = "import time\nwhile True:\n    print('tick', flush=True)\n    time.sleep(0.05)\n"
+
+
+def _start_daemon(project):
+    script = SERVE.format(src=str(AGENTSWARM_SRC), project=str(project))
+    daemon = subprocess.Popen([sys.executable, "-c", script])
+    deadline = time.monotonic() + 15
+    while DaemonClient.for_project(project) is None:
+        assert daemon.poll() is None, "daemon exited during start-up"
+        assert time.monotonic() < deadline, "daemon never started listening"
+        time.sleep(0.05)
+    return daemon
+
+
+@pytest.mark.performance
+def test_round_trip_through_the_daemon(tmp_path):
+    daemon = _start_daemon(tmp_path)
+    client = DaemonClient(daemon_socket_path(tmp_path))
+    pids = []
+    try:
+        assert client.call("ping")["pid"] == daemon.pid
+
+        config = {"agents": {"ticker": {"instances": 2, "command": [sys.executable, "-c", TICKER]}}}
+        deployment = client.call("deploy", config=config)
+        deployment_id = deployment["deployment_id"]
+        pids = [proc["pid"] for proc in deployment["agents"]["ticker"]]
+
+        start = time.perf_counter()
+        changed = client.call("scale", agent_type="ticker", delta=1)["changed"]
+        print(f"scale round trip {(time.perf_counter() - start) * 1e3:.1f}ms")
+        pids += [proc["pid"] for proc in changed]
+
+        health = client.call("health")
+        assert health[f"{deployment_id}:ticker"]["healthy"] == 3
+        assert [entry["deployment_id"] for entry in client.call("deployments")] == [deployment_id]
+        assert client.call("deployment")["agents"]["ticker"][2]["instance_id"] == 3
+
+        with pytest.raises(DaemonError, match="not found"):
+            client.call("scale", agent_type="missing", delta=1)
+
+        assert client.call("stop") == {"stopping": True}
+        assert daemon.wait(timeout=15) == 0
+        assert not daemon_socket_path(tmp_path).exists()
+
+        # The agents outlive the daemon and keep writing their logs.
+        log = tmp_path / ".agentswarm" / "logs" / deployment_id / "ticker-1.log"
+        size = log.stat().st_size
+        time.sleep(0.3)
+        for pid in pids:
+            os.kill(pid, 0)
+        assert log.stat().st_size > size
+    finally:
+        if daemon.poll() is None:
+            daemon.kill()
+            daemon.wait()
+        for pid in pids:
+            try:
+                os.kill(pid, 9)
+            except ProcessLookupError:
+                pass
+
+
+@pytest.mark.performance
+def test_failed_start_exits_non_zero(tmp_path):
+    daemon = _start_daemon(tmp_path)
+    try:
+        # A second daemon for the same project cannot bind the socket.
+        result = CliRunner().invoke(cli, ["--project", str(tmp_path), "daemon", "start"])
+        assert result.exit_code == 1
+        assert "Daemon failed" in result.output and "already listening" in result.output
+    finally:
+        daemon.kill()
+        daemon.wait()
@@ -0,0 +1,93 @@
+"""
+AgentSwarm Deployment Index
+===========================
+
+The orchestrator starts from a summary index of recorded deployments and
+only hydrates a deployment (config, processes, pools) once it is used.
+Commands that target every deployment, such as ``health``, still cover all
+of them.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.config import SwarmConfig  # noqa: E402
+from agentswarm.core.models import AgentProcess, SwarmDeployment  # noqa: E402
+from agentswarm.core.orchestrator import AgentOrchestrator  # noqa: E402
+from agentswarm.core.state import STATE_DIRECTORY_NAME, SwarmStateStore  # noqa: E402
+
+DEPLOYMENTS = 40
+INSTANCES = 25
+
+
+def _record(project):
+    store = SwarmStateStore(project / STATE_DIRECTORY_NAME)
+    for index in range(DEPLOYMENTS):
+        store.record_deployment(
+            SwarmDeployment(
+                agents={
+                    "codex": [
+                        # Exited agents: hydrating them must not touch real processes.
+                        AgentProcess(
+                            pid=-1,
+                            agent_type="codex",
+                            instance_id=instance_id,
+                            command="codex",
+                            status="exited",
+                            exit_time=1.0,
+                        )
+                        for instance_id in range(1, INSTANCES + 1)
+                    ]
+                },
+                config=SwarmConfig(agents={"codex": {"instances": INSTANCES}}),
+                deployment_id=f"d{index:02d}",
+                start_time="2024-01-01T00:00:00+00:00",
+            )
+        )
+    store.compact()
+
+
+@pytest.mark.performance
+def test_startup_hydrates_nothing(tmp_path):
+    _record(tmp_path)
+
+    start = time.perf_counter()
+    orchestrator = AgentOrchestrator(project_root=tmp_path)
+    startup = time.perf_counter() - start
+    print(f"startup with {DEPLOYMENTS} deployments: {startup * 1e3:.1f}ms")
+
+    assert orchestrator.deployments == {}
+    assert orchestrator.pools == {}
+    summaries = orchestrator.deployment_summaries()
+    assert len(summaries) == DEPLOYMENTS
+    assert summaries[-1].agent_counts == {"codex": INSTANCES}
+    assert orchestrator.resolve_deployment_id(None) == f"d{DEPLOYMENTS - 1:02d}"
+
+    deployment = orchestrator.get_deployment("d07")
+    assert list(orchestrator.deployments) == ["d07"]
+    assert len(deployment.agents["codex"]) == INSTANCES
+    orchestrator.close()
+
+
+@pytest.mark.performance
+def test_health_covers_every_deployment_by_default(tmp_path):
+    _record(tmp_path)
+    orchestrator = AgentOrchestrator(project_root=tmp_path)
+
+    everything = asyncio.run(orchestrator.health_check())
+    one = asyncio.run(orchestrator.health_check("d03"))
+
+    assert len(everything) == DEPLOYMENTS
+    assert all(health.status == "unhealthy" for health in everything.values())
+    assert list(one) == ["d03:codex"]
+    assert one["d03:codex"].unhealthy_instances == INSTANCES
+    with pytest.raises(ValueError, match="not found"):
+        asyncio.run(orchestrator.health_check("missing"))
+    orchestrator.close()
@@ -0,0 +1,112 @@
+"""
+AgentSwarm State Journal
+========================
+
+Persisting a pool change appends one journal line instead of rewriting
+``state.json``. Loading replays the journal over the snapshot, skipping a
+torn final line, and compaction folds the journal back into the snapshot
+without losing entries other processes appended meanwhile.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.config import SwarmConfig  # noqa: E402
+from agentswarm.core.models import AgentProcess, SwarmDeployment  # noqa: E402
+from agentswarm.core.state import SwarmStateStore  # noqa: E402
+
+POOLS = ("codex", "claude", "gemini", "review")
+
+
+def _processes(agent_type, count):
+    return [
+        AgentProcess(pid=10_000 + index, agent_type=agent_type, instance_id=index, command=agent_type)
+        for index in range(1, count + 1)
+    ]
+
+
+def _deployment(deployment_id, instances=50):
+    return SwarmDeployment(
+        agents={agent_type: _processes(agent_type, instances) for agent_type in POOLS},
+        config=SwarmConfig(agents={agent_type: {"instances": instances} for agent_type in POOLS}),
+        deployment_id=deployment_id,
+        start_time="2024-01-01T00:00:00+00:00",
+    )
+
+
+def _pids(store, deployment_id, agent_type):
+    return [entry["pid"] for entry in store.get_deployment(deployment_id)["agents"][agent_type]]
+
+
+@pytest.mark.performance
+def test_pool_updates_append_to_the_journal(tmp_path):
+    store = SwarmStateStore(tmp_path)
+    for index in range(20):
+        store.record_deployment(_deployment(f"d{index}"))
+    store.compact()
+    snapshot = store.state_path.read_bytes()
+
+    start = time.perf_counter()
+    for count in range(1, 51):
+        store.update_agents("d0", "codex", _processes("codex", count % 5 + 1))
+    per_update = (time.perf_counter() - start) / 50
+    print(f"pool update: {per_update * 1e6:.0f}us, snapshot {len(snapshot) / 1e3:.0f}kB")
+
+    assert store.state_path.read_bytes() == snapshot
+    assert len(store.journal_path.read_bytes().splitlines()) == 50
+    assert store.journal_path.stat().st_size < len(snapshot) / 10
+
+    reopened = SwarmStateStore(tmp_path)
+    assert _pids(reopened, "d0", "codex") == _pids(store, "d0", "codex") == [10_001]
+    assert _pids(reopened, "d1", "codex") == list(range(10_001, 10_051))
+
+
+@pytest.mark.performance
+def test_torn_journal_line_is_skipped(tmp_path):
+    store = SwarmStateStore(tmp_path)
+    store.record_deployment(_deployment("d0", instances=2))
+    with store.journal_path.open("ab") as handle:
+        handle.write(b'{"op": "remove", "deployment_id": "d0"')  # crashed mid-append
+
+    survivor = SwarmStateStore(tmp_path)
+    assert survivor.get_deployment("d0") is not None
+
+    # The next append starts on its own line instead of merging with the torn one.
+    survivor.update_agents("d0", "codex", _processes("codex", 1))
+    reopened = SwarmStateStore(tmp_path)
+    assert _pids(reopened, "d0", "codex") == [10_001]
+    assert _pids(reopened, "d0", "claude") == [10_001, 10_002]
+
+
+@pytest.mark.performance
+def test_compaction_keeps_entries_from_other_writers(tmp_path):
+    first = SwarmStateStore(tmp_path, compact_bytes=1 << 30)
+    second = SwarmStateStore(tmp_path, compact_bytes=1 << 30)
+    first.record_deployment(_deployment("d0", instances=3))
+    second.record_deployment(_deployment("d1", instances=3))
+    first.update_agents("d0", "codex", _processes("codex", 1))
+
+    second.compact()
+
+    assert second.journal_path.stat().st_size == 0
+    assert {entry["deployment_id"] for entry in second.list_deployments()} == {"d0", "d1"}
+    assert _pids(second, "d0", "codex") == [10_001]
+    assert _pids(SwarmStateStore(tmp_path), "d1", "review") == [10_001, 10_002, 10_003]
+
+
+@pytest.mark.performance
+def test_journal_is_compacted_once_it_outgrows_the_limit(tmp_path):
+    store = SwarmStateStore(tmp_path, compact_bytes=4096)
+    store.record_deployment(_deployment("d0", instances=3))
+    for count in range(1, 40):
+        store.update_agents("d0", "codex", _processes("codex", count % 4 + 1))
+
+    assert store.journal_path.stat().st_size < 4096
+    assert store.state_path.exists()
+    assert _pids(SwarmStateStore(tmp_path), "d0", "codex") == _pids(store, "d0", "codex")
@@ -0,0 +1,143 @@
+"""
+AgentSwarm Concurrent Provisioning
+==================================
+
+Pools are provisioned concurrently under one LaunchThrottle that bounds the
+launches in flight across the whole deployment. When one pool fails, the
+instances other pools already started must not be left running unrecorded.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core import agent_pool  # noqa: E402
+from agentswarm.core.agent_pool import AgentPool, LaunchThrottle  # noqa: E402
+from agentswarm.core.config import SwarmConfig  # noqa: E402
+from agentswarm.core.models import AgentProcess  # noqa: E402
+from agentswarm.core.orchestrator import AgentOrchestrator  # noqa: E402
+
+LAUNCH_SECONDS = 0.02
+
+
+class _Launches:
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    async def provisioner(self, instance_id, config):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(LAUNCH_SECONDS)
+        finally:
+            self.running -= 1
+        return AgentProcess(pid=0, agent_type="sim", instance_id=instance_id, command="sim")
+
+
+async def _terminator(process):
+    process.status = "terminated"
+
+
+def _pids_alive(pids):
+    alive = []
+    for pid in pids:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            continue
+        # Zombies still answer kill(0); reap so only live processes count.
+        if os.waitpid(pid, os.WNOHANG) == (0, 0):
+            alive.append(pid)
+    return alive
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "deployment, bound",
+    [
+        ({"strategy": "parallel", "max_concurrent": 3}, 3),
+        ({"strategy": "sequential", "max_concurrent": 8}, 1),
+    ],
+)
+def test_throttle_bounds_launches_across_pools(deployment, bound):
+    launches = _Launches()
+    throttle = LaunchThrottle.from_deployment(deployment)
+    pools = [AgentPool(f"sim{index}", "bench", {}, launches.provisioner, _terminator) for index in range(3)]
+
+    async def scenario():
+        start = time.perf_counter()
+        await asyncio.gather(*(pool.scale(4, throttle=throttle) for pool in pools))
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(scenario())
+
+    assert launches.peak == bound
+    assert sum(len(pool.registry) for pool in pools) == 12
+    assert elapsed >= (12 // bound) * LAUNCH_SECONDS * 0.9
+
+
+@pytest.mark.performance
+def test_jitter_does_not_hold_a_launch_slot(monkeypatch):
+    jitter = 0.05
+    monkeypatch.setattr(agent_pool.random, "uniform", lambda low, high: high)
+    launches = _Launches()
+    throttle = LaunchThrottle.from_deployment({"strategy": "sequential", "launch_jitter": jitter})
+    pool = AgentPool("sim", "bench", {}, launches.provisioner, _terminator)
+
+    async def scenario():
+        start = time.perf_counter()
+        await pool.scale(6, throttle=throttle)
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(scenario())
+
+    assert launches.peak == 1
+    # The jitters overlap instead of adding up behind the single slot.
+    assert elapsed < 6 * (jitter + LAUNCH_SECONDS) * 0.75
+
+
+@pytest.mark.performance
+def test_failed_pool_does_not_orphan_other_pools(tmp_path):
+    orchestrator = AgentOrchestrator(project_root=tmp_path)
+    started = []
+    launch = orchestrator._deploy_agent_instance
+
+    async def flaky_launch(deployment_id, agent_type, instance_id, config):
+        if agent_type == "broken":
+            await asyncio.sleep(0.1)  # let the other pool finish launching first
+            raise RuntimeError("cgroup setup failed")
+        process = await launch(deployment_id, agent_type, instance_id, config)
+        started.append(process.pid)
+        return process
+
+    orchestrator._deploy_agent_instance = flaky_launch
+    config = SwarmConfig(
+        agents={
+            "worker": {"instances": 3, "command": ["sleep", "30"], "standby": 1},
+            "broken": {"instances": 1, "command": ["sleep", "30"]},
+        },
+        deployment={"max_concurrent": 8, "shutdown_grace": "1s"},
+    )
+
+    async def scenario():
+        with pytest.raises(RuntimeError, match="cgroup setup failed"):
+            await orchestrator.deploy_swarm(config)
+
+    try:
+        asyncio.run(scenario())
+        assert len(started) >= 3
+        assert _pids_alive(started) == []
+        assert orchestrator.pools == {}
+        assert orchestrator.deployment_summaries() == []
+    finally:
+        for pid in _pids_alive(started):
+            os.kill(pid, 9)
+        orchestrator.close()
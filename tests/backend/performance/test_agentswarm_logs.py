@@ -0,0 +1,120 @@
+"""
+AgentSwarm Agent Logs
+=====================
+
+Agents write their output straight to their log file, so they keep logging
+(and never see SIGPIPE) after the CLI command that started them has closed
+its orchestrator and event loop. Logs are rotated by size off the loop and
+tails are read back from the file.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.agents.base_agent import BaseAgent  # noqa: E402
+from agentswarm.core.config import SwarmConfig  # noqa: E402
+from agentswarm.core.logs import AgentLogs, read_log_tail  # noqa: E402
+from agentswarm.core.orchestrator import AgentOrchestrator  # noqa: E402
+
+TICKER = "import sys, time\nfor i in range(40):\n    print('tick', i, flush=True)\n    time.sleep(0.02)\nprint('oops', file=sys.stderr, flush=True)\n"
+
+
+@pytest.mark.performance
+def test_agent_keeps_logging_after_the_cli_exits(tmp_path):
+    config = SwarmConfig(agents={"ticker": {"instances": 1, "command": [sys.executable, "-c", TICKER]}})
+    orchestrator = AgentOrchestrator(project_root=tmp_path)
+    deployment = asyncio.run(orchestrator.deploy_swarm(config))
+    orchestrator.close()
+
+    process = deployment.agents["ticker"][0]
+    assert process.handle.wait(timeout=10) == 0  # no SIGPIPE once nobody reads
+
+    reopened = AgentOrchestrator(project_root=tmp_path)
+    lines = reopened.get_instance_logs("ticker", process.instance_id, lines=3)
+    assert lines == ["tick 38", "tick 39", "oops"]
+    assert Path(process.log_path) == reopened.logs.log_path(deployment.deployment_id, "ticker", 1)
+    reopened.close()
+
+
+@pytest.mark.performance
+def test_live_log_is_rotated_in_place(tmp_path):
+    logs = AgentLogs(tmp_path / "logs", max_bytes=1000, backup_count=2)
+    path = logs.log_path("d1", "worker", 1)
+
+    fd = logs.open("d1", "worker", 1)
+    try:
+        for round_ in range(3):
+            os.write(fd, f"round {round_}\n".encode() + b"x" * 1200 + b"\n")
+            assert logs.rotate() == 1
+            assert path.stat().st_size == 0
+        os.write(fd, b"after\n")
+    finally:
+        os.close(fd)
+
+    # The writer's O_APPEND descriptor continues at the start of the file.
+    assert path.read_bytes() == b"after\n"
+    assert read_log_tail(path.with_name(path.name + ".1"), 2)[0] == "round 2"
+    assert read_log_tail(path.with_name(path.name + ".2"), 2)[0] == "round 1"
+    assert not path.with_name(path.name + ".3").exists()
+    assert logs.rotate() == 0
+
+
+@pytest.mark.performance
+def test_each_launch_starts_a_fresh_file(tmp_path):
+    logs = AgentLogs(tmp_path / "logs")
+    for generation in ("first", "second"):
+        fd = logs.open("d1", "worker", 1, {"logs": {"backups": 1}})
+        os.write(fd, f"{generation}\n".encode())
+        os.close(fd)
+
+    path = logs.log_path("d1", "worker", 1)
+    assert logs.tail("d1", "worker", 1) == ["second"]
+    assert read_log_tail(path.with_name(path.name + ".1")) == ["first"]
+
+
+@pytest.mark.performance
+def test_tail_reads_only_the_end_of_large_logs(tmp_path):
+    path = tmp_path / "big.log"
+    path.write_bytes(b"".join(f"line {index}\n".encode() for index in range(200_000)))
+
+    start = time.perf_counter()
+    tail = read_log_tail(path, 5)
+    elapsed = time.perf_counter() - start
+    print(f"tail of {path.stat().st_size / 1e6:.1f}MB log in {elapsed * 1e3:.2f}ms")
+
+    assert tail == [f"line {index}" for index in range(199_995, 200_000)]
+
+
+class _Agent(BaseAgent):
+    async def deploy(self, task, config):
+        raise NotImplementedError
+
+    async def monitor(self):
+        raise NotImplementedError
+
+    async def stop(self):
+        pass
+
+    async def restart(self):
+        pass
+
+
+@pytest.mark.performance
+def test_agent_get_logs_reads_its_log_file(tmp_path):
+    logs = AgentLogs(tmp_path)
+    path = logs.log_path("d1", "codex", 1)
+    path.parent.mkdir(parents=True)
+    path.write_text("".join(f"line {index}\n" for index in range(500)))
+
+    agent = _Agent(1, {"log_path": str(path)})
+    assert asyncio.run(agent.get_logs(lines=2)) == "line 498\nline 499"
+    assert asyncio.run(agent.get_logs()).splitlines() == logs.tail("d1", "codex", 1)
+    assert asyncio.run(_Agent(2).get_logs()) == ""
@@ -0,0 +1,67 @@
+"""
+AgentSwarm State Write Coalescing
+=================================
+
+Bursts of workflow state mutations must collapse into a single atomic
+rewrite of the state file instead of one full rewrite per mutation.
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core import persistence  # noqa: E402
+from agentswarm.workflows.models import WorkflowExecution  # noqa: E402
+from agentswarm.workflows.state import WorkflowStateStore  # noqa: E402
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    recorded = []
+    atomic_write = persistence.atomic_write
+
+    def recording(path, data, *, fsync=True):
+        recorded.append(path.name)
+        atomic_write(path, data, fsync=fsync)
+
+    monkeypatch.setattr(persistence, "atomic_write", recording)
+    return recorded
+
+
+@pytest.mark.performance
+def test_burst_of_saves_is_written_once(tmp_path, writes):
+    async def burst():
+        store = WorkflowStateStore(tmp_path, debounce=0.05)
+        for index in range(500):
+            store.save_execution(WorkflowExecution(id=f"run-{index % 10}", definition_id="wf"))
+        assert writes == []
+        await asyncio.sleep(0.2)
+        return store
+
+    store = asyncio.run(burst())
+
+    assert writes == ["workflow_executions.json"]
+    assert not store._writer.dirty
+    data = json.loads((tmp_path / "workflow_executions.json").read_text())
+    assert len(data["executions"]) == 10
+    assert [path.name for path in tmp_path.iterdir()] == ["workflow_executions.json"]
+
+
+@pytest.mark.performance
+def test_pending_changes_are_written_on_flush(tmp_path, writes):
+    store = WorkflowStateStore(tmp_path, debounce=60)
+    store.save_execution(WorkflowExecution(id="first", definition_id="wf"))
+    store.save_execution(WorkflowExecution(id="second", definition_id="wf"))
+    assert len(writes) == 1  # the first change after a quiet period goes out at once
+
+    store.flush()
+
+    assert len(writes) == 2
+    reloaded = WorkflowStateStore(tmp_path)
+    assert {execution.id for execution in reloaded.list_executions()} == {"first", "second"}
@@ -0,0 +1,159 @@
+"""
+AgentSwarm CPU Placement
+========================
+
+``spread`` puts each new instance on the least loaded NUMA node and
+``pack`` fills a node before moving to the next. CPU load is shared by every
+deployment of the orchestrator, including recorded deployments that have not
+been hydrated yet, so a restarted orchestrator does not pin new instances
+onto cores that running agents already hold. Instances are pinned before
+exec, so everything an agent forks inherits its CPUs.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.config import SwarmConfig  # noqa: E402
+from agentswarm.core.models import AgentProcess, SwarmDeployment  # noqa: E402
+from agentswarm.core.orchestrator import AgentOrchestrator  # noqa: E402
+from agentswarm.core.placement import CpuPlacer, NumaTopology, PlacementPolicy  # noqa: E402
+from agentswarm.core.state import open_state_store  # noqa: E402
+
+TOPOLOGY = NumaTopology(nodes={0: (0, 1, 2, 3), 1: (4, 5, 6, 7)})
+
+
+def _policy(mode, cpus_per_instance=1, **extra):
+    return PlacementPolicy.from_config(
+        {"placement": {"mode": mode, "cpus_per_instance": cpus_per_instance, **extra}}
+    )
+
+
+def _assign(placer, policy, count):
+    return [placer.assign(policy) for _ in range(count)]
+
+
+@pytest.mark.performance
+def test_spread_alternates_between_nodes():
+    placer = CpuPlacer(TOPOLOGY)
+    assert _assign(placer, _policy("spread"), 4) == [(0,), (4,), (1,), (5,)]
+
+
+@pytest.mark.performance
+def test_pack_fills_a_node_first():
+    placer = CpuPlacer(TOPOLOGY)
+    assert _assign(placer, _policy("pack"), 5) == [(0,), (1,), (2,), (3,), (4,)]
+    # Without a node that has room, the least loaded node and CPUs win.
+    assert _assign(placer, _policy("pack", cpus_per_instance=2), 2) == [(5, 6), (4, 7)]
+
+
+@pytest.mark.performance
+def test_pools_share_the_load_and_release_it():
+    placer = CpuPlacer(TOPOLOGY)
+    first = _assign(placer, _policy("spread", cpus_per_instance=2), 2)
+    second = _assign(placer, _policy("spread", cpus_per_instance=2, nodes=[1]), 1)
+    assert first == [(0, 1), (4, 5)]
+    assert second == [(6, 7)]
+
+    placer.release(first[0])
+    assert placer.assign(_policy("spread", cpus_per_instance=2)) == (0, 1)
+
+
+def _record_pinned(store):
+    processes = [
+        AgentProcess(pid=-1, agent_type="codex", instance_id=1, command="codex", cpus="0-1"),
+        AgentProcess(pid=-1, agent_type="codex", instance_id=2, command="codex", cpus="4"),
+        # Exited instances no longer hold their CPUs.
+        AgentProcess(
+            pid=-1,
+            agent_type="codex",
+            instance_id=3,
+            command="codex",
+            status="exited",
+            exit_time=1.0,
+            cpus="5-7",
+        ),
+    ]
+    store.record_deployment(
+        SwarmDeployment(
+            agents={"codex": processes},
+            config=SwarmConfig(agents={"codex": {"instances": 3, "placement": "spread"}}),
+            deployment_id="d0",
+            start_time="2024-01-01T00:00:00+00:00",
+        )
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_pins_of_unhydrated_deployments_are_claimed_at_startup(tmp_path, monkeypatch, backend):
+    monkeypatch.setattr(NumaTopology, "detect", classmethod(lambda cls, *args: TOPOLOGY))
+    _record_pinned(open_state_store(tmp_path / "state", backend=backend))
+
+    orchestrator = AgentOrchestrator(
+        project_root=tmp_path, state_store=open_state_store(tmp_path / "state", backend=backend)
+    )
+    assert orchestrator.deployments == {}
+    assert orchestrator.deployment_summaries()[0].pinned_cpus == ["0-1", "4"]
+    # CPUs 0, 1 and 4 are taken: node 1 is the less loaded one.
+    assert _assign(orchestrator.placer, _policy("spread"), 3) == [(5,), (2,), (6,)]
+
+    # Hydrating the deployment does not claim its pins a second time.
+    orchestrator.get_deployment("d0")
+    assert orchestrator.deployment_summaries()[0].pinned_cpus == ["0-1", "4"]
+    assert _assign(orchestrator.placer, _policy("spread"), 2) == [(3,), (7,)]
+    orchestrator.close()
+
+
+@pytest.mark.performance
+def test_agents_and_their_children_are_pinned_before_exec(tmp_path, monkeypatch):
+    cpu = max(os.sched_getaffinity(0))
+    monkeypatch.setattr(
+        NumaTopology, "detect", classmethod(lambda cls, *args: NumaTopology(nodes={0: (cpu,)}))
+    )
+    orchestrator = AgentOrchestrator(project_root=tmp_path)
+    # ``grep`` is a child the shell forks on its own, after the spawn.
+    config = SwarmConfig(
+        agents={
+            "worker": {
+                "instances": 1,
+                "command": ["sh", "-c", "grep Cpus_allowed_list /proc/self/status"],
+                "placement": "pack",
+            }
+        }
+    )
+
+    deployment = asyncio.run(orchestrator.deploy_swarm(config))
+    try:
+        (process,) = deployment.agents["worker"]
+        assert process.handle.wait(timeout=10) == 0
+        assert process.cpus == str(cpu)
+        (line,) = orchestrator.get_instance_logs("worker", 1)
+        assert line.split() == ["Cpus_allowed_list:", str(cpu)]
+    finally:
+        orchestrator.close()
+
+
+@pytest.mark.performance
+def test_failed_spawn_releases_its_cpus(tmp_path, monkeypatch):
+    monkeypatch.setattr(NumaTopology, "detect", classmethod(lambda cls, *args: TOPOLOGY))
+    orchestrator = AgentOrchestrator(project_root=tmp_path)
+
+    async def spawn(argv, **kwargs):
+        raise OSError("cannot spawn")
+
+    orchestrator.spawner.spawn = spawn
+    config = SwarmConfig(agents={"worker": {"instances": 2, "command": ["true"], "placement": "spread"}})
+    try:
+        deployment = asyncio.run(orchestrator.deploy_swarm(config))
+    finally:
+        orchestrator.close()
+
+    assert [process.status for process in deployment.agents["worker"]] == ["failed", "failed"]
+    assert _assign(orchestrator.placer, _policy("spread"), 2) == [(0,), (4,)]
@@ -0,0 +1,96 @@
+"""
+AgentSwarm Instance Registry Benchmark
+=====================================
+
+Provisioning and tearing down very large agent pools must stay linear:
+instance lookup, id allocation and scale-down are O(1) per instance.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.agent_pool import AgentPool  # noqa: E402
+from agentswarm.core.models import AgentProcess  # noqa: E402
+from agentswarm.core.registry import InstanceRegistry  # noqa: E402
+
+
+def _make_pool() -> AgentPool:
+    async def provisioner(instance_id, config):
+        return AgentProcess(
+            pid=100000 + instance_id,
+            agent_type="sim",
+            instance_id=instance_id,
+            command="sim",
+            status="running",
+        )
+
+    async def terminator(process):
+        process.status = "terminated"
+
+    return AgentPool("sim", "bench", {}, provisioner, terminator)
+
+
+async def _churn(count: int) -> float:
+    """Provision ``count`` instances one by one, look each up, then tear down."""
+
+    pool = _make_pool()
+    start = time.perf_counter()
+    for _ in range(count):
+        await pool.scale(1)
+    for instance_id in range(1, count + 1):
+        pool._get_instance(instance_id)
+    for _ in range(count):
+        await pool.scale(-1)
+    elapsed = time.perf_counter() - start
+    assert len(pool.registry) == 0
+    return elapsed
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_provision_and_teardown_10k_instances_is_linear():
+    small = min(asyncio.run(_churn(2_500)) for _ in range(3))
+    large = asyncio.run(_churn(10_000))
+
+    ratio = large / small
+    print(f"2.5k instances: {small:.3f}s, 10k instances: {large:.3f}s (x{ratio:.1f})")
+
+    # 4x the work should cost ~4x the time; a quadratic path would be ~16x.
+    assert ratio < 8.0
+
+
+@pytest.mark.performance
+def test_registry_reuses_lowest_free_ids():
+    registry = InstanceRegistry()
+    for _ in range(5):
+        instance_id = registry.ids.allocate()
+        registry.add(
+            AgentProcess(pid=instance_id, agent_type="sim", instance_id=instance_id, command="sim")
+        )
+
+    registry.remove(4)
+    registry.remove(2)
+
+    assert registry.ids.allocate() == 2
+    assert registry.ids.allocate() == 4
+    assert registry.ids.allocate() == 6
+
+
+@pytest.mark.performance
+def test_registry_status_index_repairs_lazily():
+    registry = InstanceRegistry(
+        AgentProcess(pid=i, agent_type="sim", instance_id=i, command="sim", status="running")
+        for i in range(1, 4)
+    )
+    registry.get(2).status = "exited"
+
+    assert [proc.instance_id for proc in registry.with_status("running")] == [1, 3]
+    assert [proc.instance_id for proc in registry.with_status("exited")] == [2]
+    assert registry.count_by_status() == {"running": 2, "exited": 1}
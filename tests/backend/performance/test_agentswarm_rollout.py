@@ -0,0 +1,117 @@
+"""
+AgentSwarm Rolling Restart
+==========================
+
+A rolling restart replaces every instance while keeping at most
+``max_unavailable`` down and at least ``min_available`` alive, so restarting
+a pool takes about ``instances / max_unavailable`` replacement rounds and
+never drops capacity below the floor. A replacement that never becomes
+ready stops the rollout.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.agent_pool import AgentPool, RolloutError  # noqa: E402
+from agentswarm.core.models import AgentProcess  # noqa: E402
+
+RESTART_SECONDS = 0.02
+
+
+class _Capacity:
+    """Simulated agents that track how many are alive at any moment."""
+
+    def __init__(self, instances, ready_after=0.0):
+        self.instances = instances
+        self.ready_after = ready_after
+        self.alive = 0
+        self.floor = None
+        self.launched = 0
+
+    async def provisioner(self, instance_id, config):
+        await asyncio.sleep(RESTART_SECONDS)
+        self.alive += 1
+        self.launched += 1
+        return AgentProcess(pid=os.getpid(), agent_type="sim", instance_id=instance_id, command="sim")
+
+    async def terminator(self, process):
+        process.exit_time = time.time()
+        self.alive -= 1
+        if self.launched >= self.instances:  # only count once the pool is up
+            self.floor = self.alive if self.floor is None else min(self.floor, self.alive)
+
+    async def ready(self, process):
+        return time.time() - process.start_time >= self.ready_after
+
+
+def _restart(instances, *, max_unavailable, min_available=0, ready_after=0.0, timeout=5.0):
+    capacity = _Capacity(instances, ready_after)
+    pool = AgentPool("sim", "bench", {}, capacity.provisioner, capacity.terminator)
+
+    async def scenario():
+        await pool.scale(instances)
+        originals = pool.running_instances
+        start = time.perf_counter()
+        replaced = await pool.rolling_restart(
+            max_unavailable=max_unavailable,
+            min_available=min_available,
+            readiness=capacity.ready,
+            readiness_timeout=timeout,
+        )
+        return originals, replaced, time.perf_counter() - start
+
+    originals, replaced, elapsed = asyncio.run(scenario())
+    return capacity, pool, originals, replaced, elapsed
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("max_unavailable", [1, 4])
+def test_capacity_never_drops_below_the_budget(max_unavailable):
+    capacity, pool, originals, replaced, elapsed = _restart(12, max_unavailable=max_unavailable)
+    print(f"max_unavailable={max_unavailable}: 12 restarts in {elapsed * 1e3:.0f}ms")
+
+    assert len(replaced) == 12
+    assert capacity.floor == 12 - max_unavailable
+    assert not set(map(id, originals)) & set(map(id, pool.running_instances))
+    assert sorted(process.instance_id for process in pool.running_instances) == list(range(1, 13))
+    # Restarts overlap up to the budget: about 12 / max_unavailable rounds.
+    assert elapsed < (12 / max_unavailable + 2) * RESTART_SECONDS * 2
+
+
+@pytest.mark.performance
+def test_min_available_caps_parallel_restarts():
+    capacity, _, _, replaced, _ = _restart(6, max_unavailable=4, min_available=4)
+
+    assert len(replaced) == 6
+    assert capacity.floor == 4
+
+
+@pytest.mark.performance
+def test_min_available_above_pool_size_is_refused():
+    with pytest.raises(RolloutError, match="fewer than 3"):
+        _restart(3, max_unavailable=1, min_available=3)
+
+
+@pytest.mark.performance
+def test_unready_replacement_stops_the_rollout():
+    capacity = _Capacity(6, ready_after=60)
+    pool = AgentPool("sim", "bench", {}, capacity.provisioner, capacity.terminator)
+
+    async def scenario():
+        await pool.scale(6)
+        await pool.rolling_restart(max_unavailable=2, readiness=capacity.ready, readiness_timeout=0.2)
+
+    with pytest.raises(RolloutError, match="not ready after 0.2s"):
+        asyncio.run(scenario())
+
+    # Only the first wave was touched; the other instances were left alone.
+    assert capacity.launched == 8
+    assert capacity.floor == 4
@@ -0,0 +1,88 @@
+"""
+AgentSwarm Shutdown Escalation
+==============================
+
+Shutdown signals every instance with SIGTERM at once and shares a single
+grace deadline: agents that ignore SIGTERM are escalated to SIGKILL together,
+so tearing down N stubborn agents takes about one grace period, not N.
+"""
+
+import asyncio
+import signal
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.config import SwarmConfig  # noqa: E402
+from agentswarm.core.orchestrator import AgentOrchestrator  # noqa: E402
+
+STUBBORN = "import signal, time\nsignal.signal(signal.SIGTERM, signal.SIG_IGN)\nprint('ready', flush=True)\ntime.sleep(60)\n"
+GRACE = 0.5
+INSTANCES = 4
+
+
+async def _wait_until_ready(orchestrator, processes, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    for process in processes:
+        while orchestrator.get_instance_logs(process.agent_type, process.instance_id) != ["ready"]:
+            assert time.monotonic() < deadline, "agent never installed its SIGTERM handler"
+            await asyncio.sleep(0.02)
+
+
+@pytest.mark.performance
+def test_stubborn_agents_are_killed_after_one_shared_grace(tmp_path):
+    config = SwarmConfig(
+        agents={
+            "stubborn": {"instances": INSTANCES, "command": [sys.executable, "-c", STUBBORN]},
+            "polite": {"instances": INSTANCES, "command": ["sleep", "60"]},
+        },
+        deployment={"max_concurrent": 8},
+    )
+    orchestrator = AgentOrchestrator(project_root=tmp_path)
+
+    async def scenario():
+        deployment = await orchestrator.deploy_swarm(config)
+        processes = {agent_type: list(procs) for agent_type, procs in deployment.agents.items()}
+        await _wait_until_ready(orchestrator, processes["stubborn"])
+
+        start = time.perf_counter()
+        await orchestrator.shutdown_deployment(deployment.deployment_id, grace=GRACE)
+        return processes, time.perf_counter() - start
+
+    try:
+        processes, elapsed = asyncio.run(scenario())
+    finally:
+        orchestrator.close()
+    print(f"shutdown of {2 * INSTANCES} agents took {elapsed:.2f}s with {GRACE}s grace")
+
+    assert GRACE <= elapsed < 2 * GRACE
+    assert [process.handle.wait(timeout=5) for process in processes["stubborn"]] == [-signal.SIGKILL] * INSTANCES
+    assert [process.handle.wait(timeout=5) for process in processes["polite"]] == [-signal.SIGTERM] * INSTANCES
+    assert orchestrator.deployment_summaries() == []
+
+
+@pytest.mark.performance
+def test_force_skips_the_grace_period(tmp_path):
+    config = SwarmConfig(agents={"stubborn": {"instances": 2, "command": [sys.executable, "-c", STUBBORN]}})
+    orchestrator = AgentOrchestrator(project_root=tmp_path)
+
+    async def scenario():
+        deployment = await orchestrator.deploy_swarm(config)
+        processes = list(deployment.agents["stubborn"])
+        await _wait_until_ready(orchestrator, processes)
+        start = time.perf_counter()
+        await orchestrator.shutdown_deployment(deployment.deployment_id, force=True, grace=30)
+        return processes, time.perf_counter() - start
+
+    try:
+        processes, elapsed = asyncio.run(scenario())
+    finally:
+        orchestrator.close()
+
+    assert elapsed < 2
+    assert [process.handle.wait(timeout=5) for process in processes] == [-signal.SIGKILL] * 2
@@ -0,0 +1,86 @@
+"""
+AgentSwarm Spawner
+==================
+
+Agents are exec'd from argv lists without an intermediate shell, launches
+run off the event loop, and a spawned agent outlives the event loop of the
+one-shot CLI command that started it.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.config import SwarmConfig  # noqa: E402
+from agentswarm.core.spawner import AgentSpawner, format_command  # noqa: E402
+
+
+@pytest.mark.performance
+def test_arguments_reach_the_agent_verbatim(tmp_path):
+    argv = [sys.executable, "-c", "import sys; print(sys.argv[1:])", "$HOME", "a b; rm -rf /", "*"]
+    spawner = AgentSpawner()
+
+    async def scenario():
+        return await spawner.spawn(argv, cwd=str(tmp_path), stdout=subprocess.PIPE)
+
+    handle = asyncio.run(scenario())
+    output, _ = handle.communicate(timeout=10)
+
+    assert output.decode().strip() == repr(["$HOME", "a b; rm -rf /", "*"])
+    assert format_command(argv[-3:]) == "'$HOME' 'a b; rm -rf /' '*'"
+
+
+@pytest.mark.performance
+def test_empty_command_is_rejected():
+    with pytest.raises(ValueError):
+        asyncio.run(AgentSpawner().spawn([]))
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("command", ["", "   ", [], "sh -c 'unbalanced"])
+def test_blank_commands_fail_validation(command):
+    # Rejected up front instead of once a cgroup leaf and log file exist.
+    with pytest.raises(ValueError, match="command"):
+        SwarmConfig(agents={"worker": {"command": command}}).validate()
+
+
+@pytest.mark.performance
+def test_launches_do_not_block_the_loop():
+    spawner = AgentSpawner(stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(asyncio.get_running_loop().time())
+            await asyncio.sleep(0)
+
+    async def scenario():
+        task = asyncio.create_task(ticker())
+        handles = await asyncio.gather(*(spawner.spawn(["true"]) for _ in range(20)))
+        task.cancel()
+        return handles
+
+    handles = asyncio.run(scenario())
+    for handle in handles:
+        handle.wait(timeout=10)
+
+    assert len(ticks) > 20
+
+
+@pytest.mark.performance
+def test_agent_outlives_the_spawning_loop():
+    spawner = AgentSpawner(stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    handle = asyncio.run(spawner.spawn(["sleep", "30"]))
+    try:
+        assert handle.poll() is None
+        os.kill(handle.pid, 0)
+    finally:
+        handle.kill()
+        handle.wait(timeout=10)
@@ -0,0 +1,125 @@
+"""
+AgentSwarm Warm Standby Pool
+============================
+
+Scale-ups are served from warm standbys before anything new is launched, so
+promoted instances are available without paying start-up cost. Standbys that
+exited or outlived ``idle_timeout`` are recycled on refill, and refills stop
+at the standby memory budget.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.agent_pool import AgentPool, StandbySettings  # noqa: E402
+from agentswarm.core.models import AgentProcess  # noqa: E402
+
+LAUNCH_SECONDS = 0.05
+
+
+class _Agents:
+    """Simulated agents; alive until terminated."""
+
+    def __init__(self):
+        self.launched = []
+        self.terminated = []
+
+    async def provisioner(self, instance_id, config):
+        await asyncio.sleep(LAUNCH_SECONDS)
+        process = AgentProcess(pid=os.getpid(), agent_type="sim", instance_id=instance_id, command="sim")
+        self.launched.append(process)
+        return process
+
+    async def terminator(self, process):
+        process.exit_time = time.time()
+        process.status = "terminated"
+        self.terminated.append(process)
+
+
+def _pool(agents, standby):
+    return AgentPool("sim", "bench", {"standby": standby}, agents.provisioner, agents.terminator)
+
+
+@pytest.mark.performance
+def test_scale_up_promotes_standbys_first():
+    agents = _Agents()
+    pool = _pool(agents, {"count": 3})
+
+    async def scenario():
+        await pool.fill_standby()
+        warm = list(pool.standby_instances)
+        start = time.perf_counter()
+        created, _ = await pool.scale(2)
+        promoted_in = time.perf_counter() - start
+        created += (await pool.scale(2))[0]
+        return warm, created, promoted_in
+
+    warm, created, promoted_in = asyncio.run(scenario())
+    print(f"promoting 2 standbys took {promoted_in * 1e3:.2f}ms (launch {LAUNCH_SECONDS * 1e3:.0f}ms)")
+
+    assert promoted_in < LAUNCH_SECONDS
+    assert created[:3] == warm[::-1]
+    assert all(process.status == "running" for process in created)
+    assert len(agents.launched) == 4  # three standbys plus one fresh launch
+    assert pool.standby_instances == []
+    assert sorted(process.instance_id for process in pool.running_instances) == [1, 2, 3, 4]
+
+
+@pytest.mark.performance
+def test_refill_recycles_idle_and_dead_standbys():
+    agents = _Agents()
+    pool = _pool(agents, {"count": 3, "idle_timeout": "10m"})
+
+    async def scenario():
+        await pool.fill_standby()
+        stale, dead, fresh = pool.standby_instances
+        stale.start_time -= 3600
+        dead.exit_time = time.time()
+        await pool.fill_standby()
+        return stale, dead, fresh
+
+    stale, dead, fresh = asyncio.run(scenario())
+
+    assert agents.terminated == [stale]  # dead standbys need no termination
+    assert fresh in pool.standby_instances
+    assert stale not in pool.standby_instances and dead not in pool.standby_instances
+    assert len(pool.standby_instances) == 3
+    assert all(process.status == "standby" for process in pool.standby_instances)
+    assert len({process.instance_id for process in pool.standby_instances}) == 3
+
+
+@pytest.mark.performance
+def test_refill_stops_at_memory_budget(monkeypatch):
+    agents = _Agents()
+    pool = _pool(agents, {"count": 5, "memory_budget": "250MB"})
+    monkeypatch.setattr(AgentPool, "_get_rss_bytes", staticmethod(lambda pid: 100 * 1024 * 1024))
+
+    started = asyncio.run(pool.fill_standby())
+
+    assert len(started) == 3
+    assert len(pool.standby_instances) == 3
+
+
+@pytest.mark.performance
+def test_lowering_the_count_recycles_surplus():
+    agents = _Agents()
+    pool = _pool(agents, {"count": 3})
+
+    async def scenario():
+        await pool.fill_standby()
+        pool.reconfigure({"standby": 1})
+        await pool.fill_standby()
+
+    asyncio.run(scenario())
+
+    assert StandbySettings.from_config({"standby": 1}).count == 1
+    assert len(pool.standby_instances) == 1
+    assert len(agents.terminated) == 2
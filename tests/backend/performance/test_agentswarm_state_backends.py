@@ -0,0 +1,198 @@
+"""
+AgentSwarm State Backends
+=========================
+
+The journaled JSON store and the SQLite store implement the same
+``StateBackend`` interface and must agree on every read, including which
+deployment is the latest once the newest one is removed. SQLite rewrites
+only the rows of the pool an update touches, and migrating from JSON
+carries over journal entries that were never compacted.
+"""
+
+import fcntl
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.codec import json_dumps  # noqa: E402
+from agentswarm.core.config import SwarmConfig  # noqa: E402
+from agentswarm.core.models import AgentProcess, SwarmDeployment  # noqa: E402
+from agentswarm.core.state import (  # noqa: E402
+    MIGRATED_SUFFIX,
+    SQLITE_FILE_NAME,
+    JournalRetiredError,
+    SwarmStateStore,
+    migrate_to_sqlite,
+    open_state_store,
+    thaw,
+)
+from agentswarm.core.state_sqlite import SqliteStateStore  # noqa: E402
+
+BACKENDS = ["json", "sqlite"]
+
+
+def _processes(agent_type, count, first_pid=10_000):
+    return [
+        AgentProcess(pid=first_pid + index, agent_type=agent_type, instance_id=index, command=agent_type)
+        for index in range(1, count + 1)
+    ]
+
+
+def _deployment(deployment_id, instances=3):
+    return SwarmDeployment(
+        agents={"codex": _processes("codex", instances), "claude": _processes("claude", instances)},
+        config=SwarmConfig(agents={"codex": {"instances": instances}, "claude": {"instances": instances}}),
+        deployment_id=deployment_id,
+        start_time="2024-01-01T00:00:00+00:00",
+        standby={"codex": _processes("codex", 1, first_pid=20_000)},
+    )
+
+
+def _pids(payload, agent_type, role="agents"):
+    return [entry["pid"] for entry in payload[role].get(agent_type, [])]
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_crud_round_trip(tmp_path, backend):
+    store = open_state_store(tmp_path, backend=backend)
+    for index in range(3):
+        store.record_deployment(_deployment(f"d{index}"))
+
+    payload = store.get_deployment("d1")
+    assert _pids(payload, "codex") == [10_001, 10_002, 10_003]
+    assert _pids(payload, "codex", "standby") == [20_001]
+    assert thaw(payload["config"])["agents"]["codex"] == {"instances": 3}
+    assert [entry["deployment_id"] for entry in store.list_deployments()] == ["d0", "d1", "d2"]
+
+    store.update_deployment("d1", {"note": "resized"})
+    store.update_agents("d1", "codex", _processes("codex", 1, first_pid=30_000))
+    store.remove_deployment("d0")
+    store.close()
+
+    reopened = open_state_store(tmp_path, backend=backend)
+    payload = reopened.get_deployment("d1")
+    assert payload["note"] == "resized"
+    assert _pids(payload, "codex") == [30_001]
+    assert _pids(payload, "codex", "standby") == []
+    assert _pids(payload, "claude") == [10_001, 10_002, 10_003]
+    assert reopened.get_deployment("d0") is None
+    assert [summary["deployment_id"] for summary in reopened.deployment_summaries()] == ["d1", "d2"]
+    assert reopened.deployment_summaries()[0]["agents"] == {"codex": 1, "claude": 3}
+    with pytest.raises(KeyError):
+        reopened.update_agents("d0", "codex", [])
+    reopened.close()
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_latest_deployment_after_removing_the_newest(tmp_path, backend):
+    store = open_state_store(tmp_path, backend=backend)
+    for index in range(4):
+        store.record_deployment(_deployment(f"d{index}"))
+
+    store.remove_deployment("d3")
+    assert store.latest_deployment()["deployment_id"] == "d2"
+    store.remove_deployment("d0")  # not the latest: unchanged
+    assert store.latest_deployment()["deployment_id"] == "d2"
+    store.remove_deployment("d2")
+    assert store.latest_deployment()["deployment_id"] == "d1"
+    store.close()
+
+    reopened = open_state_store(tmp_path, backend=backend)
+    assert reopened.latest_deployment()["deployment_id"] == "d1"
+    reopened.remove_deployment("d1")
+    assert reopened.latest_deployment() is None
+    reopened.close()
+
+
+@pytest.mark.performance
+def test_sqlite_update_agents_rewrites_only_that_pool(tmp_path):
+    store = SqliteStateStore(tmp_path)
+    store.record_deployment(_deployment("d0", instances=50))
+    store.record_deployment(_deployment("d1", instances=50))
+
+    def rows():
+        with sqlite3.connect(store.db_path) as conn:
+            return dict(
+                ((deployment_id, agent_type, role, position), rowid)
+                for rowid, deployment_id, agent_type, role, position in conn.execute(
+                    "SELECT rowid, deployment_id, agent_type, role, position FROM processes"
+                )
+            )
+
+    before = rows()
+    store.update_agents("d0", "codex", _processes("codex", 2, first_pid=30_000))
+    after = rows()
+
+    changed = {key for key in before.keys() | after.keys() if before.get(key) != after.get(key)}
+    assert changed and all(key[:2] == ("d0", "codex") for key in changed)
+    assert len([key for key in after if key[:2] == ("d0", "codex")]) == 2
+    assert _pids(store.get_deployment("d0"), "codex") == [30_001, 30_002]
+    assert _pids(store.get_deployment("d1"), "codex") == list(range(10_001, 10_051))
+    store.close()
+
+
+@pytest.mark.performance
+def test_migration_keeps_uncompacted_journal_entries(tmp_path):
+    source = SwarmStateStore(tmp_path, compact_bytes=1 << 30)
+    for index in range(3):
+        source.record_deployment(_deployment(f"d{index}"))
+    source.compact()
+    # Pending in the journal only:
+    source.update_agents("d1", "codex", _processes("codex", 1, first_pid=30_000))
+    source.remove_deployment("d2")
+    source.record_deployment(_deployment("d3"))
+    assert source.journal_path.stat().st_size > 0
+
+    target = migrate_to_sqlite(tmp_path)
+
+    assert isinstance(target, SqliteStateStore)
+    assert [entry["deployment_id"] for entry in target.list_deployments()] == ["d0", "d1", "d3"]
+    assert _pids(target.get_deployment("d1"), "codex") == [30_001]
+    assert target.latest_deployment()["deployment_id"] == "d3"
+    assert not source.state_path.exists() and not source.journal_path.exists()
+    assert source.journal_path.with_name(source.journal_path.name + MIGRATED_SUFFIX).exists()
+
+    # A JSON store opened before the migration cannot write behind its back.
+    with pytest.raises(JournalRetiredError):
+        source.update_agents("d1", "codex", [])
+    assert not source.journal_path.exists()
+
+    # A second migration attempt just opens the database.
+    again = migrate_to_sqlite(tmp_path)
+    assert _pids(again.get_deployment("d1"), "codex") == [30_001]
+    reopened = open_state_store(tmp_path)
+    assert isinstance(reopened, SqliteStateStore)
+    for store in (target, again, reopened):
+        store.close()
+
+
+@pytest.mark.performance
+def test_migration_waits_for_the_journal_lock(tmp_path):
+    store = SwarmStateStore(tmp_path)
+    store.record_deployment(_deployment("d0"))
+    migrated = []
+
+    with store.journal_path.open("ab") as handle:
+        # Another writer is mid-append: the migration must not read yet.
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        worker = threading.Thread(target=lambda: migrated.append(migrate_to_sqlite(tmp_path)))
+        worker.start()
+        time.sleep(0.2)
+        assert not (tmp_path / SQLITE_FILE_NAME).exists()
+        handle.write(json_dumps({"op": "remove", "deployment_id": "d0"}) + b"\n")
+        handle.flush()
+        fcntl.flock(handle, fcntl.LOCK_UN)
+    worker.join(timeout=10)
+
+    (target,) = migrated
+    assert target.get_deployment("d0") is None
+    target.close()
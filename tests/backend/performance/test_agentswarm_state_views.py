@@ -0,0 +1,105 @@
+"""
+AgentSwarm State View Benchmark
+===============================
+
+Reading a deployment back from the state store must not re-serialize it:
+getters hand out cached, read-only views and only the pool that changed is
+rebuilt after an update.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.config import SwarmConfig  # noqa: E402
+from agentswarm.core.models import AgentProcess, SwarmDeployment  # noqa: E402
+from agentswarm.core.state import SwarmStateStore, thaw  # noqa: E402
+
+PROCESSES_PER_POOL = 250
+POOLS = ("codex", "claude", "gemini", "review")
+
+
+def _processes(agent_type: str, count: int):
+    return [
+        AgentProcess(
+            pid=10_000 + instance_id,
+            agent_type=agent_type,
+            instance_id=instance_id,
+            command=f"{agent_type} --instance {instance_id}",
+            cwd="/srv/project",
+            log_path=f"/srv/project/.agentswarm/logs/{agent_type}-{instance_id}.log",
+        )
+        for instance_id in range(1, count + 1)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SwarmStateStore(tmp_path)
+    store.record_deployment(
+        SwarmDeployment(
+            agents={agent_type: _processes(agent_type, PROCESSES_PER_POOL) for agent_type in POOLS},
+            config=SwarmConfig(agents={agent_type: {"instances": 1} for agent_type in POOLS}),
+            deployment_id="swarm-bench",
+            start_time="2024-01-01T00:00:00+00:00",
+        )
+    )
+    return store
+
+
+def _per_call(func, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls
+
+
+@pytest.mark.performance
+def test_latest_deployment_view_is_cheaper_than_deep_copy(store):
+    store.latest_deployment()  # build the view once
+    payload = store._state["deployments"]["swarm-bench"]
+
+    view_cost = _per_call(store.latest_deployment, 2_000)
+    copy_cost = _per_call(lambda: json.loads(json.dumps(payload)), 50)
+    print(
+        f"1k processes: view {view_cost * 1e6:.1f}us/call,"
+        f" json round-trip {copy_cost * 1e6:.1f}us/call (x{copy_cost / view_cost:.0f})"
+    )
+
+    assert sum(len(procs) for procs in store.latest_deployment()["agents"].values()) == 1_000
+    assert view_cost * 50 < copy_cost
+
+
+@pytest.mark.performance
+def test_views_are_read_only(store):
+    view = store.latest_deployment()
+
+    with pytest.raises(TypeError):
+        view["deployment_id"] = "other"
+    with pytest.raises(TypeError):
+        view["agents"]["codex"][0]["pid"] = 1
+    with pytest.raises(AttributeError):
+        view["agents"]["codex"].append({})
+
+    copy = thaw(view)
+    copy["agents"]["codex"][0]["pid"] = 1
+    assert store.latest_deployment()["agents"]["codex"][0]["pid"] == 10_001
+    json.dumps(copy)
+
+
+@pytest.mark.performance
+def test_pool_update_shares_unchanged_pools(store):
+    before = store.latest_deployment()
+    store.update_agents("swarm-bench", "codex", _processes("codex", 3))
+    after = store.latest_deployment()
+
+    assert len(after["agents"]["codex"]) == 3
+    assert len(before["agents"]["codex"]) == PROCESSES_PER_POOL
+    assert after["agents"]["claude"] is before["agents"]["claude"]
+    assert thaw(after) == store._state["deployments"]["swarm-bench"]
@@ -0,0 +1,167 @@
+"""
+AgentSwarm Workflow Step Cache
+==============================
+
+With the step cache enabled, rerunning a workflow on unchanged inputs must
+serve every step from disk without calling the executor; a changed input
+reruns only the affected step and its dependents. The cache stays under its
+size cap by evicting the least recently used entries. Cache I/O runs in
+worker threads, off the event loop.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.workflows.cache import StepCache  # noqa: E402
+from agentswarm.workflows.models import WorkflowStatus  # noqa: E402
+from agentswarm.workflows.orchestrator import WorkflowOrchestrator  # noqa: E402
+from agentswarm.workflows.state import WorkflowStateStore  # noqa: E402
+from agentswarm.workflows.templates import CODEBASE_ANALYSIS_WORKFLOW  # noqa: E402
+
+
+class CountingExecutor:
+    """Counts executor calls; ``answers`` overrides the result of a step."""
+
+    def __init__(self, answers=None):
+        self.answers = answers or {}
+        self.calls = []
+
+    async def validate_step(self, step):
+        return True
+
+    async def execute_step(self, step, context):
+        self.calls.append(step.id)
+        await asyncio.sleep(0.01)
+        return {"step": step.id, "answer": self.answers.get(step.id, "ok")}
+
+
+def _run(tmp_path, context, cache=True, answers=None):
+    executor = CountingExecutor(answers)
+    orchestrator = WorkflowOrchestrator(
+        executor,
+        state_dir=tmp_path / "state",
+        step_cache=StepCache.for_project(tmp_path) if cache else None,
+    )
+    execution = asyncio.run(orchestrator.execute_workflow(CODEBASE_ANALYSIS_WORKFLOW, context))
+    assert execution.status == WorkflowStatus.COMPLETED
+    return execution, executor.calls
+
+
+@pytest.mark.performance
+def test_rerun_is_served_from_cache(tmp_path):
+    first, calls = _run(tmp_path, {"repo": "."})
+    assert len(calls) == 5
+    assert not any(run.cached for run in first.steps.values())
+
+    second, calls = _run(tmp_path, {"repo": "."})
+    print(f"cold {first.execution_time * 1e3:.1f}ms, cached {second.execution_time * 1e3:.1f}ms")
+
+    assert calls == []
+    assert all(run.cached for run in second.steps.values())
+    assert second.step_results == first.step_results
+
+    stored = WorkflowStateStore(tmp_path / "state").get_execution(second.id)
+    assert all(run.cached for run in stored.steps.values())
+
+
+@pytest.mark.performance
+def test_changed_inputs_rerun_only_affected_steps(tmp_path):
+    first, _ = _run(tmp_path, {"repo": "."})
+    cache = StepCache.for_project(tmp_path)
+
+    # Drop the "test" entry; its new answer must invalidate "synthesize" too.
+    test_step = next(step for step in CODEBASE_ANALYSIS_WORKFLOW.steps if step.id == "test")
+    key = cache.key(
+        CODEBASE_ANALYSIS_WORKFLOW,
+        test_step,
+        {"discover": first.step_results["discover"]},
+        {"repo": "."},
+    )
+    (cache.directory / f"{key}.bin").write_bytes(b"garbage")  # unreadable entries are misses
+
+    second, calls = _run(tmp_path, {"repo": "."}, answers={"test": "changed"})
+    assert calls == ["test", "synthesize"]
+    assert [step_id for step_id, run in second.steps.items() if run.cached] == [
+        "discover",
+        "document",
+        "optimize",
+    ]
+
+    # A different initial context is a different question for every step.
+    _, calls = _run(tmp_path, {"repo": "other"})
+    assert len(calls) == 5
+
+
+@pytest.mark.performance
+def test_cache_is_opt_in(tmp_path):
+    _run(tmp_path, {}, cache=False)
+    _, calls = _run(tmp_path, {}, cache=False)
+
+    assert len(calls) == 5
+    assert not (tmp_path / ".agentswarm").exists()
+
+
+@pytest.mark.performance
+def test_size_cap_evicts_least_recently_used(tmp_path):
+    payload = "x" * 600
+    keys = [f"{index:064x}" for index in range(4)]
+    probe = StepCache(tmp_path / "probe")
+    probe.store(keys[0], payload)
+    entry_size = probe.size()
+
+    cache = StepCache(tmp_path / "steps", max_size=3 * entry_size)
+    for age, key in enumerate(keys[:3]):
+        cache.store(key, payload)
+        os.utime(cache.directory / f"{key}.bin", ns=(age * 10**9, age * 10**9))
+
+    assert cache.lookup(keys[0])[0]  # refreshes the oldest entry
+    cache.store(keys[3], payload)
+
+    assert cache.size() <= 3 * entry_size
+    assert cache.lookup(keys[0]) == (True, payload)
+    assert not cache.lookup(keys[1])[0]
+    assert cache.lookup(keys[3]) == (True, payload)
+
+
+class _ThreadRecordingCache(StepCache):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads = []
+
+    def lookup(self, key):
+        self.threads.append(threading.get_ident())
+        return super().lookup(key)
+
+    def store(self, key, result):
+        self.threads.append(threading.get_ident())
+        super().store(key, result)
+
+
+class _ContextMutatingExecutor(CountingExecutor):
+    async def execute_step(self, step, context):
+        context["scratch"] = step.id
+        return await super().execute_step(step, context)
+
+
+@pytest.mark.performance
+def test_cache_io_stays_off_the_loop_and_context_is_copied(tmp_path):
+    cache = _ThreadRecordingCache(tmp_path / "steps")
+    orchestrator = WorkflowOrchestrator(
+        _ContextMutatingExecutor(), state_dir=tmp_path / "state", step_cache=cache
+    )
+    execution = asyncio.run(
+        orchestrator.execute_workflow(CODEBASE_ANALYSIS_WORKFLOW, {"repo": "."})
+    )
+
+    assert execution.status == WorkflowStatus.COMPLETED
+    assert len(cache.threads) == 10  # a lookup and a store per step
+    assert threading.get_ident() not in cache.threads
+    assert "scratch" not in execution.context
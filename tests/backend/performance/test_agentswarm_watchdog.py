@@ -0,0 +1,108 @@
+"""
+AgentSwarm Watchdog
+===================
+
+The watchdog enforces ``resources.timeout`` (or ``deployment.instance_timeout``)
+and ``resources.rss_growth`` on every recorded deployment, including ones the
+daemon has not hydrated yet; deployments without budgets are left
+unhydrated. The deployment-wide ``deployment.timeout`` default is not an
+instance budget, so agents without an explicit timeout are never recycled
+for running long.
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.config import SwarmConfig  # noqa: E402
+from agentswarm.core.models import AgentProcess, SwarmDeployment  # noqa: E402
+from agentswarm.core.orchestrator import AgentOrchestrator  # noqa: E402
+from agentswarm.core.state import STATE_DIRECTORY_NAME, open_state_store  # noqa: E402
+from agentswarm.core.watchdog import Watchdog, WatchdogPolicy  # noqa: E402
+
+HOUR = 3600.0
+
+
+@pytest.mark.performance
+def test_only_explicit_timeouts_are_budgets():
+    defaults = SwarmConfig(agents={"codex": {}}).deployment
+    assert defaults["timeout"]  # the deployment default is always there
+    assert WatchdogPolicy.from_config({}, defaults) is None
+
+    policy = WatchdogPolicy.from_config({}, {**defaults, "instance_timeout": "10m"})
+    assert policy.timeout == 600
+
+    policy = WatchdogPolicy.from_config(
+        {"resources": {"timeout": "1m", "on_violation": "kill"}},
+        {**defaults, "instance_timeout": "10m"},
+    )
+    assert (policy.timeout, policy.action) == (60, "kill")
+
+    with pytest.raises(ValueError, match="Unknown watchdog action"):
+        WatchdogPolicy.from_config({"resources": {"timeout": "1m", "on_violation": "pause"}}, defaults)
+
+
+def _record(store, deployment_id, agent_config, process):
+    store.record_deployment(
+        SwarmDeployment(
+            agents={"codex": [process]},
+            config=SwarmConfig(agents={"codex": agent_config}),
+            deployment_id=deployment_id,
+            start_time="2024-01-01T00:00:00+00:00",
+        )
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_unhydrated_deployments_are_enforced(tmp_path, backend):
+    agents = [subprocess.Popen(["sleep", "60"]) for _ in range(2)]
+    store = open_state_store(tmp_path / STATE_DIRECTORY_NAME, backend=backend)
+    try:
+        _record(
+            store,
+            "budgeted",
+            {"resources": {"timeout": "1m", "on_violation": "kill"}},
+            AgentProcess(pid=agents[0].pid, agent_type="codex", instance_id=1, command="sleep"),
+        )
+        _record(
+            store,
+            "unbudgeted",
+            {},
+            AgentProcess(pid=agents[1].pid, agent_type="codex", instance_id=1, command="sleep"),
+        )
+
+        orchestrator = AgentOrchestrator(
+            project_root=tmp_path,
+            state_store=open_state_store(tmp_path / STATE_DIRECTORY_NAME, backend=backend),
+        )
+        assert orchestrator.deployments == {}
+        watchdog = Watchdog(orchestrator, clock=lambda: time.time() + HOUR)
+
+        async def scenario():
+            enforced = await watchdog.tick()
+            await orchestrator.settle()
+            return enforced
+
+        enforced = asyncio.run(scenario())
+        orchestrator.close()
+
+        assert [(violation.deployment_id, violation.pid) for violation in enforced] == [
+            ("budgeted", agents[0].pid)
+        ]
+        assert "timeout 60s" in enforced[0].reason
+        assert agents[0].wait(timeout=10) == -15
+        assert agents[1].poll() is None
+        assert sorted(orchestrator.deployments) == ["budgeted"]
+        assert [summary.budgeted for summary in orchestrator.deployment_summaries()] == [True, False]
+    finally:
+        for agent in agents:
+            agent.kill()
+            agent.wait()
@@ -0,0 +1,128 @@
+"""
+AgentSwarm Process Watcher
+==========================
+
+Exits of watched agents are recorded as they happen (pidfd, or SIGCHLD where
+pidfds are unavailable), so liveness checks need no syscall per instance.
+Registrations die with their event loop: afterwards processes probe
+themselves again, and the next loop can watch them anew.
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.core.models import AgentProcess  # noqa: E402
+from agentswarm.core.watcher import ProcessWatcher  # noqa: E402
+
+
+def _spawn(*argv):
+    handle = subprocess.Popen(list(argv))
+    return AgentProcess(pid=handle.pid, agent_type="sim", instance_id=1, command=argv[0], handle=handle)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("pidfd", [True, False], ids=["pidfd", "sigchld"])
+def test_exit_is_recorded_without_polling(pidfd):
+    exited = []
+    watcher = ProcessWatcher(on_exit=exited.append)
+    watcher._pidfd_supported = pidfd and watcher._pidfd_supported
+    process = _spawn("sleep", "0.2")
+
+    async def scenario():
+        assert watcher.watch(process)
+        assert process.watched and process.is_alive()
+        start = time.perf_counter()
+        code = await asyncio.wait_for(watcher.exit_future(process), timeout=10)
+        return code, time.perf_counter() - start
+
+    try:
+        code, waited = asyncio.run(scenario())
+    finally:
+        watcher.close()
+
+    assert code == 0
+    assert waited < 1
+    assert exited == [process]
+    assert process.status == "exited" and process.exit_time is not None
+    assert not process.watched and not process.is_alive()
+
+
+@pytest.mark.performance
+def test_registrations_do_not_outlive_their_loop():
+    watcher = ProcessWatcher()
+    process = _spawn("sleep", "30")
+
+    async def watch():
+        assert watcher.watch(process)
+        assert process.watched
+
+    try:
+        asyncio.run(watch())  # the loop ends without watcher.close()
+
+        # Nothing will record the exit now; liveness must come from the process.
+        assert not process.watched
+        assert process.is_alive()
+        process.handle.kill()
+        process.handle.wait(timeout=10)
+        assert not process.is_alive()
+    finally:
+        if process.handle.poll() is None:
+            process.handle.kill()
+        watcher.close()
+
+
+@pytest.mark.performance
+def test_watcher_is_reused_across_loops():
+    watcher = ProcessWatcher()
+    first, second = _spawn("sleep", "30"), _spawn("sleep", "30")
+
+    async def watch_first():
+        assert watcher.watch(first)
+
+    async def watch_second_and_kill_both():
+        # Watching on a new loop moves the earlier registration along with it.
+        assert watcher.watch(second)
+        assert first.watched and second.watched
+        futures = [watcher.exit_future(process) for process in (first, second)]
+        for process in (first, second):
+            process.handle.kill()
+        return await asyncio.wait_for(asyncio.gather(*futures), timeout=10)
+
+    try:
+        asyncio.run(watch_first())
+        assert asyncio.run(watch_second_and_kill_both()) == [-9, -9]
+    finally:
+        for process in (first, second):
+            if process.handle.poll() is None:
+                process.handle.kill()
+        watcher.close()
+
+    assert not first.is_alive() and not second.is_alive()
+
+
+@pytest.mark.performance
+def test_close_stops_answering_from_the_watcher():
+    watcher = ProcessWatcher()
+    process = _spawn("sleep", "30")
+
+    async def scenario():
+        watcher.watch(process)
+        watcher.close()
+        assert not process.watched
+        process.handle.kill()
+        process.handle.wait(timeout=10)
+        return process.is_alive()
+
+    try:
+        assert asyncio.run(scenario()) is False
+    finally:
+        if process.handle.poll() is None:
+            process.handle.kill()
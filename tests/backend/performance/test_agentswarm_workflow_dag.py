@@ -0,0 +1,157 @@
+"""
+AgentSwarm Workflow DAG Scheduler
+=================================
+
+Pipeline and parallel workflows run as a dependency graph: every step starts
+as soon as its last dependency completes, independent branches overlap up to
+the workflow's concurrency limit, and cycles are rejected before anything
+runs.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.workflows.models import (  # noqa: E402
+    WorkflowDefinition,
+    WorkflowStatus,
+    WorkflowStep,
+    WorkflowStepStatus,
+    WorkflowType,
+)
+from agentswarm.workflows.orchestrator import WorkflowOrchestrator  # noqa: E402
+from agentswarm.workflows.templates import CODEBASE_ANALYSIS_WORKFLOW  # noqa: E402
+
+STEP_SECONDS = 0.05
+
+
+class RecordingExecutor:
+    """Sleeps for each step and records when it ran."""
+
+    def __init__(self, durations=None, failing=()):
+        self.durations = durations or {}
+        self.failing = set(failing)
+        self.spans = {}
+        self.running = 0
+        self.peak = 0
+
+    async def validate_step(self, step):
+        return True
+
+    async def execute_step(self, step, context):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.durations.get(step.id, STEP_SECONDS))
+            if step.id in self.failing:
+                raise RuntimeError(f"{step.id} failed")
+            return step.id
+        finally:
+            self.running -= 1
+            self.spans[step.id] = (start, loop.time())
+
+
+def _step(step_id, *dependencies):
+    return WorkflowStep(
+        id=step_id,
+        name=step_id,
+        description=step_id,
+        agent_type="claude",
+        task=step_id,
+        dependencies=list(dependencies),
+    )
+
+
+def _workflow(*steps, **metadata):
+    return WorkflowDefinition(
+        id="dag",
+        name="dag",
+        description="dag",
+        type=WorkflowType.PIPELINE,
+        steps=list(steps),
+        metadata=metadata,
+    )
+
+
+def _run(definition, executor, tmp_path, **kwargs):
+    orchestrator = WorkflowOrchestrator(executor, state_dir=tmp_path / "state", **kwargs)
+    return asyncio.run(orchestrator.execute_workflow(definition))
+
+
+@pytest.mark.performance
+def test_independent_branches_overlap(tmp_path):
+    executor = RecordingExecutor()
+
+    execution = _run(CODEBASE_ANALYSIS_WORKFLOW, executor, tmp_path)
+    print(f"codebase-analysis: {execution.execution_time * 1e3:.0f}ms for 5 steps")
+
+    assert execution.status == WorkflowStatus.COMPLETED
+    assert executor.peak == 3
+    branches = [executor.spans[step] for step in ("document", "optimize", "test")]
+    assert max(start for start, _ in branches) < min(end for _, end in branches)
+    assert executor.spans["synthesize"][0] >= max(end for _, end in branches)
+    # discover, one wave of three branches, synthesize
+    assert execution.execution_time < 4 * STEP_SECONDS
+
+
+@pytest.mark.performance
+def test_dependent_starts_when_its_last_dependency_finishes(tmp_path):
+    # "slow" keeps running while "after_fast" should already be under way.
+    definition = _workflow(_step("fast"), _step("slow"), _step("after_fast", "fast"))
+    executor = RecordingExecutor(durations={"fast": 0.01, "slow": 0.2})
+
+    _run(definition, executor, tmp_path)
+
+    fast_end = executor.spans["fast"][1]
+    assert executor.spans["after_fast"][0] - fast_end < 0.05
+    assert executor.spans["after_fast"][0] < executor.spans["slow"][1]
+
+
+@pytest.mark.performance
+def test_concurrency_is_capped_per_workflow(tmp_path):
+    steps = [_step(f"leaf-{index}") for index in range(6)]
+    executor = RecordingExecutor()
+
+    _run(_workflow(*steps, max_concurrency=2), executor, tmp_path)
+    assert executor.peak == 2
+
+    executor = RecordingExecutor()
+    _run(_workflow(*steps), executor, tmp_path, max_concurrency=3)
+    assert executor.peak == 3
+
+
+@pytest.mark.performance
+def test_cycle_is_rejected_before_any_step_runs(tmp_path):
+    definition = _workflow(_step("a"), _step("b", "a", "d"), _step("c", "b"), _step("d", "c"))
+    executor = RecordingExecutor()
+
+    execution = _run(definition, executor, tmp_path)
+
+    assert execution.status == WorkflowStatus.FAILED
+    assert "cycle" in execution.error and "b, c, d" in execution.error
+    assert executor.spans == {}
+
+
+@pytest.mark.performance
+def test_failure_lets_running_steps_finish_and_skips_the_rest(tmp_path):
+    definition = _workflow(_step("bad"), _step("slow"), _step("after_bad", "bad"), _step("after_slow", "slow"))
+    executor = RecordingExecutor(durations={"bad": 0.01, "slow": 0.05}, failing={"bad"})
+
+    execution = _run(definition, executor, tmp_path)
+
+    statuses = {step_id: run.status for step_id, run in execution.steps.items()}
+    assert execution.status == WorkflowStatus.FAILED
+    assert execution.error == "bad failed"
+    assert statuses == {
+        "bad": WorkflowStepStatus.FAILED,
+        "slow": WorkflowStepStatus.COMPLETED,
+        "after_bad": WorkflowStepStatus.SKIPPED,
+        "after_slow": WorkflowStepStatus.SKIPPED,
+    }
@@ -0,0 +1,105 @@
+"""
+AgentSwarm Concurrent Workflow Executions
+=========================================
+
+Registry definitions are shared by every run, so step status, results and
+timing must live on each execution. Many executions of one template can then
+run at the same time without seeing each other's state. Definitions are
+read-only all the way down and hashable.
+"""
+
+import asyncio
+import dataclasses
+import sys
+from pathlib import Path
+
+import pytest
+
+AGENTSWARM_SRC = Path(__file__).resolve().parents[3] / "agentswarm" / "src"
+sys.path.insert(0, str(AGENTSWARM_SRC))
+
+from agentswarm.workflows.models import WorkflowStatus, WorkflowStep, WorkflowStepStatus  # noqa: E402
+from agentswarm.workflows.orchestrator import WorkflowOrchestrator  # noqa: E402
+from agentswarm.workflows.state import WorkflowStateStore  # noqa: E402
+from agentswarm.workflows.templates import SECURITY_AUDIT_WORKFLOW  # noqa: E402
+
+EXECUTIONS = 200
+
+
+class EchoExecutor:
+    """Returns the run's tag for every step; runs tagged 'bad' fail their last step."""
+
+    async def validate_step(self, step):
+        return True
+
+    async def execute_step(self, step, context):
+        await asyncio.sleep(0.001)
+        if context["tag"].startswith("bad") and step.id == SECURITY_AUDIT_WORKFLOW.steps[-1].id:
+            raise RuntimeError(f"{context['tag']} failed")
+        return f"{context['tag']}:{step.id}"
+
+
+@pytest.mark.performance
+def test_concurrent_executions_of_one_definition_are_isolated(tmp_path):
+    orchestrator = WorkflowOrchestrator(EchoExecutor(), state_dir=tmp_path / "state")
+    tags = [f"bad-{index}" if index % 10 == 0 else f"run-{index}" for index in range(EXECUTIONS)]
+
+    async def scenario():
+        return await asyncio.gather(
+            *(orchestrator.execute_workflow(SECURITY_AUDIT_WORKFLOW, {"tag": tag}) for tag in tags)
+        )
+
+    executions = asyncio.run(scenario())
+    last_step = SECURITY_AUDIT_WORKFLOW.steps[-1].id
+
+    for tag, execution in zip(tags, executions):
+        assert list(execution.steps) == [step.id for step in SECURITY_AUDIT_WORKFLOW.steps]
+        for step_id, run in execution.steps.items():
+            if tag.startswith("bad") and step_id == last_step:
+                assert run.status == WorkflowStepStatus.FAILED
+                assert run.error == f"{tag} failed"
+            else:
+                assert run.status == WorkflowStepStatus.COMPLETED
+                assert run.result == f"{tag}:{step_id}"
+        expected = WorkflowStatus.FAILED if tag.startswith("bad") else WorkflowStatus.COMPLETED
+        assert execution.status == expected
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        SECURITY_AUDIT_WORKFLOW.steps[0].retry_count = 5
+
+
+@pytest.mark.performance
+def test_step_runs_survive_a_reload(tmp_path):
+    orchestrator = WorkflowOrchestrator(EchoExecutor(), state_dir=tmp_path / "state")
+    execution = asyncio.run(orchestrator.execute_workflow(SECURITY_AUDIT_WORKFLOW, {"tag": "bad"}))
+
+    stored = WorkflowStateStore(tmp_path / "state").get_execution(execution.id)
+
+    assert stored.steps == execution.steps
+    assert stored.steps[SECURITY_AUDIT_WORKFLOW.steps[0].id].attempts == 1
+
+
+@pytest.mark.performance
+def test_definitions_are_frozen_all_the_way_down():
+    parameters = {"checks": ["deps"]}
+    dependencies = ["scan"]
+    step = WorkflowStep(
+        id="audit",
+        name="Audit",
+        description="",
+        agent_type="codex",
+        task="audit",
+        parameters=parameters,
+        dependencies=dependencies,
+    )
+    parameters["checks"].append("secrets")
+    dependencies.append("lint")
+
+    assert step.parameters == {"checks": ("deps",)} and step.dependencies == ("scan",)
+    with pytest.raises(TypeError):
+        step.parameters["checks"] = ()
+    assert isinstance(SECURITY_AUDIT_WORKFLOW.steps, tuple)
+    with pytest.raises(TypeError):
+        SECURITY_AUDIT_WORKFLOW.metadata["max_concurrency"] = 1
+    assert hash(step) == hash(dataclasses.replace(step, parameters={"checks": ["deps"]}))
+    assert {SECURITY_AUDIT_WORKFLOW: True}[SECURITY_AUDIT_WORKFLOW]